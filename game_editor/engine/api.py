@@ -1,72 +1,378 @@
 """
 Schüler-API - Vereinfachte Funktionen für Schüler-Code
 """
+import heapq
+import itertools
+from time import perf_counter_ns
 import pygame
-from typing import Optional, List, Tuple, Dict, Any
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict, Any, Callable
 from .gameobject import GameObject
+from .input_state import InputState, KEY_ALIASES, resolve_key, resolve_mouse_button
+from .collision import CollisionSystem, SpatialHash, SweepAndPrune, StaticGeometry, ContactGraph
 
 
 # Globale Variablen, die von der Runtime gesetzt werden
 _game_objects: List[GameObject] = []
-_key_states: Dict[str, bool] = {}  # Für key_down (einmalig beim Drücken)
-_key_pressed_last_frame: Dict[str, bool] = {}
+# ID -> GameObject (erstes Objekt mit dieser ID), für O(1)-Zugriff in get_object/collides_with
+# WICHTIG: Wird nie neu zugewiesen, nur geleert - GameObjects halten eine Referenz darauf
+_objects_by_id: Dict[str, GameObject] = {}
+_duplicate_ids: set = set()  # IDs, die mehrere Objekte haben (nur dann wird beim Entfernen gesucht)
+# Tastatur/Maus des aktuellen Simulationsschritts (aus den Events der Runtime, siehe input_state.py)
+# WICHTIG: Wird nie neu zugewiesen - der Benchmark speist gescriptete Tasten direkt ein
+_input_state = InputState()
 _debug_output: List[str] = []
-_spawn_templates: List[Dict[str, Any]] = []  # Für spawn_object
+# spawn_object(): Neue Objekte werden am Ende des Simulationsschritts in die Liste aufgenommen
+_pending_spawns: List[GameObject] = []
+_pending_spawn_ids: set = set()
+# Zerstörte gespawnte Objekte nach Vorlage (werden von spawn_object() wiederverwendet)
+_object_pools: Dict[Tuple, List[GameObject]] = {}
+# Projektordner, Kontext und Speicher für neue Objekte (von der Runtime gesetzt)
+_spawn_project_dir = None
+_spawn_context = None
+_spawn_store = None
+_spawn_counter = itertools.count(1)  # Für eindeutige IDs gespawnter Objekte
+MAX_POOL_SIZE = 1024  # Höchstens so viele zerstörte Objekte pro Vorlage aufheben
 _locked_y_positions: Dict[str, float] = {}  # Für lock_y_position - speichert fixierte Y-Positionen
+# Vorauswahl für Kollisionen (dynamische Objekte): SpatialHash oder SweepAndPrune (siehe BROAD_PHASES)
+_spatial_hash: Optional[SpatialHash] = None
+_broad_phase: str = "hash"
+_static_geometry: Optional[StaticGeometry] = None  # Gebackene Kollisionsebene für Boden-Tiles
+_contact_graph = ContactGraph()  # Wer steht auf wem (für Mitbewegung auf Plattformen)
+# Werden aufgerufen, wenn ein Objekt die statische Ebene verlässt (z.B. Chunk-Cache des Renderers)
+_static_removal_callbacks: List[Callable[[GameObject], None]] = []
+_index_counter = itertools.count()  # Vergibt Registrierungs-Reihenfolge (= Listen-Reihenfolge)
+_QUERY_MARGIN = 1.0  # Rand in Pixeln für Gitter-Abfragen
+# Größter Abstand zwischen Kollisionsbox und gezeichnetem Bereich eines Objekts
+# (Gitter kennt nur Kollisionsboxen - Sichtbarkeits-Abfragen werden um diesen Wert erweitert)
+_render_margin: float = 0.0
+# Profiler der Runtime/Benchmark (None = keine Zeitmessung), misst die Zeit in Kollisionsfunktionen
+_profiler = None
+_delta_time: float = 1.0 / 60  # Dauer eines Simulationsschritts in Sekunden (von der Runtime gesetzt)
 
-# Key-Mapping: String -> Pygame Key Code (einmalig erstellt, für bessere Performance)
-_KEY_MAP = {
-    # Englische Tasten-Namen
-    "LEFT": pygame.K_LEFT,
-    "RIGHT": pygame.K_RIGHT,
-    "UP": pygame.K_UP,
-    "DOWN": pygame.K_DOWN,
-    "SPACE": pygame.K_SPACE,
-    "ENTER": pygame.K_RETURN,
-    "W": pygame.K_w,
-    "A": pygame.K_a,
-    "S": pygame.K_s,
-    "D": pygame.K_d,
-    "F1": pygame.K_F1,
-    # Deutsche Tasten-Namen (Aliase)
-    "LINKS": pygame.K_LEFT,
-    "RECHTS": pygame.K_RIGHT,
-    "HOCH": pygame.K_UP,
-    "RUNTER": pygame.K_DOWN,
-    "LEERTASTE": pygame.K_SPACE,
-    "EINGABE": pygame.K_RETURN,
+# Verfahren für die Kollisions-Vorauswahl (project.json: "broad_phase")
+BROAD_PHASES = {
+    "hash": SpatialHash,  # Uniformes Gitter - gut für viele Objekte übereinander (Tiles)
+    "sap": SweepAndPrune,  # Sortierte Kanten auf der X-Achse - gut für viele bewegte Objekte
 }
 
+# Key-Mapping: String -> Pygame Key Code (Aliase, alle anderen Namen löst pygame auf)
+_KEY_MAP = KEY_ALIASES
 
-def _init_api(objects: List[GameObject]):
-    """Initialisiert die API (wird von runtime.py aufgerufen)"""
-    global _game_objects, _key_pressed_last_frame
+
+def _init_api(objects: List[GameObject], cell_size: Optional[float] = None,
+              broad_phase: Optional[str] = None):
+    """
+    Initialisiert die API (wird von runtime.py aufgerufen)
+    
+    Args:
+        objects: Liste aller GameObjects
+        cell_size: Zellgröße des räumlichen Gitters (Sprite-Größe), None = beibehalten
+        broad_phase: Kollisions-Vorauswahl ("hash" oder "sap", siehe BROAD_PHASES), None = beibehalten
+    
+    Die Indizes (räumliches Gitter, ID-Index) werden nur neu aufgebaut, wenn eine andere
+    Liste übergeben wird oder sich die Zellgröße ändert - der Aufruf in jedem Frame ist
+    daher günstig.
+    """
+    global _game_objects
+    if (objects is not _game_objects or _spatial_hash is None or
+            (cell_size is not None and cell_size != _spatial_hash.cell_size) or
+            (broad_phase is not None and broad_phase != _broad_phase)):
+        _rebuild_indices(objects, cell_size, broad_phase)
     _game_objects = objects
-    _key_pressed_last_frame = {}
 
 
-def _update_key_states():
-    """Aktualisiert Tastatur-Status (wird von runtime.py aufgerufen)"""
-    global _key_states, _key_pressed_last_frame
-    # WICHTIG: Hole Tastatur-Status sofort und direkt (keine Verzögerung)
-    keys = pygame.key.get_pressed()
+def _rebuild_indices(objects: List[GameObject], cell_size: Optional[float] = None,
+                     broad_phase: Optional[str] = None):
+    """
+    Baut räumliches Gitter, statische Kollisionsebene und ID-Index neu auf
     
-    # Aktueller Frame - alle Tasten gleichzeitig und unabhängig prüfen
-    current_states = {}
-    for key_name, key_code in _KEY_MAP.items():
-        # Direkter Zugriff auf Tastatur-Status (sofort, keine Verzögerung)
-        current_states[key_name] = bool(keys[key_code])
+    Statische Objekte (vom Loader markiert) werden gesammelt und einmalig gebacken,
+    alle anderen kommen in die dynamische Vorauswahl (Gitter oder Sweep and Prune).
+    """
+    global _spatial_hash, _static_geometry, _render_margin, _broad_phase
+    if cell_size is None:
+        cell_size = _spatial_hash.cell_size if _spatial_hash is not None else 64
+    if broad_phase is not None:
+        if broad_phase not in BROAD_PHASES:
+            print(f"WARNUNG: Unbekannte Kollisions-Vorauswahl '{broad_phase}' - verwende 'hash'")
+            broad_phase = "hash"
+        _broad_phase = broad_phase
+    # WICHTIG: Statische Markierung vor dem Leeren merken (clear() setzt sie zurück)
+    static_objects = [obj for obj in objects if obj._is_static]
+    static_set = set(static_objects)
+    if _spatial_hash is not None:
+        _spatial_hash.clear()
+    if _static_geometry is not None:
+        _static_geometry.clear()
+    _spatial_hash = BROAD_PHASES[_broad_phase](cell_size)
+    _static_geometry = StaticGeometry(cell_size, dynamic_index=_spatial_hash)
+    _static_geometry.on_remove = _notify_static_removed
+    _objects_by_id.clear()
+    _duplicate_ids.clear()
+    _contact_graph.clear()
+    _render_margin = 0.0
+    for obj in objects:
+        _add_to_id_index(obj)
+    _spatial_hash.build([obj for obj in objects if obj not in static_set])
+    _static_geometry.build(static_objects)
+    _seed_support_contacts(objects)
+
+
+def _static_objects() -> List[GameObject]:
+    """Gibt alle Objekte der statischen Ebene zurück (in Listen-Reihenfolge)"""
+    if _static_geometry is None:
+        return []
+    return _static_geometry.objects()
+
+
+def _add_static_removal_callback(callback: Callable[[GameObject], None]):
+    """Registriert eine Funktion, die aufgerufen wird, wenn ein Objekt nicht mehr statisch ist"""
+    if callback not in _static_removal_callbacks:
+        _static_removal_callbacks.append(callback)
+
+
+def _remove_static_removal_callback(callback: Callable[[GameObject], None]):
+    """Entfernt eine mit _add_static_removal_callback() registrierte Funktion"""
+    if callback in _static_removal_callbacks:
+        _static_removal_callbacks.remove(callback)
+
+
+def _notify_static_removed(obj: GameObject):
+    for callback in _static_removal_callbacks:
+        callback(obj)
+
+
+def _seed_support_contacts(objects: List[GameObject]):
+    """
+    Ermittelt beim Laden, welche Objekte bereits auf anderen stehen
     
-    # key_down: True nur beim ersten Drücken (alle Tasten unabhängig voneinander)
-    # WICHTIG: Jede Taste wird unabhängig geprüft - keine Blockierung zwischen Tasten
-    _key_states = {}
-    for key_name in _KEY_MAP.keys():
-        was_pressed = _key_pressed_last_frame.get(key_name, False)
-        is_pressed = current_states.get(key_name, False)
-        # Taste wurde gerade gedrückt (war vorher nicht gedrückt, jetzt gedrückt)
-        _key_states[key_name] = is_pressed and not was_pressed
+    Danach werden Kontakte nur noch von move_with_collision() eingetragen. So werden
+    auch Objekte ohne eigenen Code (z.B. Kisten auf Plattformen) mitbewegt.
+    """
+    for obj in objects:
+        if obj._is_static or not obj._collider_enabled:
+            continue
+        sweep = _sweep_and_prune_of(obj)
+        if sweep is not None:
+            # Stehen erfordert Überlappung auf der X-Achse - die Paare sind schon bekannt
+            candidates = sorted(sweep.partners(obj), key=_index_order_key)
+        else:
+            bottom = obj._collider_y + obj._collider_height
+            candidates = _query_region(obj._collider_x, bottom - 3.0,
+                                       obj._collider_x + obj._collider_width, bottom + 3.0,
+                                       include_static=False)
+        for other in candidates:
+            if other is not obj and other._collider_enabled and \
+               ContactGraph.is_standing_on(obj, other):
+                _contact_graph.add_contact(obj, other)
+                break
+
+
+def _register_object(obj: GameObject):
+    """Nimmt ein Objekt in die Indizes auf (Reihenfolge = Position am Listenende)"""
+    _add_to_id_index(obj)
+    if obj._is_static:
+        _static_geometry.add(obj)
+    else:
+        _spatial_hash.insert(obj)
+
+
+def _add_to_id_index(obj: GameObject):
+    """Vergibt die Registrierungs-Reihenfolge und trägt das Objekt in den ID-Index ein"""
+    global _render_margin
+    obj._index_order = next(_index_counter)
+    visual_width, visual_height = obj._visual_size()
+    _render_margin = max(_render_margin,
+                         visual_width + abs(obj._collider_offset_x),
+                         visual_height + abs(obj._collider_offset_y))
+    # Bei doppelten IDs gewinnt das erste Objekt (wie bei der linearen Suche)
+    if _objects_by_id.setdefault(obj.id, obj) is not obj:
+        _duplicate_ids.add(obj.id)
+    obj._objects_by_id = _objects_by_id
+
+
+def _unregister_objects(objects: List[GameObject]):
+    """
+    Entfernt Objekte aus den Indizes (wird von runtime.py nach destroy() aufgerufen,
+    wenn die Objekt-Liste neu aufgebaut wurde)
+    """
+    if _spatial_hash is None:
+        return
+    for obj in objects:
+        if obj._spatial_index is not None:
+            obj._spatial_index.remove(obj)
+        _contact_graph.remove(obj)
+        if _objects_by_id.get(obj.id) is obj:
+            del _objects_by_id[obj.id]
+            # Falls ein weiteres Objekt dieselbe ID hat, rückt es nach
+            # (Suche nur bei bekannten doppelten IDs - viele Zerstörungen pro Frame bleiben günstig)
+            if obj.id in _duplicate_ids:
+                for other in _game_objects:
+                    if other.id == obj.id and other is not obj:
+                        _objects_by_id[obj.id] = other
+                        break
+
+
+def _query_region(left: float, top: float, right: float, bottom: float,
+                  include_static: bool = True) -> List[GameObject]:
+    """
+    Gibt alle Objekte zurück, die den Bereich berühren könnten (in Listen-Reihenfolge)
+    
+    Args:
+        left, top, right, bottom: Abfrage-Rechteck in Welt-Koordinaten
+        include_static: False = nur dynamische Objekte (statische Ebene überspringen)
+    
+    Fällt auf die komplette Objekt-Liste zurück, falls kein Gitter existiert.
+    """
+    if _spatial_hash is None:
+        return list(_game_objects)
+    # Kleiner Rand, damit Rundungsfehler an Zellgrenzen keine Kandidaten verlieren
+    left -= _QUERY_MARGIN
+    top -= _QUERY_MARGIN
+    right += _QUERY_MARGIN
+    bottom += _QUERY_MARGIN
+    dynamic = _spatial_hash.query(left, top, right, bottom)
+    if not include_static or _static_geometry is None or not len(_static_geometry):
+        return dynamic
+    return _merge_in_order(dynamic, _static_geometry.query(left, top, right, bottom))
+
+
+def _merge_in_order(dynamic: List[GameObject], static: List[GameObject]) -> List[GameObject]:
+    if not static:
+        return dynamic
+    if not dynamic:
+        return static
+    # Beide Listen sind bereits sortiert - zusammenführen statt neu sortieren
+    return list(heapq.merge(dynamic, static, key=_index_order_key))
+
+
+def _index_order_key(obj: GameObject) -> int:
+    return obj._index_order
+
+
+def _sweep_and_prune_of(obj: GameObject) -> Optional[SweepAndPrune]:
+    """Gibt den Sweep-and-Prune-Index zurück, falls obj darin eingetragen ist (sonst None)"""
+    if _broad_phase == "sap" and obj._spatial_index is _spatial_hash and _spatial_hash is not None:
+        return _spatial_hash
+    return None
+
+
+def _partner_candidates(partners, left: float, top: float, right: float,
+                        bottom: float) -> List[GameObject]:
+    """
+    Kandidaten für Sweep and Prune: X-Überlappungen (dynamisch) im Y-Bereich plus
+    statische Ebene im Bereich - in Listen-Reihenfolge wie bei _query_region()
+    """
+    left -= _QUERY_MARGIN
+    top -= _QUERY_MARGIN
+    right += _QUERY_MARGIN
+    bottom += _QUERY_MARGIN
+    dynamic = []
+    for other in partners:
+        other_top = other._collider_y
+        if other_top <= bottom and other_top + other._collider_height >= top:
+            dynamic.append(other)
+    dynamic.sort(key=_index_order_key)
+    if _static_geometry is None or not len(_static_geometry):
+        return dynamic
+    return _merge_in_order(dynamic, _static_geometry.query(left, top, right, bottom))
+
+
+def _query_visible(left: float, top: float, right: float, bottom: float,
+                   include_static: bool = True,
+                   previous_positions: Optional[Dict[GameObject, Tuple[float, float]]] = None,
+                   static_from_order: Optional[int] = None) -> List[GameObject]:
+    """
+    Gibt alle sichtbaren Objekte zurück, deren gezeichneter Bereich das Rechteck
+    berührt (z.B. den Kamera-Ausschnitt) - in Listen-Reihenfolge (= Zeichenreihenfolge)
+    
+    Nutzt das räumliche Gitter, der Aufwand hängt also von der Anzahl der Objekte
+    im Ausschnitt ab, nicht von der Größe des Levels.
+    
+    Args:
+        left, top, right, bottom: Rechteck in Welt-Koordinaten
+        include_static: False = statische Objekte weglassen (werden als Chunks gezeichnet)
+        previous_positions: Positionen vor dem letzten Simulationsschritt (_snapshot_positions()).
+                            Wird interpoliert gezeichnet, zählt der ganze Weg von der alten
+                            zur neuen Position - sonst verschwindet ein Objekt am Rand zu früh
+                            bzw. taucht zu spät auf.
+        static_from_order: Bei include_static=False trotzdem die statischen Objekte ab dieser
+                           Registrierungs-Reihenfolge liefern (liegen über dynamischen Objekten
+                           und sind daher nicht in den Chunks, siehe StaticLayerCache)
+    """
+    # Nur die späten statischen Objekte mitnehmen, die übrigen liegen in den Chunks
+    skip_static_before = None
+    if not include_static and static_from_order is not None:
+        include_static = True
+        skip_static_before = static_from_order
+    margin = _render_margin
+    if previous_positions:
+        # Gitter enthält nur die neuen Positionen: Suchbereich um den weitesten Schritt vergrößern
+        margin += max(max(abs(obj.x - x), abs(obj.y - y)) for obj, (x, y) in previous_positions.items())
+    if _spatial_hash is None:
+        candidates = [obj for obj in _game_objects if include_static or not obj._is_static]
+    else:
+        candidates = _query_region(left - margin, top - margin, right + margin, bottom + margin,
+                                   include_static=include_static)
+    visible = []
+    for obj in candidates:
+        if not obj.visible:
+            continue
+        if skip_static_before is not None and obj._is_static and obj._index_order < skip_static_before:
+            continue
+        width, height = obj._visual_size()
+        x_min = x_max = obj.x
+        y_min = y_max = obj.y
+        if previous_positions:
+            previous = previous_positions.get(obj)
+            if previous is not None:
+                # Rechteck über alte und neue Position (enthält jede interpolierte Position)
+                x_min, x_max = min(x_min, previous[0]), max(x_max, previous[0])
+                y_min, y_max = min(y_min, previous[1]), max(y_max, previous[1])
+        if x_min < right and x_max + width > left and y_min < bottom and y_max + height > top:
+            visible.append(obj)
+    return visible
+
+
+def _collider_overlaps_at(obj: GameObject, x: float, y: float, other: GameObject) -> bool:
+    """Prüft ob die Kollisionsbox von obj an Position (x, y) die von other überlappt"""
+    left = x + obj._collider_offset_x
+    top = y + obj._collider_offset_y
+    return (left < other._collider_x + other._collider_width and
+            left + obj._collider_width > other._collider_x and
+            top < other._collider_y + other._collider_height and
+            top + obj._collider_height > other._collider_y)
+
+
+def _update_key_states():
+    """Übernimmt die Eingabe-Events als Zustand des nächsten Simulationsschritts (wird von runtime.py aufgerufen)"""
+    _input_state.begin_step()
+
+
+def _handle_input_event(event: pygame.event.Event):
+    """Nimmt ein Tastatur-/Maus-Event aus der Event-Schleife der Runtime auf"""
+    _input_state.handle_event(event)
+
+
+def _reset_input():
+    """Vergisst alle gedrückten Tasten (wird beim Spielstart aufgerufen)"""
+    try:
+        mouse_pos = pygame.mouse.get_pos()
+    except pygame.error:
+        mouse_pos = (0, 0)
+    _input_state.reset(mouse_pos)
+
+
+def _set_profiler(profiler):
+    """
+    Setzt den Profiler, der die Zeit in move_with_collision()/push_objects() misst
     
-    _key_pressed_last_frame = current_states
+    Args:
+        profiler: PhaseProfiler oder None (keine Zeitmessung)
+    """
+    global _profiler
+    _profiler = profiler
 
 
 def get_object(obj_id: str) -> Optional[GameObject]:
@@ -79,9 +385,9 @@ def get_object(obj_id: str) -> Optional[GameObject]:
     Returns:
         GameObject oder None wenn nicht gefunden
     """
-    for obj in _game_objects:
-        if obj.id == obj_id and obj.visible:
-            return obj
+    obj = _objects_by_id.get(obj_id)
+    if obj is not None and obj.visible:
+        return obj
     return None
 
 
@@ -95,30 +401,59 @@ def get_all_objects() -> List[GameObject]:
     return [obj for obj in _game_objects if obj.visible]
 
 
+def all_collisions(obj: GameObject) -> List[GameObject]:
+    """
+    Gibt alle sichtbaren Objekte zurück, deren Kollisionsbox die von obj überlappt
+    
+    Ersetzt eigene Schleifen über get_all_objects(): Die Kandidaten kommen aus dem
+    räumlichen Gitter, geprüft werden also nur Objekte in der Nähe.
+    
+    Args:
+        obj: Das zu prüfende Objekt
+        
+    Returns:
+        Liste der überlappenden GameObjects (in Listen-Reihenfolge, ohne obj selbst)
+    
+    Beispiel:
+        for andere in all_collisions(player):
+            if andere.id.startswith("coin"):
+                andere.destroy()
+    """
+    if not obj or not obj._collider_enabled:
+        return []
+    if _spatial_hash is None:
+        # Ohne Gitter: alle Objekte gemeinsam prüfen (mit NumPy vektorisiert)
+        system = CollisionSystem(_game_objects)
+        return [system.objects[i] for i in system.overlaps(obj) if system.objects[i].visible]
+    left = obj._collider_x
+    top = obj._collider_y
+    right = left + obj._collider_width
+    bottom = top + obj._collider_height
+    sweep = _sweep_and_prune_of(obj)
+    if sweep is not None:
+        candidates = _partner_candidates(sweep.partners(obj), left, top, right, bottom)
+    else:
+        candidates = _query_region(left, top, right, bottom)
+    return [other for other in candidates
+            if other is not obj and other.visible and CollisionSystem.check_collision(obj, other)]
+
+
 def key_pressed(key: str) -> bool:
     """
     Prüft ob eine Taste gedrückt gehalten wird
     
     Args:
         key: Tastenname ("LEFT"/"LINKS", "RIGHT"/"RECHTS", "UP"/"HOCH", "DOWN"/"RUNTER", 
-                         "SPACE"/"LEERTASTE", "W", "A", "S", "D", "ENTER"/"EINGABE")
+                         "SPACE"/"LEERTASTE", "W", "A", "S", "D", "ENTER"/"EINGABE",
+                         außerdem alle Namen, die pygame kennt, z.B. "Q", "1", "F5", "TAB")
         
     Returns:
         True wenn Taste gedrückt, sonst False
         
-    WICHTIG: Diese Funktion prüft sofort den aktuellen Tastatur-Status.
-    Alle Tasten können gleichzeitig und unabhängig voneinander erkannt werden.
+    WICHTIG: Der Tastatur-Status wird einmal pro Simulationsschritt aus den Events
+    übernommen. Alle Tasten können gleichzeitig und unabhängig voneinander erkannt werden.
     """
-    try:
-        # Hole sofort den aktuellen Tastatur-Status (keine Verzögerung)
-        keys = pygame.key.get_pressed()
-        key_code = _KEY_MAP.get(key.upper())
-        if key_code is None:
-            return False
-        # Direkte Rückgabe - keine zusätzliche Verarbeitung
-        return bool(keys[key_code])
-    except:
-        return False
+    return resolve_key(key) in _input_state.keys_held
 
 
 def key_down(key: str) -> bool:
@@ -126,40 +461,28 @@ def key_down(key: str) -> bool:
     Prüft ob eine Taste gerade gedrückt wurde (einmalig beim Drücken)
     
     Args:
-        key: Tastenname ("LEFT"/"LINKS", "RIGHT"/"RECHTS", "UP"/"HOCH", "DOWN"/"RUNTER", 
-                         "SPACE"/"LEERTASTE", "W", "A", "S", "D", "ENTER"/"EINGABE")
+        key: Tastenname (siehe key_pressed())
         
     Returns:
-        True nur beim ersten Frame nach Drücken, sonst False
+        True nur im ersten Simulationsschritt nach dem Drücken, sonst False
         
-    WICHTIG: Diese Funktion prüft sowohl den gecachten Status als auch direkt
-    den Tastatur-Status, um sicherzustellen, dass keine Tastendrücke verpasst werden.
+    WICHTIG: Auch sehr kurze Tastendrücke (zwischen zwei Schritten gedrückt und wieder
+    losgelassen) werden erkannt.
     """
-    key_upper = key.upper()
-    
-    # Zuerst prüfe den gecachten Status (schnell)
-    if _key_states.get(key_upper, False):
-        return True
+    return resolve_key(key) in _input_state.keys_down
+
+
+def key_up(key: str) -> bool:
+    """
+    Prüft ob eine Taste gerade losgelassen wurde (einmalig beim Loslassen)
     
-    # Falls nicht im Cache, prüfe direkt den Tastatur-Status
-    # Das stellt sicher, dass auch sehr schnelle Tastendrücke erkannt werden
-    try:
-        keys = pygame.key.get_pressed()
-        key_code = _KEY_MAP.get(key_upper)
-        if key_code is None:
-            return False
-        
-        # Prüfe ob Taste gerade gedrückt ist, aber im letzten Frame nicht
-        is_pressed = bool(keys[key_code])
-        was_pressed = _key_pressed_last_frame.get(key_upper, False)
+    Args:
+        key: Tastenname (siehe key_pressed())
         
-        # Wenn Taste gerade gedrückt wurde (war vorher nicht gedrückt)
-        if is_pressed and not was_pressed:
-            return True
-    except:
-        pass
-    
-    return False
+    Returns:
+        True nur im ersten Simulationsschritt nach dem Loslassen, sonst False
+    """
+    return resolve_key(key) in _input_state.keys_up
 
 
 def mouse_position() -> Tuple[int, int]:
@@ -169,10 +492,76 @@ def mouse_position() -> Tuple[int, int]:
     Returns:
         Tuple (x, y) der Mausposition
     """
-    try:
-        return pygame.mouse.get_pos()
-    except:
-        return (0, 0)
+    return _input_state.mouse_pos
+
+
+def mouse_pressed(button: str = "LEFT") -> bool:
+    """
+    Prüft ob eine Maustaste gedrückt gehalten wird
+    
+    Args:
+        button: "LEFT"/"LINKS", "MIDDLE"/"MITTE" oder "RIGHT"/"RECHTS"
+        
+    Returns:
+        True wenn Maustaste gedrückt, sonst False
+    """
+    return resolve_mouse_button(button) in _input_state.buttons_held
+
+
+def mouse_down(button: str = "LEFT") -> bool:
+    """
+    Prüft ob eine Maustaste gerade gedrückt wurde (einmalig beim Klicken)
+    
+    Args:
+        button: "LEFT"/"LINKS", "MIDDLE"/"MITTE" oder "RIGHT"/"RECHTS"
+    """
+    return resolve_mouse_button(button) in _input_state.buttons_down
+
+
+def mouse_up(button: str = "LEFT") -> bool:
+    """
+    Prüft ob eine Maustaste gerade losgelassen wurde (einmalig beim Loslassen)
+    
+    Args:
+        button: "LEFT"/"LINKS", "MIDDLE"/"MITTE" oder "RIGHT"/"RECHTS"
+    """
+    return resolve_mouse_button(button) in _input_state.buttons_up
+
+
+def delta_time() -> float:
+    """
+    Gibt die Dauer eines Simulationsschritts in Sekunden zurück
+    
+    Die Simulation läuft mit fester Rate (physics_hz in project.json, Standard: 60).
+    Damit lassen sich Geschwindigkeiten in Pixel pro Sekunde angeben.
+    
+    Returns:
+        Zeit pro update() in Sekunden (z.B. 0.0167 bei 60 Hz)
+        
+    Beispiel:
+        spieler.x += 120 * delta_time()  # 120 Pixel pro Sekunde
+    """
+    return _delta_time
+
+
+def _set_delta_time(dt: float):
+    """Setzt die Dauer eines Simulationsschritts (wird von runtime.py aufgerufen)"""
+    global _delta_time
+    _delta_time = dt
+
+
+def _snapshot_positions() -> Dict[GameObject, Tuple[float, float]]:
+    """
+    Merkt die Positionen aller beweglichen Objekte (für interpolierte Darstellung)
+    
+    Statische Objekte bewegen sich nicht und werden ausgelassen.
+    
+    Returns:
+        Dict GameObject -> (x, y)
+    """
+    if _spatial_hash is None:
+        return {obj: (obj.x, obj.y) for obj in _game_objects if not obj._is_static}
+    return {obj: (obj.x, obj.y) for obj in _spatial_hash}
 
 
 def print_debug(text: str):
@@ -188,19 +577,135 @@ def print_debug(text: str):
 
 def spawn_object(template: Dict[str, Any]) -> Optional[GameObject]:
     """
-    Erstellt ein neues Objekt aus einer Template-Vorlage (MVP: später)
+    Erstellt ein neues Objekt aus einer Template-Vorlage
     
     Args:
         template: Dict mit Objekt-Eigenschaften (id, type, x, y, width, height, sprite, etc.)
         
     Returns:
         Neues GameObject oder None bei Fehler
+    
+    Das Objekt kann sofort bewegt und verändert werden. In get_all_objects(), get_object()
+    und Kollisionen anderer Objekte taucht es erst nach dem aktuellen Simulationsschritt auf.
+    Ist die ID schon vergeben, bekommt es eine eindeutige ID (z.B. "kugel_7").
+    
+    WICHTIG: Zerstörte gespawnte Objekte werden für spätere spawn_object()-Aufrufe mit
+    gleicher Vorlage wiederverwendet (kein neues Objekt, kein erneutes Sprite-Laden).
+    Nach destroy() sollte man das alte Objekt also nicht mehr verwenden.
     """
-    # MVP: Wird später implementiert, wenn Projekt-Verwaltung fertig ist
-    # Für jetzt: Template wird gespeichert und bei nächstem Reload erstellt
-    _spawn_templates.append(template)
-    print_debug(f"spawn_object: Wird in zukünftiger Version unterstützt")
-    return None
+    if not isinstance(template, dict):
+        print_debug("spawn_object: Vorlage muss ein Dict sein (z.B. {\"x\": 100, \"y\": 50})")
+        return None
+    key = _template_key(template)
+    pool = _object_pools.get(key)
+    obj_id = _unique_spawn_id(str(template.get("id") or template.get("type") or "objekt"))
+    if pool:
+        obj = pool.pop()
+        _reset_spawned_object(obj, template, obj_id)
+    else:
+        # Kopie der Vorlage - GameObject ergänzt bei Boden-Objekten die Kollisionsbox
+        data = dict(template)
+        if isinstance(data.get("collider"), dict):
+            data["collider"] = dict(data["collider"])
+        data["id"] = obj_id
+        data["visible"] = True
+        try:
+            obj = GameObject(data, _spawn_project_dir or Path("."),
+                             context=_spawn_context, store=_spawn_store)
+        except Exception as e:
+            print_debug(f"spawn_object: Objekt konnte nicht erstellt werden: {e}")
+            return None
+        obj._pool_key = key
+    # Bis zur Aufnahme: collides_with() sucht schon in den Objekten der Szene
+    obj._all_objects = _game_objects
+    obj._objects_by_id = _objects_by_id
+    _pending_spawns.append(obj)
+    _pending_spawn_ids.add(obj_id)
+    return obj
+
+
+def _template_key(template: Dict[str, Any]) -> Tuple:
+    """Schlüssel für den Objekt-Pool: alles aus der Vorlage außer ID und Position"""
+    collider = template.get("collider")
+    collider_key = tuple(sorted(collider.items())) if isinstance(collider, dict) else None
+    return (template.get("type", "sprite"), template.get("sprite"),
+            template.get("width", 32), template.get("height", 32),
+            template.get("ground", False), template.get("camera", False), collider_key)
+
+
+def _unique_spawn_id(base_id: str) -> str:
+    """Gibt base_id zurück, falls frei - sonst base_id mit angehängter Nummer"""
+    obj_id = base_id
+    while obj_id in _objects_by_id or obj_id in _pending_spawn_ids:
+        obj_id = f"{base_id}_{next(_spawn_counter)}"
+    return obj_id
+
+
+def _reset_spawned_object(obj: GameObject, template: Dict[str, Any], obj_id: str):
+    """Setzt ein Objekt aus dem Pool auf den Zustand eines neu erstellten Objekts zurück"""
+    # Eigene Attribute aus Schüler-Code (z.B. kugel.richtung) gehören zum alten Objekt
+    obj.__dict__.clear()
+    obj.id = obj_id
+    obj.visible = True
+    obj._is_static = False
+    obj._debug_label = None
+    obj.x = float(template.get("x", 0))
+    obj.y = float(template.get("y", 0))
+
+
+def _set_spawn_context(project_dir, context=None, store=None):
+    """
+    Legt fest, woher spawn_object() Sprites und Speicher nimmt (wird von runtime.py aufgerufen)
+    
+    Args:
+        project_dir: Projektverzeichnis (Sprite-Pfade der Vorlagen sind relativ dazu)
+        context: Projekt-Kontext (Sprite-Größe und gemeinsamer Sprite-Cache)
+        store: Speicher für Position/Größe neuer Objekte (None = gemeinsamer Standard-Speicher)
+    """
+    global _spawn_project_dir, _spawn_context, _spawn_store
+    _spawn_project_dir = project_dir
+    _spawn_context = context
+    _spawn_store = store
+    _pending_spawns.clear()
+    _pending_spawn_ids.clear()
+    _object_pools.clear()
+
+
+def _flush_spawns() -> List[GameObject]:
+    """
+    Nimmt alle seit dem letzten Aufruf gespawnten Objekte in Liste und Indizes auf
+    (wird von runtime.py am Ende jedes Simulationsschritts aufgerufen)
+    
+    Returns:
+        Die aufgenommenen Objekte (noch vor der Aufnahme zerstörte kommen direkt in den Pool)
+    """
+    if not _pending_spawns:
+        return []
+    spawned = [obj for obj in _pending_spawns if obj.visible]
+    if len(spawned) != len(_pending_spawns):
+        _recycle_objects([obj for obj in _pending_spawns if not obj.visible])
+    _pending_spawns.clear()
+    _pending_spawn_ids.clear()
+    _game_objects.extend(spawned)
+    if _spatial_hash is not None:
+        for obj in spawned:
+            _register_object(obj)
+    return spawned
+
+
+def _recycle_objects(objects: List[GameObject]):
+    """
+    Legt zerstörte gespawnte Objekte in den Pool ihrer Vorlage (nach _unregister_objects())
+    
+    Objekte aus der Szene (ohne Vorlage) werden nicht wiederverwendet.
+    """
+    for obj in objects:
+        key = obj._pool_key
+        if key is None:
+            continue
+        pool = _object_pools.setdefault(key, [])
+        if len(pool) < MAX_POOL_SIZE:
+            pool.append(obj)
 
 
 def get_debug_output() -> List[str]:
@@ -229,6 +734,16 @@ def move_with_collision(obj: GameObject, dx: float, dy: float) -> Tuple[bool, bo
         - collision_x: True wenn Kollision in X-Richtung
         - collision_y: True wenn Kollision in Y-Richtung
     """
+    if _profiler is not None:
+        start = perf_counter_ns()
+        try:
+            return _move_with_collision(obj, dx, dy)
+        finally:
+            _profiler.add_nested("collision", perf_counter_ns() - start)
+    return _move_with_collision(obj, dx, dy)
+
+
+def _move_with_collision(obj: GameObject, dx: float, dy: float) -> Tuple[bool, bool, bool]:
     if not obj:
         return (False, False, False)
     
@@ -236,6 +751,10 @@ def move_with_collision(obj: GameObject, dx: float, dy: float) -> Tuple[bool, bo
     old_x = obj.x
     old_y = obj.y
     
+    # Sweep and Prune: X-Überlappungen vor der Bewegung merken (für das Zurücksetzen von x)
+    sweep = _sweep_and_prune_of(obj) if obj._collider_enabled else None
+    partners_before = set(sweep.partners(obj)) if sweep is not None else None
+    
     # Bewegung anwenden (immer, auch ohne Kollisionsbox)
     obj.x += dx
     obj.y += dy
@@ -244,10 +763,24 @@ def move_with_collision(obj: GameObject, dx: float, dy: float) -> Tuple[bool, bo
     if not obj._collider_enabled:
         return (False, False, False)
     
+    # Kandidaten: nur Objekte, die die überstrichene Kollisionsbox (vor und nach
+    # der Bewegung) berühren können
+    left = min(old_x, obj.x) + obj._collider_offset_x
+    top = min(old_y, obj.y) + obj._collider_offset_y
+    right = max(old_x, obj.x) + obj._collider_offset_x + obj._collider_width
+    bottom = max(old_y, obj.y) + obj._collider_offset_y + obj._collider_height
+    if sweep is not None and obj._spatial_index is sweep:
+        # Geprüft wird nur an der alten und neuen X-Position - deren X-Überlappungen
+        # sind aus den Paaren vor und nach der Bewegung bekannt
+        candidates = _partner_candidates(partners_before | sweep.partners(obj),
+                                         left, top, right, bottom)
+    else:
+        candidates = _query_region(left, top, right, bottom)
+    
     # Prüfe horizontale Kollisionen (X-Achse) - NUR wenn sich bewegt
     collision_x = False
     if dx != 0:
-        for other in _game_objects:
+        for other in candidates:
             if other.id != obj.id and other._collider_enabled:
                 # Kollisionen mit ALLEN Objekten mit aktivierter Kollisionsbox (Boden, Plattformen, etc.)
                 # TODO: Später könnte hier geprüft werden ob other.is_enemy für spezielle Behandlung
@@ -285,8 +818,8 @@ def move_with_collision(obj: GameObject, dx: float, dy: float) -> Tuple[bool, bo
     on_ground = False
     collision_y = False
     
-    # Prüfe Kollisionen mit allen Objekten (Boden und andere mit Kollisionsbox)
-    for other in _game_objects:
+    # Prüfe Kollisionen mit allen Kandidaten (Boden und andere mit Kollisionsbox)
+    for other in candidates:
         if other.id != obj.id and other._collider_enabled:
             # Kollisionen mit allen Objekten mit aktivierter Kollisionsbox
             if obj.collides_with(other.id):
@@ -371,6 +904,11 @@ def move_with_collision(obj: GameObject, dx: float, dy: float) -> Tuple[bool, bo
                         else:
                             # Objekt ist seitlich oder in Plattform - keine Position-Korrektur bei dy == 0
                             pass
+                
+                # Stütz-Kontakt merken (für Mitbewegung, wenn sich der Träger bewegt)
+                # Statische Objekte bewegen sich nie - dafür ist kein Kontakt nötig
+                if on_ground and not other._is_static:
+                    _contact_graph.add_contact(obj, other)
                 break
     
     return (on_ground, collision_x, collision_y)
@@ -392,13 +930,34 @@ def push_objects(obj: GameObject, dx: float, dy: float, push_strength: float = 1
     WICHTIG: Diese Funktion sollte NACH move_with_collision() aufgerufen werden,
     wenn das Objekt sich bewegt hat und andere Objekte wegdrücken soll.
     """
+    if _profiler is not None:
+        start = perf_counter_ns()
+        try:
+            return _push_objects(obj, dx, dy, push_strength)
+        finally:
+            _profiler.add_nested("collision", perf_counter_ns() - start)
+    return _push_objects(obj, dx, dy, push_strength)
+
+
+def _push_objects(obj: GameObject, dx: float, dy: float, push_strength: float = 1.0) -> int:
     if not obj or not obj._collider_enabled:
         return 0
     
     pushed_count = 0
     
-    # Prüfe alle anderen Objekte
-    for other in _game_objects:
+    # Kandidaten aus dem räumlichen Gitter: Kollisionsbox vor, während und in
+    # Bewegungsrichtung nach der Bewegung (deckt alle Prüfungen unten ab)
+    # Statische Ebene überspringen - Boden-Objekte werden ohnehin nicht weggedrückt
+    reach_x = abs(dx)
+    reach_y = abs(dy)
+    candidates = _query_region(obj._collider_x - reach_x,
+                               obj._collider_y - reach_y,
+                               obj._collider_x + obj._collider_width + reach_x,
+                               obj._collider_y + obj._collider_height + reach_y,
+                               include_static=False)
+    
+    # Prüfe alle Kandidaten
+    for other in candidates:
         if other.id == obj.id or not other._collider_enabled:
             continue
         
@@ -415,31 +974,15 @@ def push_objects(obj: GameObject, dx: float, dy: float, push_strength: float = 1
         if not collides_now and abs(dx) > 0.1:
             # Prüfe ob Objekte sich überlappen würden, wenn wir die Position
             # um -dx zurücksetzen würden (Position vor der Bewegung)
-            from .collision import CollisionSystem
-            # Temporär Position zurücksetzen für Kollisionsprüfung
-            old_x = obj.x
-            old_y = obj.y
-            obj.x = old_x - dx
-            obj.y = old_y - dy
-            collides = CollisionSystem.check_collision(obj, other)
-            obj.x = old_x  # Position wiederherstellen
-            obj.y = old_y
+            # Geprüft wird an der verschobenen Position, ohne obj.x/obj.y zu ändern
+            collides = _collider_overlaps_at(obj, obj.x - dx, obj.y - dy, other)
         
         # Zusätzlich: Prüfe ob Objekte sich in der Bewegungsrichtung befinden
         # und sich überlappen würden (für den Fall, dass die Plattform sich bereits bewegt hat)
         if not collides and abs(dx) > 0.1:
-            from .collision import CollisionSystem
-            # Prüfe ob Objekte sich in der Bewegungsrichtung befinden
-            # und sich überlappen würden, wenn die Plattform sich weiter bewegt
-            old_x = obj.x
-            old_y = obj.y
             # Prüfe Position in Bewegungsrichtung
-            obj.x = old_x + dx
-            obj.y = old_y + dy
-            if CollisionSystem.check_collision(obj, other):
+            if _collider_overlaps_at(obj, obj.x + dx, obj.y + dy, other):
                 collides = True
-            obj.x = old_x  # Position wiederherstellen
-            obj.y = old_y
         
         if collides:
             # Berechne Push-Richtung basierend auf Bewegungsrichtung
@@ -475,7 +1018,7 @@ def push_objects(obj: GameObject, dx: float, dy: float, push_strength: float = 1
                 # Das stellt sicher, dass weggedrückte Objekte auch an Hindernissen hängen bleiben
                 other_old_x = other.x
                 other_old_y = other.y
-                on_ground, collision_x, collision_y = move_with_collision(other, push_dx, push_dy)
+                on_ground, collision_x, collision_y = _move_with_collision(other, push_dx, push_dy)
                 
                 # Prüfe ob Objekt wirklich bewegt wurde (nicht durch Kollision blockiert)
                 if abs(other.x - other_old_x) > 0.01 or abs(other.y - other_old_y) > 0.01:
@@ -508,19 +1051,35 @@ def unlock_y_position(obj: GameObject):
         del _locked_y_positions[obj.id]
 
 
+def _begin_contact_frame():
+    """
+    Wird von runtime.py zu Beginn jedes Frames (vor den Updates) aufgerufen:
+    verwirft nicht mehr gültige Stütz-Kontakte und merkt sich die Trägerpositionen
+    """
+    _contact_graph.begin_frame()
+
+
+def _apply_support_contacts():
+    """
+    Wird von runtime.py nach den Updates aufgerufen: Objekte, die auf einem bewegten
+    Objekt stehen, werden mitbewegt (entlang der Stütz-Kontakte)
+    """
+    _contact_graph.propagate()
+
+
 def apply_locked_y_positions():
     """
     Wird von runtime.py nach jedem Update aufgerufen, um fixierte Y-Positionen anzuwenden.
     """
-    global _locked_y_positions
     for obj_id, locked_y in _locked_y_positions.items():
-        obj = get_object(obj_id)
-        if obj:
+        obj = _objects_by_id.get(obj_id)
+        if obj is not None and obj.visible:
             obj.y = locked_y
 
 
 # ============================================================================
 # Deutsche Funktions-Aliase (Phase 1)
+# WICHTIG: Neue Aliase auch in api_aliases.API_FUNCTION_ALIASES eintragen (Übersetzer)
 # ============================================================================
 
 def hole_objekt(obj_id: str) -> Optional[GameObject]:
@@ -550,6 +1109,21 @@ def hole_alle_objekte() -> List[GameObject]:
     return get_all_objects()
 
 
+def alle_kollisionen(obj: GameObject) -> List[GameObject]:
+    """
+    Deutsche Version von all_collisions()
+    
+    Gibt alle sichtbaren Objekte zurück, deren Kollisionsbox die von obj überlappt
+    
+    Args:
+        obj: Das zu prüfende Objekt
+        
+    Returns:
+        Liste der überlappenden GameObjects (ohne obj selbst)
+    """
+    return all_collisions(obj)
+
+
 def taste_gedrückt(taste: str) -> bool:
     """
     Deutsche Version von key_pressed()
@@ -580,6 +1154,21 @@ def taste_runter(taste: str) -> bool:
     return key_down(taste)
 
 
+def taste_losgelassen(taste: str) -> bool:
+    """
+    Deutsche Version von key_up()
+    
+    Prüft ob eine Taste gerade losgelassen wurde (einmalig beim Loslassen)
+    
+    Args:
+        taste: Tastenname ("LINKS", "RECHTS", "HOCH", "RUNTER", "LEERTASTE", "W", "A", "S", "D", "EINGABE")
+        
+    Returns:
+        True nur im ersten Schritt nach dem Loslassen, sonst False
+    """
+    return key_up(taste)
+
+
 def maus_position() -> Tuple[int, int]:
     """
     Deutsche Version von mouse_position()
@@ -592,6 +1181,57 @@ def maus_position() -> Tuple[int, int]:
     return mouse_position()
 
 
+def maus_gedrückt(taste: str = "LINKS") -> bool:
+    """
+    Deutsche Version von mouse_pressed()
+    
+    Prüft ob eine Maustaste gedrückt gehalten wird
+    
+    Args:
+        taste: "LINKS", "MITTE" oder "RECHTS"
+    """
+    return mouse_pressed(taste)
+
+
+def maus_runter(taste: str = "LINKS") -> bool:
+    """
+    Deutsche Version von mouse_down()
+    
+    Prüft ob eine Maustaste gerade gedrückt wurde (einmalig beim Klicken)
+    
+    Args:
+        taste: "LINKS", "MITTE" oder "RECHTS"
+    """
+    return mouse_down(taste)
+
+
+def maus_losgelassen(taste: str = "LINKS") -> bool:
+    """
+    Deutsche Version von mouse_up()
+    
+    Prüft ob eine Maustaste gerade losgelassen wurde (einmalig beim Loslassen)
+    
+    Args:
+        taste: "LINKS", "MITTE" oder "RECHTS"
+    """
+    return mouse_up(taste)
+
+
+def zeit_delta() -> float:
+    """
+    Deutsche Version von delta_time()
+    
+    Gibt die Dauer eines Simulationsschritts in Sekunden zurück
+    
+    Returns:
+        Zeit pro aktualisiere() in Sekunden (z.B. 0.0167 bei 60 Hz)
+        
+    Beispiel:
+        spieler.x += 120 * zeit_delta()  # 120 Pixel pro Sekunde
+    """
+    return delta_time()
+
+
 def drucke_debug(text: str):
     """
     Deutsche Version von print_debug()
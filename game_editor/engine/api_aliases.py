@@ -0,0 +1,40 @@
+"""
+Deutsche API-Aliase - welche deutsche Funktion welche englische Funktion aufruft
+
+Hier (und nur hier) werden die Aliase eingetragen. Der Übersetzer baut daraus
+beide Richtungen (Deutsch → Englisch und zurück), api.py und gameobject.py
+enthalten die deutschen Funktionen dazu. test_translator.py prüft, dass jeder
+Eintrag auf vorhandene Funktionen zeigt.
+
+WICHTIG: Dieses Modul importiert nichts aus der Engine (kein pygame) - der
+Editor lädt den Übersetzer, ohne die Engine zu laden.
+"""
+from typing import Dict
+
+
+# Deutsche Funktionen in api.py → englische Funktionen in api.py
+API_FUNCTION_ALIASES: Dict[str, str] = {
+    "hole_objekt": "get_object",
+    "hole_alle_objekte": "get_all_objects",
+    "alle_kollisionen": "all_collisions",
+    "taste_gedrückt": "key_pressed",
+    "taste_runter": "key_down",
+    "taste_losgelassen": "key_up",
+    "maus_position": "mouse_position",
+    "maus_gedrückt": "mouse_pressed",
+    "maus_runter": "mouse_down",
+    "maus_losgelassen": "mouse_up",
+    "zeit_delta": "delta_time",
+    "drucke_debug": "print_debug",
+    "erstelle_objekt": "spawn_object",
+    "bewege_mit_kollision": "move_with_collision",
+    "drücke_objekte": "push_objects",
+    "fixiere_y_position": "lock_y_position",
+    "entferne_y_fixierung": "unlock_y_position",
+}
+
+# Deutsche Methoden von GameObject (gameobject.py) → englische Methoden
+GAMEOBJECT_METHOD_ALIASES: Dict[str, str] = {
+    "kollidiert_mit": "collides_with",
+    "zerstöre": "destroy",
+}
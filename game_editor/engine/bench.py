@@ -0,0 +1,316 @@
+"""
+Benchmark - Misst den Game Loop ohne Fenster und ohne Tastatur
+
+Verwendung:
+    python -m game_editor.engine.bench <projekt_pfad> --frames 300
+    python -m game_editor.engine.bench Test_Project --sizes 100,1000 --output bench.json
+    python -m game_editor.engine.bench Test_Project --scenes tiles,movers --broad-phase hash,sap
+
+Aus der Start-Szene des Projekts werden synthetische Szenen mit der gewünschten
+Objekt-Anzahl erzeugt:
+- tiles: Kopien der Szene nebeneinander (viele Boden-Tiles, wenige bewegte Objekte)
+- movers: viele Kisten, die auf Boden-Streifen hin und her fahren
+Jede Szene läuft mit jeder gewählten Kollisions-Vorauswahl (hash, sap), mit
+SDL-Dummy-Treiber, gescripteten Tasten, ohne FPS-Begrenzung und mit genau einem
+Simulationsschritt pro Frame (lockstep). Das Ergebnis
+(Zeit pro Phasen-Gruppe: input, update, collision, ride_along, render, dazu die
+einzelnen Phasen und die langsamsten Skripte) wird als JSON ausgegeben.
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+# WICHTIG: Muss vor dem Import von pygame gesetzt sein (Banner würde sonst im JSON landen)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from .api import _input_state, _KEY_MAP, BROAD_PHASES
+from .loader import load_project, load_scene
+from .profiler import PhaseProfiler
+from . import runtime
+
+
+DEFAULT_SIZES = (100, 1000, 10000)
+BLOCK_GAP = 192  # Abstand zwischen den Kopien der Szene (Pixel)
+MOVERS_PER_ROW = 32  # Kisten pro Boden-Streifen (movers-Szene)
+MOVER_SPACING = 4  # Abstand zwischen zwei Kisten in Tile-Breiten
+
+# Skript jeder Kiste der movers-Szene (fährt hin und her, dreht an Hindernissen und Streifen-Enden)
+MOVER_CODE = """kiste = hole_objekt("{id}")
+richtung = {direction}
+
+funktion update():
+    global richtung
+    auf_boden, kollision_x, kollision_y = bewege_mit_kollision(kiste, 3 * richtung, 4)
+    wenn kollision_x oder kiste.x < {min_x} oder kiste.x > {max_x}:
+        richtung = -richtung
+"""
+
+# Gescriptete Eingaben: (Startframe, Endframe, Taste), wiederholt sich alle KEY_PERIOD Frames
+KEY_PERIOD = 240
+KEY_SCRIPT = (
+    (0, 90, "RIGHT"),
+    (60, 64, "SPACE"),
+    (120, 210, "LEFT"),
+    (180, 184, "SPACE"),
+)
+
+
+class ScriptedKeys:
+    """Erzeugt statt der Tastatur einen festen Ablauf von Tastendrücken (als Events)"""
+
+    def __init__(self, script=KEY_SCRIPT, period: int = KEY_PERIOD):
+        self.script = [(start, end, _KEY_MAP[key]) for start, end, key in script]
+        self.period = period
+        self._pressed = frozenset()
+
+    def advance(self, frame: int):
+        """Drückt/lässt die Tasten für diesen Frame los (wird von der Runtime aufgerufen)"""
+        t = frame % self.period
+        pressed = frozenset(code for start, end, code in self.script if start <= t < end)
+        for key_code in self._pressed - pressed:
+            _input_state.key_event(key_code, False)
+        for key_code in pressed - self._pressed:
+            _input_state.key_event(key_code, True)
+        self._pressed = pressed
+
+
+def make_synthetic_scene(scene_data: Dict[str, Any], count: int) -> Dict[str, Any]:
+    """
+    Erzeugt eine Szene mit `count` Objekten aus Kopien der Original-Szene
+
+    Die Kopien werden in einem quadratischen Raster nebeneinander gelegt. IDs bekommen
+    die Endung "_<Kopie>", auch im Code des Objekts (hole_objekt("<eigene ID>")).
+    Nur die erste Kopie behält die Kamera.
+
+    Args:
+        scene_data: Original-Szene
+        count: Gewünschte Anzahl Objekte
+
+    Returns:
+        Neue Szene (Dict)
+    """
+    template = [o for o in scene_data.get("objects", []) if "id" in o]
+    if not template:
+        raise ValueError("Szene enthält keine Objekte")
+
+    min_x = min(o.get("x", 0) for o in template)
+    min_y = min(o.get("y", 0) for o in template)
+    max_x = max(o.get("x", 0) + o.get("width", 0) for o in template)
+    max_y = max(o.get("y", 0) + o.get("height", 0) for o in template)
+    stride_x = max_x - min_x + BLOCK_GAP
+    stride_y = max_y - min_y + BLOCK_GAP
+
+    blocks = -(-count // len(template))
+    columns = max(1, int(blocks ** 0.5 + 0.999))
+
+    objects = []
+    for i in range(count):
+        block, original = divmod(i, len(template))
+        source = template[original]
+        offset_x = (block % columns) * stride_x
+        offset_y = (block // columns) * stride_y
+        obj = dict(source)
+        if block:
+            new_id = f"{source['id']}_{block}"
+            obj["id"] = new_id
+            obj["camera"] = False
+            if obj.get("code"):
+                obj["code"] = obj["code"].replace(f'"{source["id"]}"', f'"{new_id}"')
+        obj["x"] = source.get("x", 0) + offset_x
+        obj["y"] = source.get("y", 0) + offset_y
+        objects.append(obj)
+
+    result = dict(scene_data)
+    result["objects"] = objects
+    return result
+
+
+def make_mover_scene(scene_data: Dict[str, Any], count: int) -> Dict[str, Any]:
+    """
+    Erzeugt eine Szene mit `count` Objekten, davon drei Viertel bewegte Kisten
+
+    Die Kisten stehen auf Boden-Streifen (statische Tiles), fahren mit
+    bewege_mit_kollision() hin und her und drehen an anderen Kisten und an den
+    Streifen-Enden um. Die Streifen liegen nebeneinander wie in einem breiten
+    Level. Sprite und Größe kommen vom ersten Objekt der Original-Szene.
+
+    Args:
+        scene_data: Original-Szene (Vorlage für Sprite und Größe)
+        count: Gewünschte Anzahl Objekte
+
+    Returns:
+        Neue Szene (Dict)
+    """
+    template = next((o for o in scene_data.get("objects", []) if "id" in o), None)
+    if template is None:
+        raise ValueError("Szene enthält keine Objekte")
+    size = template.get("width", 32)
+    movers = max(1, count * 3 // 4)
+    rows = -(-movers // MOVERS_PER_ROW)
+    tiles = max(rows, count - movers)
+    row_length = -(-tiles // rows)  # Tiles pro Streifen
+    row_stride = row_length * size + BLOCK_GAP  # Abstand der Streifen (mit Lücke)
+
+    objects = []
+    for i in range(tiles):
+        row, column = divmod(i, row_length)
+        objects.append({
+            "id": f"ground_{i}", "type": "sprite", "sprite": template.get("sprite"),
+            "x": row * row_stride + column * size, "y": size, "width": size, "height": size,
+            "ground": True, "collider": {"enabled": True, "type": "rect"}, "code": "",
+        })
+    row_width = row_length * size
+    for i in range(movers):
+        row, slot = divmod(i, MOVERS_PER_ROW)
+        mover_id = f"mover_{i}"
+        start_x = row * row_stride
+        x = start_x + (slot * MOVER_SPACING * size) % max(size, row_width - size)
+        objects.append({
+            "id": mover_id, "type": "sprite", "sprite": template.get("sprite"),
+            "x": x, "y": 0, "width": size, "height": size,
+            "ground": False, "camera": i == 0,
+            "collider": {"enabled": True, "type": "rect"},
+            "code": MOVER_CODE.format(id=mover_id, direction=1 if i % 2 else -1,
+                                      min_x=start_x, max_x=start_x + max(0, row_width - size)),
+        })
+
+    result = dict(scene_data)
+    result["objects"] = objects
+    return result
+
+
+# Szenen-Arten des Benchmarks
+SCENES = {
+    "tiles": make_synthetic_scene,
+    "movers": make_mover_scene,
+}
+
+
+def _prepare_project(project_dir: Path, scene_name: str, scene: Dict[str, Any],
+                     broad_phase: str = "hash") -> Path:
+    """Kopiert das Projekt in einen temporären Ordner, ersetzt Start-Szene und Kollisions-Vorauswahl"""
+    target = Path(tempfile.mkdtemp(prefix="gamedev_bench_")) / project_dir.name
+    shutil.copytree(project_dir, target, ignore=shutil.ignore_patterns(".cache"))
+    with open(target / "scenes" / f"{scene_name}.json", "w", encoding="utf-8") as f:
+        json.dump(scene, f)
+    config = load_project(target)
+    config["broad_phase"] = broad_phase
+    with open(target / "project.json", "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+    return target
+
+
+def run_scene(project_dir: Path, frames: int) -> Tuple[Dict[str, Any], float]:
+    """
+    Lässt ein Projekt headless für `frames` Frames laufen
+
+    Returns:
+        Tuple (Profiler-Bericht, Gesamtzeit in Sekunden inkl. Laden)
+    """
+    profiler = PhaseProfiler(capacity=max(frames, 1), trace=False)
+    keys = ScriptedKeys()
+    random.seed(0)
+    start = time.perf_counter()
+    # Ausgaben der Runtime/Schüler-Skripte nicht in das JSON mischen
+    with contextlib.redirect_stdout(sys.stderr):
+        runtime.main(str(project_dir), max_frames=frames, fps_limit=0,
+                     profiler=profiler, on_frame=keys.advance, lockstep=True)
+    return profiler.report(), time.perf_counter() - start
+
+
+def run_benchmark(project_path: str, frames: int, sizes: List[int],
+                  scenes: Tuple[str, ...] = ("tiles",),
+                  broad_phases: Tuple[str, ...] = ("hash",)) -> Dict[str, Any]:
+    """
+    Führt den Benchmark für alle Szenen-Arten, Größen und Vorauswahl-Verfahren aus
+
+    Args:
+        project_path: Pfad zum Projektordner (Vorlage für die Szenen)
+        frames: Anzahl Frames pro Szene
+        sizes: Objekt-Anzahlen der synthetischen Szenen
+        scenes: Szenen-Arten (siehe SCENES)
+        broad_phases: Kollisions-Vorauswahl (siehe api.BROAD_PHASES)
+
+    Returns:
+        Ergebnis als Dict (JSON-fähig)
+    """
+    project_dir = Path(project_path).resolve()
+    config = load_project(project_dir)
+    scene_name = config.get("start_scene", "level1")
+    scene_data = load_scene(project_dir, scene_name)
+
+    results = []
+    for kind in scenes:
+        for size in sizes:
+            scene = SCENES[kind](scene_data, size)
+            for broad_phase in broad_phases:
+                bench_dir = _prepare_project(project_dir, scene_name, scene, broad_phase)
+                try:
+                    report, wall_time = run_scene(bench_dir, frames)
+                finally:
+                    shutil.rmtree(bench_dir.parent, ignore_errors=True)
+                frame_total_s = report["frame"]["total_ms"] / 1000
+                results.append({
+                    "scene": kind,
+                    "broad_phase": broad_phase,
+                    "objects": size,
+                    "load_s": round(wall_time - frame_total_s, 3),
+                    "fps": round(report["frames"] / frame_total_s, 1) if frame_total_s else 0.0,
+                    **report,
+                })
+
+    return {
+        "project": str(project_dir),
+        "frames": frames,
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "scenes": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m game_editor.engine.bench",
+        description="Misst den Game Loop ohne Fenster (Zeit pro Phase als JSON)")
+    parser.add_argument("project", help="Pfad zum Projektordner (z.B. Test_Project)")
+    parser.add_argument("--frames", type=int, default=300, help="Frames pro Szene (Standard: 300)")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Objekt-Anzahlen, durch Komma getrennt (Standard: 100,1000,10000)")
+    parser.add_argument("--scenes", default="tiles",
+                        help=f"Szenen-Arten, durch Komma getrennt ({', '.join(SCENES)}; Standard: tiles)")
+    parser.add_argument("--broad-phase", default="hash",
+                        help=f"Kollisions-Vorauswahl, durch Komma getrennt "
+                             f"({', '.join(BROAD_PHASES)}; Standard: hash)")
+    parser.add_argument("--output", help="JSON zusätzlich in diese Datei schreiben")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    scenes = tuple(s.strip() for s in args.scenes.split(",") if s.strip())
+    broad_phases = tuple(s.strip() for s in args.broad_phase.split(",") if s.strip())
+    for name in scenes:
+        if name not in SCENES:
+            parser.error(f"Unbekannte Szenen-Art: {name}")
+    for name in broad_phases:
+        if name not in BROAD_PHASES:
+            parser.error(f"Unbekannte Kollisions-Vorauswahl: {name}")
+    result = run_benchmark(args.project, args.frames, sizes, scenes, broad_phases)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
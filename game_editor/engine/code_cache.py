@@ -0,0 +1,228 @@
+"""
+Bytecode-Cache - Schüler-Code nur einmal übersetzen und kompilieren
+
+Deutscher Code wird beim Spielstart übersetzt und danach kompiliert. Das Ergebnis (Code-Objekt) wird unter .cache/bytecode/ im
+Projekt gespeichert. Der Schlüssel ist ein Hash aus Quelltext, Sprache,
+Übersetzer-Version, Übersetzungstabellen und Python-Bytecode-Version - ändert
+sich eins davon, wird neu übersetzt.
+
+Gleiche Skripte (z.B. die Standard-Vorlage in vielen Objekten) werden
+innerhalb eines Spielstarts nur einmal geladen und teilen sich das Code-Objekt.
+
+Der ValidationCache merkt sich im Editor das Ergebnis der Sprach-Prüfung pro
+Skript - beim Start-Button werden nur geänderte Skripte neu geprüft.
+"""
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Iterable, List, Optional, Tuple
+from .german_code_translator import (translate_code, find_language_violations, PositionMap,
+                                     TRANSLATOR_VERSION, GERMAN_TO_PYTHON, GERMAN_API_TO_ENGLISH)
+
+
+CODE_FILENAME = "<string>"  # Dateiname in Fehlermeldungen (wie bei exec() mit Quelltext)
+
+# Hash der Übersetzungstabellen (Schlüsselwörter und API-Aliase) - ein neuer Alias
+# macht gespeicherten Bytecode ungültig, auch ohne dass TRANSLATOR_VERSION erhöht wird
+_TABLES_DIGEST = hashlib.sha256(json.dumps([GERMAN_TO_PYTHON, GERMAN_API_TO_ENGLISH], sort_keys=True,
+                                           ensure_ascii=False).encode("utf-8")).digest()
+
+
+def translate_source(source: str, language: str) -> Tuple[str, PositionMap]:
+    """
+    Übersetzt Schüler-Code in Python (nur bei Sprache "deutsch")
+
+    Args:
+        source: Quelltext des Schülers
+        language: "deutsch" oder "englisch"
+
+    Returns:
+        Tuple (Python-Code, Positions-Mapping Python -> Original, siehe PositionMap)
+    """
+    if language == "deutsch":
+        # Ohne Validierung - die Runtime führt den Code nur aus
+        python_code, line_mapping, _ = translate_code(source, validate_language=False,
+                                                      expected_language="deutsch")
+        return python_code, line_mapping
+    return source, PositionMap(source.count('\n') + 1, source)
+
+
+class BytecodeCache:
+    """
+    Cache für kompilierten Schüler-Code (im Speicher und auf der Festplatte)
+
+    WICHTIG: Fehlerhafter Code (SyntaxError) wird nie gespeichert - der Fehler
+    tritt bei jedem Start erneut auf und wird wie bisher gemeldet.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Ordner für die Bytecode-Dateien (None = nur im Speicher)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._codes: Dict[str, CodeType] = {}
+        self.compiled = 0  # Übersetzt und kompiliert
+        self.disk_hits = 0  # Von der Festplatte geladen
+        self.shared = 0  # Gleiches Skript schon im Speicher
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> "BytecodeCache":
+        """Erstellt den Cache für ein Projekt (Dateien unter .cache/bytecode/)"""
+        return cls(Path(project_dir) / ".cache" / "bytecode")
+
+    @staticmethod
+    def cache_key(source: str, language: str) -> str:
+        """Hash aus Quelltext, Sprache, Übersetzer-Version, Übersetzungstabellen und Python-Bytecode-Version"""
+        digest = hashlib.sha256()
+        digest.update(importlib.util.MAGIC_NUMBER)
+        digest.update(_TABLES_DIGEST)
+        digest.update(f"{TRANSLATOR_VERSION}\0{language}\0".encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, source: str, language: str) -> CodeType:
+        """
+        Gibt das Code-Objekt für einen Quelltext zurück (übersetzt/kompiliert nur bei Bedarf)
+
+        Args:
+            source: Quelltext des Schülers
+            language: "deutsch" oder "englisch"
+
+        Returns:
+            Kompiliertes Code-Objekt (für exec())
+
+        Raises:
+            SyntaxError: Wenn der (übersetzte) Code nicht kompiliert werden kann
+        """
+        key = self.cache_key(source, language)
+        code = self._codes.get(key)
+        if code is not None:
+            self.shared += 1
+            return code
+
+        code = self._load(key)
+        if code is not None:
+            self.disk_hits += 1
+        else:
+            python_code, _ = translate_source(source, language)
+            code = compile(python_code, CODE_FILENAME, "exec")
+            self.compiled += 1
+            self._store(key, code)
+        self._codes[key] = code
+        return code
+
+    def stats(self) -> Dict[str, int]:
+        """Statistik: kompiliert, von der Festplatte geladen, im Speicher geteilt"""
+        return {"compiled": self.compiled, "disk_hits": self.disk_hits, "shared": self.shared}
+
+    def clear(self):
+        """Leert den Speicher-Cache (Dateien bleiben erhalten)"""
+        self._codes.clear()
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.bin"
+
+    def _load(self, key: str) -> Optional[CodeType]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                code = marshal.load(f)
+            return code if isinstance(code, CodeType) else None
+        except (OSError, EOFError, ValueError, TypeError):
+            # Beschädigte Datei: einfach neu kompilieren
+            return None
+
+    def _store(self, key: str, code: CodeType):
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Erst in temporäre Datei schreiben, dann umbenennen (nie halbe Dateien)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"WARNUNG: Bytecode-Cache konnte nicht gespeichert werden: {e}")
+
+
+class ValidationCache:
+    """
+    Ergebnisse der Sprach-Prüfung (find_language_violations) pro Skript
+
+    Schlüssel ist (Skript, Hash des Quelltexts, Sprache): Pro Skript wird nur das
+    letzte Ergebnis gemerkt, ein geänderter Quelltext oder eine andere Sprache
+    wird neu geprüft.
+
+    WICHTIG: Thread-sicher - der Code-Editor füllt den Cache beim Speichern im
+    Hintergrund (validate_in_background), der Start-Button liest ihn (validate).
+    """
+
+    def __init__(self):
+        # Skript -> (Hash aus Sprache und Quelltext, Fehler)
+        self._results: Dict[str, Tuple[str, List[Tuple[int, int, str]]]] = {}
+        self._lock = threading.Lock()
+        self.validated = 0  # Neu geprüft
+        self.hits = 0  # Ergebnis aus dem Cache
+
+    @staticmethod
+    def source_key(source: str, language: str) -> str:
+        """Hash aus Sprache, Übersetzer-Version und Quelltext"""
+        digest = hashlib.sha256(f"{TRANSLATOR_VERSION}\0{language}\0".encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def validate(self, script_id: str, source: str, language: str) -> List[Tuple[int, int, str]]:
+        """
+        Gibt die Sprach-Fehler eines Skripts zurück (prüft nur, wenn es sich geändert hat)
+
+        Args:
+            script_id: Eindeutiger Name des Skripts (z.B. "game.py" oder "Objekt spieler")
+            source: Quelltext
+            language: "deutsch" oder "englisch"
+
+        Returns:
+            Liste von (Zeile, Spalte, Fehlermeldung) - siehe find_language_violations()
+        """
+        key = self.source_key(source, language)
+        with self._lock:
+            cached = self._results.get(script_id)
+            if cached is not None and cached[0] == key:
+                self.hits += 1
+                return cached[1]
+        violations = find_language_violations(source, language)
+        with self._lock:
+            self._results[script_id] = (key, violations)
+            self.validated += 1
+        return violations
+
+    def validate_in_background(self, script_id: str, source: str, language: str):
+        """Prüft ein Skript in einem Hintergrund-Thread (Ergebnis landet im Cache)"""
+        threading.Thread(target=self.validate, args=(script_id, source, language), daemon=True).start()
+
+    def retain(self, script_ids: Iterable[str]):
+        """Vergisst alle Skripte außer den angegebenen (z.B. gelöschte Objekte)"""
+        keep = set(script_ids)
+        with self._lock:
+            for script_id in [script_id for script_id in self._results if script_id not in keep]:
+                del self._results[script_id]
+
+    def stats(self) -> Dict[str, int]:
+        """Statistik: neu geprüft, aus dem Cache"""
+        return {"validated": self.validated, "hits": self.hits}
+
+    def clear(self):
+        """Vergisst alle Ergebnisse"""
+        with self._lock:
+            self._results.clear()
@@ -1,12 +1,185 @@
 """
 Kollisionssystem - AABB (Axis-Aligned Bounding Box) Kollisionserkennung
 """
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Set, Tuple, Optional, Callable, Sequence
 from .gameobject import GameObject
 
+# NumPy (optional) - für gebündelte Kollisionsabfragen über alle Objekte
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 
 class CollisionSystem:
-    """Verwaltet Kollisionserkennung zwischen Objekten"""
+    """
+    Verwaltet Kollisionserkennung zwischen Objekten
+    
+    Neben den Einzelprüfungen (check_collision, get_colliding_objects) kann eine
+    Instanz alle Objekte mit Kollisionsbox auf einmal prüfen: overlaps(obj) und
+    all_pairs(). Mit NumPy werden die Kollisionsboxen direkt aus den Spalten des
+    TransformStore gelesen und gemeinsam verglichen, ohne NumPy läuft dieselbe
+    Abfrage als einfache Python-Schleife (bzw. Sort-and-Sweep für all_pairs).
+    """
+    
+    def __init__(self, objects: Optional[Sequence[GameObject]] = None, use_numpy: bool = HAS_NUMPY):
+        """
+        Args:
+            objects: Objekte, die geprüft werden (nur welche mit Kollisionsbox werden übernommen)
+            use_numpy: NumPy verwenden (False = Python-Fallback, z.B. für Tests)
+        """
+        self.use_numpy = use_numpy and HAS_NUMPY
+        # Objekte mit Kollisionsbox - die Indizes von overlaps()/all_pairs() beziehen sich darauf
+        self.objects: List[GameObject] = []
+        self._positions: Dict[GameObject, int] = {}
+        self._store = None  # Gemeinsamer TransformStore aller Objekte (None = gemischt)
+        self._slots = None  # Slot-Indizes als NumPy-Array
+        self.set_objects(objects or [])
+    
+    def set_objects(self, objects: Sequence[GameObject]):
+        """Übernimmt eine neue Objekt-Liste (nach dem Hinzufügen/Entfernen von Objekten)"""
+        self.objects = [obj for obj in objects if obj._collider_enabled]
+        self._positions = {obj: i for i, obj in enumerate(self.objects)}
+        stores = {id(obj._store) for obj in self.objects}
+        self._store = self.objects[0]._store if len(stores) == 1 else None
+        if self.use_numpy and self._store is not None:
+            self._slots = np.fromiter((obj._slot for obj in self.objects), dtype=np.intp,
+                                      count=len(self.objects))
+        else:
+            self._slots = None
+    
+    def __len__(self) -> int:
+        return len(self.objects)
+    
+    def overlaps(self, obj: GameObject):
+        """
+        Gibt alle Objekte zurück, deren Kollisionsbox die von obj überlappt
+        
+        Args:
+            obj: Das zu prüfende Objekt (muss nicht in der Liste sein)
+            
+        Returns:
+            Aufsteigende Indizes in self.objects (NumPy-Array, ohne NumPy eine Liste).
+            obj selbst ist nie enthalten.
+        """
+        if not obj._collider_enabled or not self.objects:
+            return np.empty(0, dtype=np.intp) if self.use_numpy else []
+        left = obj._collider_x
+        top = obj._collider_y
+        right = left + obj._collider_width
+        bottom = top + obj._collider_height
+        own = self._positions.get(obj)
+        
+        if self.use_numpy:
+            lefts, tops, rights, bottoms = self._boxes()
+            hits = np.flatnonzero((lefts < right) & (rights > left) & (tops < bottom) & (bottoms > top))
+            if own is not None:
+                hits = hits[hits != own]
+            return hits
+        
+        hits = []
+        for i, other in enumerate(self.objects):
+            other_left = other._collider_x
+            other_top = other._collider_y
+            if (i != own and
+                    other_left < right and other_left + other._collider_width > left and
+                    other_top < bottom and other_top + other._collider_height > top):
+                hits.append(i)
+        return hits
+    
+    def all_pairs(self):
+        """
+        Gibt alle überlappenden Paare zurück (Sort-and-Sweep)
+        
+        Die Kollisionsboxen werden entlang der Achse mit der größeren Ausdehnung
+        sortiert. Verglichen werden nur Boxen, die sich auf dieser Achse überlappen.
+        
+        Returns:
+            Paare (i, j) mit i < j als Indizes in self.objects, sortiert.
+            Mit NumPy ein Array der Form (n, 2), sonst eine Liste von Tupeln.
+        """
+        if self.use_numpy:
+            return self._all_pairs_numpy()
+        return self._all_pairs_python()
+    
+    def _boxes(self):
+        """Kollisionsboxen aller Objekte als NumPy-Arrays (links, oben, rechts, unten)"""
+        store = self._store
+        if store is not None:
+            # WICHTIG: frombuffer-Views nur kurz halten, sonst kann der Speicher nicht wachsen
+            slots = self._slots
+            lefts = np.frombuffer(store.x)[slots] + np.frombuffer(store.collider_offset_x)[slots]
+            tops = np.frombuffer(store.y)[slots] + np.frombuffer(store.collider_offset_y)[slots]
+            rights = lefts + np.frombuffer(store.collider_width)[slots]
+            bottoms = tops + np.frombuffer(store.collider_height)[slots]
+            return lefts, tops, rights, bottoms
+        count = len(self.objects)
+        lefts = np.fromiter((o._collider_x for o in self.objects), dtype=float, count=count)
+        tops = np.fromiter((o._collider_y for o in self.objects), dtype=float, count=count)
+        rights = lefts + np.fromiter((o._collider_width for o in self.objects), dtype=float, count=count)
+        bottoms = tops + np.fromiter((o._collider_height for o in self.objects), dtype=float, count=count)
+        return lefts, tops, rights, bottoms
+    
+    def _all_pairs_numpy(self):
+        count = len(self.objects)
+        if count < 2:
+            return np.empty((0, 2), dtype=np.intp)
+        lefts, tops, rights, bottoms = self._boxes()
+        # Entlang der Achse mit der größeren Ausdehnung sortieren (weniger Überlappungen)
+        if np.ptp(tops) > np.ptp(lefts):
+            lefts, tops, rights, bottoms = tops, lefts, bottoms, rights
+        order = np.argsort(lefts, kind="stable")
+        sorted_lefts = lefts[order]
+        sorted_rights = rights[order]
+        # Für jede Box: alle späteren Boxen, die links vor ihrem rechten Rand beginnen
+        ends = np.searchsorted(sorted_lefts, sorted_rights, side="left")
+        positions = np.arange(count)
+        counts = np.maximum(ends - positions - 1, 0)
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty((0, 2), dtype=np.intp)
+        first = np.repeat(positions, counts)
+        starts = np.cumsum(counts) - counts
+        second = first + 1 + (np.arange(total) - np.repeat(starts, counts))
+        a = order[first]
+        b = order[second]
+        hit = ((rights[b] > lefts[a]) & (lefts[b] < rights[a]) &
+               (tops[a] < bottoms[b]) & (bottoms[a] > tops[b]))
+        pairs = np.stack((np.minimum(a, b)[hit], np.maximum(a, b)[hit]), axis=1)
+        if len(pairs):
+            pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        return pairs
+    
+    def _all_pairs_python(self) -> List[Tuple[int, int]]:
+        boxes = []
+        for i, obj in enumerate(self.objects):
+            left = obj._collider_x
+            top = obj._collider_y
+            boxes.append((left, top, left + obj._collider_width, top + obj._collider_height, i))
+        if len(boxes) < 2:
+            return []
+        # Entlang der Achse mit der größeren Ausdehnung sortieren (weniger Überlappungen)
+        spread_x = max(b[0] for b in boxes) - min(b[0] for b in boxes)
+        spread_y = max(b[1] for b in boxes) - min(b[1] for b in boxes)
+        axis = 1 if spread_y > spread_x else 0
+        boxes.sort(key=lambda box: box[axis])
+        pairs = []
+        active: List[tuple] = []
+        for box in boxes:
+            start = box[axis]
+            # Boxen, die vor dem Anfang dieser Box enden, fallen aus der aktiven Liste
+            active = [other for other in active if other[axis + 2] > start]
+            for other in active:
+                if (other[0] < box[2] and other[2] > box[0] and
+                        other[1] < box[3] and other[3] > box[1]):
+                    i, j = other[4], box[4]
+                    pairs.append((i, j) if i < j else (j, i))
+            active.append(box)
+        pairs.sort()
+        return pairs
     
     @staticmethod
     def check_collision(obj1: GameObject, obj2: GameObject) -> bool:
@@ -46,3 +219,730 @@ class CollisionSystem:
             if other.id != obj.id and CollisionSystem.check_collision(obj, other):
                 colliding.append(other)
         return colliding
+
+
+def _index_order(obj: GameObject) -> int:
+    """Sortier-Schlüssel: Reihenfolge, in der das Objekt registriert wurde"""
+    return obj._index_order
+
+
+class SpatialHash:
+    """
+    Uniformes Gitter (Spatial Hash) als Vorauswahl für Kollisionsprüfungen
+    
+    Jedes Objekt wird in alle Zellen eingetragen, die seine Kollisionsbox berührt.
+    Abfragen liefern nur Objekte aus den berührten Zellen - sortiert nach
+    Registrierungs-Reihenfolge, also in derselben Reihenfolge wie in der Objekt-Liste.
+    Dadurch bleiben Ergebnisse identisch zu einer Prüfung aller Objekte.
+    
+    WICHTIG: Objekte melden Positionsänderungen selbst (GameObject.x/y Setter),
+    das Gitter bleibt also automatisch aktuell.
+    """
+    
+    def __init__(self, cell_size: float = 64):
+        """
+        Args:
+            cell_size: Kantenlänge einer Zelle in Pixeln (sinnvoll: Sprite-Größe)
+        """
+        self.cell_size: float = float(cell_size) if cell_size and cell_size > 0 else 64.0
+        self._cells: Dict[Tuple[int, int], Set[GameObject]] = {}
+        # Objekt -> belegter Zellbereich (cx0, cy0, cx1, cy1)
+        self._ranges: Dict[GameObject, Tuple[int, int, int, int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._ranges)
+    
+    def __contains__(self, obj: GameObject) -> bool:
+        return obj in self._ranges
+    
+    def __iter__(self):
+        """Alle Objekte im Gitter (ohne bestimmte Reihenfolge)"""
+        return iter(self._ranges)
+    
+    def _cell_range(self, obj: GameObject) -> Tuple[int, int, int, int]:
+        """Berechnet den Zellbereich, den die Kollisionsbox des Objekts berührt"""
+        cs = self.cell_size
+        store, slot = obj._store, obj._slot
+        left = store.x[slot] + store.collider_offset_x[slot]
+        top = store.y[slot] + store.collider_offset_y[slot]
+        return (int(left // cs), int(top // cs),
+                int((left + store.collider_width[slot]) // cs),
+                int((top + store.collider_height[slot]) // cs))
+    
+    def build(self, objects: List[GameObject]):
+        """Trägt viele Objekte auf einmal ein"""
+        for obj in objects:
+            self.insert(obj)
+    
+    def insert(self, obj: GameObject):
+        """Trägt ein Objekt in das Gitter ein"""
+        if obj in self._ranges:
+            self.update(obj)
+            return
+        cell_range = self._cell_range(obj)
+        self._ranges[obj] = cell_range
+        self._add_to_cells(obj, cell_range)
+        obj._spatial_index = self
+    
+    def remove(self, obj: GameObject):
+        """Entfernt ein Objekt aus dem Gitter"""
+        cell_range = self._ranges.pop(obj, None)
+        if cell_range is None:
+            return
+        self._remove_from_cells(obj, cell_range)
+        if obj._spatial_index is self:
+            obj._spatial_index = None
+    
+    def update(self, obj: GameObject):
+        """Aktualisiert die Zellen eines Objekts nach einer Positionsänderung"""
+        old_range = self._ranges.get(obj)
+        if old_range is None:
+            return
+        new_range = self._cell_range(obj)
+        if new_range == old_range:
+            return  # Häufigster Fall: Objekt bleibt in denselben Zellen
+        self._remove_from_cells(obj, old_range)
+        self._add_to_cells(obj, new_range)
+        self._ranges[obj] = new_range
+    
+    def clear(self):
+        """Entfernt alle Objekte aus dem Gitter"""
+        for obj in self._ranges:
+            if obj._spatial_index is self:
+                obj._spatial_index = None
+        self._cells.clear()
+        self._ranges.clear()
+    
+    def query(self, left: float, top: float, right: float, bottom: float) -> List[GameObject]:
+        """
+        Gibt alle Objekte zurück, deren Zellen den Bereich berühren
+        
+        Args:
+            left, top, right, bottom: Abfrage-Rechteck in Welt-Koordinaten
+            
+        Returns:
+            Kandidaten-Liste (Obermenge der tatsächlich überlappenden Objekte),
+            sortiert nach Registrierungs-Reihenfolge
+        """
+        cs = self.cell_size
+        cells = self._cells
+        found: Set[GameObject] = set()
+        for cx in range(int(left // cs), int(right // cs) + 1):
+            for cy in range(int(top // cs), int(bottom // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found, key=_index_order)
+    
+    def _add_to_cells(self, obj: GameObject, cell_range: Tuple[int, int, int, int]):
+        cx0, cy0, cx1, cy1 = cell_range
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {obj}
+                else:
+                    bucket.add(obj)
+    
+    def _remove_from_cells(self, obj: GameObject, cell_range: Tuple[int, int, int, int]):
+        cx0, cy0, cx1, cy1 = cell_range
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(obj)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+
+# Endpunkt-Arten der Sweep-and-Prune-Liste (bei gleichem Wert steht "max" vor "min",
+# sich nur berührende Boxen gelten also nicht als überlappend - wie bei collides_with)
+_MAX = 0
+_MIN = 1
+
+
+class SweepAndPrune:
+    """
+    Sweep and Prune als Vorauswahl für Kollisionsprüfungen (Alternative zu SpatialHash)
+    
+    Die linken und rechten Kanten (Endpunkte) aller Kollisionsboxen liegen in einer
+    sortierten Liste. Bewegt sich ein Objekt, werden nur seine beiden Endpunkte per
+    Insertion Sort an die neue Stelle geschoben - bei kleinen Bewegungen sind das
+    wenige Tauschschritte. Jedes Mal, wenn dabei eine linke an einer rechten Kante
+    vorbeiläuft, wird das Paar neu geprüft. So bleibt für jedes Objekt die Menge
+    der Objekte aktuell, die sich auf der X-Achse mit ihm überlappen (partners()).
+    
+    Gleiche Schnittstelle wie SpatialHash (insert, remove, update, query, ...),
+    Abfragen liefern ebenfalls nach Registrierungs-Reihenfolge sortierte Listen.
+    
+    WICHTIG: Geeignet für viele bewegte Objekte, die nicht übereinander stehen.
+    Objekte in derselben Spalte (gleiche X-Position) überlappen sich auf der
+    X-Achse alle gegenseitig - dafür ist das Gitter besser.
+    """
+    
+    def __init__(self, cell_size: float = 64):
+        """
+        Args:
+            cell_size: Wird nicht verwendet (gleiche Schnittstelle wie SpatialHash)
+        """
+        self.cell_size: float = float(cell_size) if cell_size and cell_size > 0 else 64.0
+        # Sortierte Endpunkte: Wert, Art (_MAX/_MIN) und Objekt (parallele Listen)
+        self._values: List[float] = []
+        self._kinds: List[int] = []
+        self._owners: List[GameObject] = []
+        # Objekt -> [Index rechte Kante, Index linke Kante] (Index = Art)
+        self._ends: Dict[GameObject, List[int]] = {}
+        # Objekt -> [links, rechts] der Kollisionsbox (Stand der Endpunkt-Liste)
+        self._bounds: Dict[GameObject, List[float]] = {}
+        # Objekt -> Objekte, die sich auf der X-Achse mit ihm überlappen
+        self._partners: Dict[GameObject, Set[GameObject]] = {}
+        self._max_width = 0.0  # Breiteste Box (für Bereichsabfragen)
+        self.swaps = 0  # Anzahl Tauschschritte (für den Benchmark)
+    
+    def __len__(self) -> int:
+        return len(self._ends)
+    
+    def __contains__(self, obj: GameObject) -> bool:
+        return obj in self._ends
+    
+    def __iter__(self):
+        """Alle Objekte (ohne bestimmte Reihenfolge)"""
+        return iter(self._ends)
+    
+    @staticmethod
+    def _x_bounds(obj: GameObject) -> Tuple[float, float]:
+        store, slot = obj._store, obj._slot
+        left = store.x[slot] + store.collider_offset_x[slot]
+        return left, left + store.collider_width[slot]
+    
+    def build(self, objects: List[GameObject]):
+        """Trägt viele Objekte auf einmal ein (einmal sortieren statt einzeln einsortieren)"""
+        new_objects = [obj for obj in objects if obj not in self._ends]
+        for obj in new_objects:
+            left, right = self._x_bounds(obj)
+            self._bounds[obj] = [left, right]
+            self._partners[obj] = set()
+            self._ends[obj] = [0, 0]
+            self._max_width = max(self._max_width, right - left)
+            obj._spatial_index = self
+        endpoints = sorted(
+            [(value, kind, owner) for value, kind, owner in
+             zip(self._values, self._kinds, self._owners)] +
+            [(self._bounds[obj][1], _MAX, obj) for obj in new_objects] +
+            [(self._bounds[obj][0], _MIN, obj) for obj in new_objects],
+            key=lambda endpoint: (endpoint[0], endpoint[1]))
+        self._values = [endpoint[0] for endpoint in endpoints]
+        self._kinds = [endpoint[1] for endpoint in endpoints]
+        self._owners = [endpoint[2] for endpoint in endpoints]
+        for i, (_, kind, owner) in enumerate(endpoints):
+            self._ends[owner][kind] = i
+        # Überlappungen einmal per Sweep bestimmen (danach nur noch inkrementell)
+        active: List[GameObject] = []
+        for obj in sorted(self._bounds, key=lambda o: self._bounds[o][0]):
+            left = self._bounds[obj][0]
+            active = [other for other in active if self._bounds[other][1] > left]
+            for other in active:
+                self._refresh_pair(obj, other)
+            active.append(obj)
+    
+    def insert(self, obj: GameObject):
+        """Trägt ein Objekt ein (Endpunkte werden von rechts einsortiert)"""
+        if obj in self._ends:
+            self.update(obj)
+            return
+        left, right = self._x_bounds(obj)
+        self._bounds[obj] = [left, right]
+        self._partners[obj] = set()
+        self._max_width = max(self._max_width, right - left)
+        self._ends[obj] = [len(self._values), len(self._values) + 1]
+        self._values += [right, left]
+        self._kinds += [_MAX, _MIN]
+        self._owners += [obj, obj]
+        self._sink(self._ends[obj][_MAX])
+        self._sink(self._ends[obj][_MIN])
+        obj._spatial_index = self
+    
+    def remove(self, obj: GameObject):
+        """Entfernt ein Objekt"""
+        ends = self._ends.pop(obj, None)
+        if ends is None:
+            return
+        for partner in self._partners.pop(obj):
+            self._partners[partner].discard(obj)
+        del self._bounds[obj]
+        for index in sorted(ends, reverse=True):
+            del self._values[index]
+            del self._kinds[index]
+            del self._owners[index]
+        # Indizes hinter der ersten entfernten Stelle nachführen
+        kinds = self._kinds
+        owners = self._owners
+        all_ends = self._ends
+        for i in range(min(ends), len(owners)):
+            all_ends[owners[i]][kinds[i]] = i
+        if obj._spatial_index is self:
+            obj._spatial_index = None
+    
+    def update(self, obj: GameObject):
+        """Schiebt die Endpunkte eines Objekts nach einer Positionsänderung an die neue Stelle"""
+        bounds = self._bounds.get(obj)
+        if bounds is None:
+            return
+        left, right = self._x_bounds(obj)
+        if left == bounds[0] and right == bounds[1]:
+            return  # Nur Y geändert - Überlappungen auf der X-Achse bleiben gleich
+        if right - left > self._max_width:
+            self._max_width = right - left
+        ends = self._ends[obj]
+        values = self._values
+        # Erst die Kante in Bewegungsrichtung verschieben (Box wird nie "umgedreht")
+        if left < bounds[0]:
+            bounds[0] = left
+            values[ends[_MIN]] = left
+            self._sink(ends[_MIN])
+            bounds[1] = right
+            values[ends[_MAX]] = right
+            self._sink(ends[_MAX])
+        else:
+            bounds[1] = right
+            values[ends[_MAX]] = right
+            self._sink(ends[_MAX])
+            bounds[0] = left
+            values[ends[_MIN]] = left
+            self._sink(ends[_MIN])
+    
+    def _sink(self, i: int):
+        """Insertion Sort für einen Endpunkt: schiebt ihn nach links/rechts an seine Stelle"""
+        values = self._values
+        kinds = self._kinds
+        owners = self._owners
+        ends = self._ends
+        value = values[i]
+        kind = kinds[i]
+        obj = owners[i]
+        start = i
+        # Nach links, solange der Nachbar größer ist
+        while i > 0:
+            previous = values[i - 1]
+            if previous < value or (previous == value and kinds[i - 1] <= kind):
+                break
+            other = owners[i - 1]
+            other_kind = kinds[i - 1]
+            values[i] = previous
+            kinds[i] = other_kind
+            owners[i] = other
+            ends[other][other_kind] = i
+            i -= 1
+            # Linke Kante läuft an rechter Kante vorbei: Überlappung hat sich geändert
+            if other_kind != kind and other is not obj:
+                self._refresh_pair(obj, other)
+        # Nach rechts, solange der Nachbar kleiner ist
+        last = len(values) - 1
+        while i < last:
+            following = values[i + 1]
+            if following > value or (following == value and kinds[i + 1] >= kind):
+                break
+            other = owners[i + 1]
+            other_kind = kinds[i + 1]
+            values[i] = following
+            kinds[i] = other_kind
+            owners[i] = other
+            ends[other][other_kind] = i
+            i += 1
+            if other_kind != kind and other is not obj:
+                self._refresh_pair(obj, other)
+        values[i] = value
+        kinds[i] = kind
+        owners[i] = obj
+        ends[obj][kind] = i
+        self.swaps += abs(i - start)
+    
+    def _refresh_pair(self, a: GameObject, b: GameObject):
+        a_bounds = self._bounds[a]
+        b_bounds = self._bounds[b]
+        if a_bounds[0] < b_bounds[1] and b_bounds[0] < a_bounds[1]:
+            self._partners[a].add(b)
+            self._partners[b].add(a)
+        else:
+            self._partners[a].discard(b)
+            self._partners[b].discard(a)
+    
+    def clear(self):
+        """Entfernt alle Objekte"""
+        for obj in self._ends:
+            if obj._spatial_index is self:
+                obj._spatial_index = None
+        self._values.clear()
+        self._kinds.clear()
+        self._owners.clear()
+        self._ends.clear()
+        self._bounds.clear()
+        self._partners.clear()
+    
+    def partners(self, obj: GameObject) -> Set[GameObject]:
+        """
+        Gibt alle Objekte zurück, die sich auf der X-Achse mit obj überlappen
+        
+        WICHTIG: Die Menge wird intern weiter verändert - nicht selbst bearbeiten
+        und vor eigenen Bewegungen kopieren.
+        """
+        return self._partners.get(obj, set())
+    
+    def pairs(self) -> List[Tuple[GameObject, GameObject]]:
+        """
+        Gibt alle Paare zurück, deren Kollisionsboxen sich überlappen
+        
+        Returns:
+            Paare (a, b), a vor b in Registrierungs-Reihenfolge, sortiert
+        """
+        found = []
+        for a, partners in self._partners.items():
+            a_top = a._collider_y
+            a_bottom = a_top + a._collider_height
+            for b in partners:
+                if a._index_order < b._index_order:
+                    b_top = b._collider_y
+                    if b_top < a_bottom and b_top + b._collider_height > a_top:
+                        found.append((a, b))
+        found.sort(key=lambda pair: (pair[0]._index_order, pair[1]._index_order))
+        return found
+    
+    def query(self, left: float, top: float, right: float, bottom: float) -> List[GameObject]:
+        """
+        Gibt alle Objekte zurück, deren Kollisionsbox den Bereich berührt
+        
+        Args:
+            left, top, right, bottom: Abfrage-Rechteck in Welt-Koordinaten
+            
+        Returns:
+            Kandidaten-Liste, sortiert nach Registrierungs-Reihenfolge
+        """
+        values = self._values
+        kinds = self._kinds
+        owners = self._owners
+        bounds = self._bounds
+        found = []
+        # Jede Box, die den Bereich berührt, beginnt höchstens max_width links davon
+        for i in range(bisect_left(values, left - self._max_width), bisect_right(values, right)):
+            if kinds[i] != _MIN:
+                continue
+            obj = owners[i]
+            if bounds[obj][1] < left:
+                continue
+            obj_top = obj._collider_y
+            if obj_top <= bottom and obj_top + obj._collider_height >= top:
+                found.append(obj)
+        found.sort(key=_index_order)
+        return found
+
+
+class _StaticRun:
+    """Zusammenhängender Abschnitt benachbarter Boden-Tiles in einer Reihe"""
+    __slots__ = ("left", "right", "max_width", "members", "member_lefts")
+    
+    def __init__(self, first: GameObject, first_left: float):
+        self.left = first_left
+        self.right = first_left + first._collider_width
+        self.max_width = first._collider_width
+        self.members: List[GameObject] = [first]
+        self.member_lefts: List[float] = [first_left]
+
+
+class _StaticRow:
+    """Alle Boden-Tiles mit gleicher Oberkante und Höhe, zu Abschnitten verschmolzen"""
+    __slots__ = ("top", "height", "tiles", "runs", "run_lefts", "run_rights")
+    
+    def __init__(self, top: float, height: float):
+        self.top = top
+        self.height = height
+        self.tiles: List[GameObject] = []
+        self.runs: List[_StaticRun] = []
+        self.run_lefts: List[float] = []
+        self.run_rights: List[float] = []
+    
+    def bake(self):
+        """Sortiert die Tiles nach X und verschmilzt benachbarte zu Abschnitten"""
+        self.tiles.sort(key=lambda tile: tile.x + tile._collider_offset_x)
+        runs: List[_StaticRun] = []
+        for tile in self.tiles:
+            left = tile.x + tile._collider_offset_x
+            if runs and left <= runs[-1].right:
+                run = runs[-1]
+                run.members.append(tile)
+                run.member_lefts.append(left)
+                run.right = max(run.right, left + tile._collider_width)
+                run.max_width = max(run.max_width, tile._collider_width)
+            else:
+                runs.append(_StaticRun(tile, left))
+        self.runs = runs
+        self.run_lefts = [run.left for run in runs]
+        self.run_rights = [run.right for run in runs]
+
+
+class StaticGeometry:
+    """
+    Vorberechnete Kollisionsebene für statische Objekte (Boden-Tiles)
+    
+    Boden-Tiles bewegen sich nicht. Sie werden deshalb einmalig nach Reihen
+    (gleiche Oberkante und Höhe) gruppiert, nach X sortiert und zu Abschnitten
+    benachbarter Tiles verschmolzen. Abfragen finden die betroffenen Reihen über
+    Gitter-Zeilen und die Abschnitte per binärer Suche.
+    
+    Abfragen liefern die einzelnen Tiles (nicht die Abschnitte), sortiert nach
+    Registrierungs-Reihenfolge - die Ergebnisse bleiben dadurch identisch zu
+    einer Prüfung aller Objekte.
+    
+    WICHTIG: Wird ein statisches Objekt doch bewegt (z.B. von Schüler-Code),
+    wird es automatisch aus dieser Ebene entfernt und ins dynamische Gitter
+    übernommen.
+    """
+    
+    def __init__(self, cell_size: float = 64, dynamic_index: Optional[SpatialHash] = None):
+        """
+        Args:
+            cell_size: Zeilenhöhe für die Reihen-Suche (sinnvoll: Sprite-Größe)
+            dynamic_index: Gitter, in das bewegte statische Objekte übernommen werden
+        """
+        self.cell_size: float = float(cell_size) if cell_size and cell_size > 0 else 64.0
+        self._dynamic_index = dynamic_index
+        # Wird aufgerufen, wenn ein Objekt die statische Ebene verlässt (zerstört oder bewegt)
+        self.on_remove: Optional[Callable[[GameObject], None]] = None
+        self._rows: Dict[Tuple[float, float], _StaticRow] = {}
+        self._row_buckets: Dict[int, List[_StaticRow]] = {}
+        # Objekt -> gebackene Position der Kollisionsbox (links, oben)
+        self._positions: Dict[GameObject, Tuple[float, float]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._positions)
+    
+    def __contains__(self, obj: GameObject) -> bool:
+        return obj in self._positions
+    
+    def objects(self) -> List[GameObject]:
+        """Gibt alle statischen Objekte zurück (in Registrierungs-Reihenfolge)"""
+        return sorted(self._positions, key=_index_order)
+    
+    def build(self, objects: List[GameObject]):
+        """Backt alle übergebenen Objekte auf einmal (beim Laden der Szene)"""
+        touched = set()
+        for obj in objects:
+            touched.add(id(self._add_tile(obj)))
+        for row in self._rows.values():
+            if id(row) in touched:
+                row.bake()
+    
+    def add(self, obj: GameObject):
+        """Fügt ein einzelnes statisches Objekt hinzu"""
+        if obj in self._positions:
+            return
+        self._add_tile(obj).bake()
+    
+    def remove(self, obj: GameObject):
+        """Entfernt ein Objekt aus der statischen Ebene"""
+        position = self._positions.pop(obj, None)
+        if position is None:
+            return
+        key = (position[1], obj._collider_height)
+        row = self._rows.get(key)
+        if row is not None:
+            row.tiles.remove(obj)
+            if row.tiles:
+                row.bake()
+            else:
+                del self._rows[key]
+                for cy in self._row_cells(row):
+                    bucket = self._row_buckets.get(cy)
+                    if bucket is not None:
+                        bucket.remove(row)
+                        if not bucket:
+                            del self._row_buckets[cy]
+        obj._is_static = False
+        if obj._spatial_index is self:
+            obj._spatial_index = None
+        if self.on_remove is not None:
+            self.on_remove(obj)
+    
+    def update(self, obj: GameObject):
+        """Wird bei Positionsänderung aufgerufen: bewegte Objekte werden dynamisch"""
+        position = self._positions.get(obj)
+        if position is None:
+            return
+        if (obj._collider_x, obj._collider_y) == position:
+            return  # Gleiche Position gesetzt (z.B. fixierte Y-Position)
+        # Reihe nutzt die alte Position als Schlüssel - vor dem Entfernen nichts ändern
+        self.remove(obj)
+        if self._dynamic_index is not None:
+            self._dynamic_index.insert(obj)
+    
+    def clear(self):
+        """Entfernt alle Objekte aus der statischen Ebene"""
+        for obj in self._positions:
+            obj._is_static = False
+            if obj._spatial_index is self:
+                obj._spatial_index = None
+        self._rows.clear()
+        self._row_buckets.clear()
+        self._positions.clear()
+    
+    def query(self, left: float, top: float, right: float, bottom: float) -> List[GameObject]:
+        """
+        Gibt alle statischen Objekte zurück, deren Kollisionsbox den Bereich berührt
+        
+        Args:
+            left, top, right, bottom: Abfrage-Rechteck in Welt-Koordinaten
+            
+        Returns:
+            Liste der Tiles, sortiert nach Registrierungs-Reihenfolge
+        """
+        cs = self.cell_size
+        found: List[GameObject] = []
+        seen_rows = set()
+        for cy in range(int(top // cs), int(bottom // cs) + 1):
+            for row in self._row_buckets.get(cy, ()):
+                if id(row) in seen_rows:
+                    continue
+                seen_rows.add(id(row))
+                if row.top > bottom or row.top + row.height < top:
+                    continue
+                # Abschnitte, die horizontal in den Bereich ragen (binäre Suche)
+                start = bisect_left(row.run_rights, left)
+                stop = bisect_right(row.run_lefts, right)
+                for run in row.runs[start:stop]:
+                    lefts = run.member_lefts
+                    first = bisect_left(lefts, left - run.max_width)
+                    last = bisect_right(lefts, right)
+                    for i in range(first, last):
+                        tile = run.members[i]
+                        if lefts[i] + tile._collider_width >= left:
+                            found.append(tile)
+        found.sort(key=_index_order)
+        return found
+    
+    def _add_tile(self, obj: GameObject) -> _StaticRow:
+        """Trägt ein Tile in seine Reihe ein (ohne neu zu backen)"""
+        left = obj.x + obj._collider_offset_x
+        top = obj.y + obj._collider_offset_y
+        key = (top, obj._collider_height)
+        row = self._rows.get(key)
+        if row is None:
+            row = _StaticRow(top, obj._collider_height)
+            self._rows[key] = row
+            for cy in self._row_cells(row):
+                self._row_buckets.setdefault(cy, []).append(row)
+        row.tiles.append(obj)
+        self._positions[obj] = (left, top)
+        obj._is_static = True
+        obj._spatial_index = self
+        return row
+    
+    def _row_cells(self, row: _StaticRow) -> range:
+        """Gitter-Zeilen, die eine Reihe vertikal berührt"""
+        cs = self.cell_size
+        return range(int(row.top // cs), int((row.top + row.height) // cs) + 1)
+
+
+# Toleranz in Pixeln für "steht auf" (Unterseite nahe Oberseite des anderen Objekts)
+SUPPORT_TOLERANCE = 3.0
+
+
+class ContactGraph:
+    """
+    Stütz-Kontakte zwischen Objekten: welches Objekt steht auf welchem
+    
+    Kontakte werden von move_with_collision() eingetragen, sobald ein Objekt auf
+    einem anderen landet. Bewegt sich ein tragendes Objekt (z.B. eine Plattform),
+    werden alle darauf stehenden Objekte in topologischer Reihenfolge mitbewegt -
+    auch Stapel (Kiste auf Kiste auf Plattform) in einem Durchgang.
+    Der Aufwand ist proportional zur Anzahl der Kontakte, nicht der Objekte.
+    """
+    
+    def __init__(self):
+        # Stehendes Objekt -> tragendes Objekt
+        self._supports: Dict[GameObject, GameObject] = {}
+        # Tragendes Objekt -> Position zu Frame-Beginn (bzw. beim Eintragen des Kontakts)
+        self._start_positions: Dict[GameObject, Tuple[float, float]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._supports)
+    
+    def support_of(self, rider: GameObject) -> Optional[GameObject]:
+        """Gibt das Objekt zurück, auf dem rider steht (oder None)"""
+        return self._supports.get(rider)
+    
+    @staticmethod
+    def is_standing_on(rider: GameObject, support: GameObject) -> bool:
+        """Prüft ob rider (mit Toleranz) auf support steht und sich horizontal überlappt"""
+        rider_left = rider._collider_x
+        support_left = support._collider_x
+        if not (rider_left < support_left + support._collider_width and
+                rider_left + rider._collider_width > support_left):
+            return False
+        rider_bottom = rider._collider_y + rider._collider_height
+        support_top = support._collider_y
+        return support_top - SUPPORT_TOLERANCE <= rider_bottom <= support_top + SUPPORT_TOLERANCE
+    
+    def add_contact(self, rider: GameObject, support: GameObject):
+        """Trägt ein: rider steht auf support"""
+        if rider is support:
+            return
+        self._supports[rider] = support
+        # Noch keine Startposition: ab jetzt zählt jede Bewegung des Trägers
+        if support not in self._start_positions:
+            self._start_positions[support] = (support.x, support.y)
+    
+    def remove(self, obj: GameObject):
+        """Entfernt alle Kontakte eines Objekts (als stehendes und tragendes Objekt)"""
+        self._supports.pop(obj, None)
+        self._start_positions.pop(obj, None)
+        riders = [rider for rider, support in self._supports.items() if support is obj]
+        for rider in riders:
+            del self._supports[rider]
+    
+    def clear(self):
+        """Entfernt alle Kontakte"""
+        self._supports.clear()
+        self._start_positions.clear()
+    
+    def begin_frame(self):
+        """
+        Wird zu Frame-Beginn aufgerufen: verwirft Kontakte, die nicht mehr bestehen
+        (abgesprungen, heruntergelaufen) und merkt sich die Startpositionen der Träger
+        """
+        start_positions = {}
+        for rider, support in list(self._supports.items()):
+            if not self.is_standing_on(rider, support):
+                del self._supports[rider]
+                continue
+            start_positions[support] = (support.x, support.y)
+        self._start_positions = start_positions
+    
+    def propagate(self):
+        """
+        Bewegt alle stehenden Objekte um die Bewegung ihres Trägers in diesem Frame mit
+        
+        Träger werden vor ihren Mitfahrern verarbeitet (Breitensuche ab den untersten
+        Trägern), damit mitbewegte Objekte ihre Bewegung direkt weitergeben.
+        """
+        if not self._supports:
+            return
+        riders_by_support: Dict[GameObject, List[GameObject]] = {}
+        for rider, support in self._supports.items():
+            riders_by_support.setdefault(support, []).append(rider)
+        
+        # Unterste Träger: stehen selbst auf nichts (Zyklen werden so ignoriert)
+        queue = [support for support in riders_by_support if support not in self._supports]
+        for support in queue:  # queue wächst während der Schleife (Breitensuche)
+            start = self._start_positions.get(support)
+            if start is None:
+                continue
+            dx = support.x - start[0]
+            dy = support.y - start[1]
+            moved = abs(dx) > 0.01 or abs(dy) > 0.01
+            for rider in riders_by_support[support]:
+                if moved:
+                    rider.x += dx
+                    rider.y += dy
+                if rider in riders_by_support:
+                    queue.append(rider)
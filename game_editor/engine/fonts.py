@@ -0,0 +1,92 @@
+"""
+Schrift-Cache für Debug-Anzeigen
+
+pygame.font.Font() lädt die Schrift jedes Mal neu - das darf nicht pro Objekt
+und Frame passieren. Schriften werden hier einmal pro (Name, Größe) erzeugt,
+einzelne Zeichen werden einmal gerendert und danach nur noch geblittet.
+"""
+from typing import Dict, Optional, Tuple
+import pygame
+
+
+_font_cache: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+
+def get_font(size: int = 24, name: Optional[str] = None) -> pygame.font.Font:
+    """
+    Gibt eine (gecachte) Schrift zurück
+
+    Args:
+        size: Schriftgröße in Pixeln
+        name: Pfad zur Schriftdatei (None = Pygame-Standardschrift)
+
+    Returns:
+        pygame.font.Font
+    """
+    key = (name, size)
+    font = _font_cache.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(name, size)
+        _font_cache[key] = font
+    return font
+
+
+def clear_font_cache():
+    """
+    Leert den Schrift-Cache
+
+    WICHTIG: Vor pygame.quit() aufrufen - danach sind die Font-Objekte ungültig.
+    """
+    _font_cache.clear()
+
+
+class GlyphText:
+    """
+    Zeichnet häufig wechselnde Texte (z.B. "FPS: 60") aus gecachten Zeichen
+
+    Jedes Zeichen wird nur einmal gerendert. Ein neuer Text kostet danach
+    nur noch ein paar Blits statt eines font.render()-Aufrufs.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int] = (255, 255, 255)):
+        """
+        Args:
+            font: Schrift für die Zeichen
+            color: Textfarbe
+        """
+        self.font = font
+        self.color = color
+        self._glyphs: Dict[str, pygame.Surface] = {}
+
+    def glyph(self, char: str) -> pygame.Surface:
+        """Gibt das gerenderte Zeichen zurück (aus dem Cache)"""
+        surface = self._glyphs.get(char)
+        if surface is None:
+            surface = self.font.render(char, True, self.color)
+            self._glyphs[char] = surface
+        return surface
+
+    def draw(self, screen: pygame.Surface, text: str, pos: Tuple[int, int]) -> int:
+        """
+        Zeichnet den Text an der Position
+
+        Args:
+            screen: Pygame Surface zum Zeichnen
+            text: Anzuzeigender Text
+            pos: Linke obere Ecke
+
+        Returns:
+            Breite des gezeichneten Texts in Pixeln
+        """
+        x, y = pos
+        start_x = x
+        batch = []
+        for char in text:
+            surface = self.glyph(char)
+            batch.append((surface, (x, y)))
+            x += surface.get_width()
+        if batch:
+            screen.blits(batch, doreturn=False)
+        return x - start_x
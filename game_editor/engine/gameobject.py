@@ -2,15 +2,40 @@
 GameObject - Repräsentiert ein Objekt im Spiel
 """
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 import pygame
-from ..utils.image_fixer import fix_iccp_profile
+from .sprite_cache import load_sprite_surface
+from .project_context import ProjectContext
+from .fonts import get_font
+from .world import TransformStore, get_shared_store
+
+if TYPE_CHECKING:
+    from .sprite_cache import SpriteCache
 
 
 class GameObject:
-    """Ein Spielobjekt mit Position, Größe, Sprite und Collider"""
+    """
+    Ein Spielobjekt mit Position, Größe, Sprite und Collider
+    
+    Position, Größe und Kollisionsbox liegen nicht im Objekt selbst, sondern im
+    TransformStore der Szene (siehe world.py). Das Objekt ist nur eine Ansicht
+    auf seinen Slot - obj.x, obj.y und objekt.x += 4 funktionieren wie gewohnt.
+    
+    WICHTIG: Schüler-Code darf weiterhin eigene Attribute setzen (z.B.
+    spieler.leben = 3). Dafür gibt es __dict__ - es wird aber erst beim ersten
+    eigenen Attribut angelegt.
+    """
+    
+    __slots__ = ("id", "type", "_store", "_slot", "_xs", "_ys",
+                 "_spatial_index", "_index_order", "_is_static", "visible", "_sprite_path", "_sprite_surface",
+                 "_collider_enabled", "_collider_type", "is_ground", "is_camera",
+                 "_all_objects", "_objects_by_id", "_debug_label", "_debug_label_id",
+                 "_pool_key", "__dict__", "__weakref__")
     
-    def __init__(self, data: Dict[str, Any], project_dir: Path, sprite_size: Optional[int] = None):
+    def __init__(self, data: Dict[str, Any], project_dir: Path, sprite_size: Optional[int] = None,
+                 sprite_cache: Optional['SpriteCache'] = None,
+                 context: Optional[ProjectContext] = None,
+                 store: Optional[TransformStore] = None):
         """
         Erstellt ein GameObject aus JSON-Daten
         
@@ -18,10 +43,27 @@ class GameObject:
             data: Objekt-Daten aus JSON (id, type, x, y, width, height, sprite, collider)
             project_dir: Projektverzeichnis für relative Pfade
             sprite_size: Sprite-Größe aus Projekteinstellungen (wird automatisch geladen wenn None)
+            sprite_cache: Gemeinsamer Sprite-Cache (None = aus context oder Sprite einzeln laden)
+            context: Projekt-Kontext (liefert Sprite-Größe und Cache ohne erneutes Datei-Lesen)
+            store: Speicher für Position/Größe (None = gemeinsamer Standard-Speicher)
         """
+        # Slot im Speicher - WICHTIG: Muss vor allen Positions-/Größen-Attributen stehen
+        self._store = store if store is not None else get_shared_store()
+        self._slot = self._store.allocate()
+        # Spalten für x/y direkt merken (häufigster Zugriff, spart einen Attribut-Zugriff)
+        self._xs = self._store.x
+        self._ys = self._store.y
+        
         self.id: str = data.get("id", "unknown")
         self.type: str = data.get("type", "sprite")
         
+        # Räumlicher Index (wird von der API gesetzt, siehe collision.SpatialHash)
+        # WICHTIG: Muss vor x/y gesetzt werden, da die Setter den Index benachrichtigen
+        self._spatial_index = None
+        self._index_order: int = 0  # Reihenfolge in der Objekt-Liste (für Index-Abfragen)
+        self._is_static: bool = False  # Teil der statischen Kollisionsebene (siehe StaticGeometry)
+        self._pool_key = None  # Vorlage bei gespawnten Objekten (für Wiederverwendung, siehe api.spawn_object)
+        
         # Position und Größe
         self.x: float = float(data.get("x", 0))
         self.y: float = float(data.get("y", 0))
@@ -32,22 +74,14 @@ class GameObject:
         self.visible: bool = data.get("visible", True)
         
         # Sprite-Größe aus Projekteinstellungen laden (falls nicht übergeben)
-        if sprite_size is None:
-            try:
-                import json
-                project_file = project_dir / "project.json"
-                if project_file.exists():
-                    with open(project_file, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                    sprite_size_config = config.get("sprite_size", 64)
-                    if isinstance(sprite_size_config, dict):
-                        sprite_size = sprite_size_config.get("width", sprite_size_config.get("size", 64))
-                    else:
-                        sprite_size = sprite_size_config if isinstance(sprite_size_config, int) else 64
-                else:
-                    sprite_size = 64  # Standard
-            except Exception:
-                sprite_size = 64  # Standard bei Fehler
+        # Mit Kontext wird project.json nur einmal pro Spielstart gelesen
+        if context is not None:
+            if sprite_size is None:
+                sprite_size = context.sprite_size
+            if sprite_cache is None:
+                sprite_cache = context.sprite_cache
+        elif sprite_size is None:
+            sprite_size = ProjectContext(project_dir).sprite_size
         
         # Sprite laden
         self._sprite_path: Optional[str] = data.get("sprite")
@@ -56,21 +90,13 @@ class GameObject:
             sprite_full_path = project_dir / self._sprite_path
             if sprite_full_path.exists():
                 try:
-                    # libpng Warnungen unterdrücken (iCCP: known incorrect sRGB profile)
-                    # iCCP-Profil-Korrektur für PNG-Bilder (behebt libpng-Warnung dauerhaft)
-                    if sprite_full_path.suffix.lower() == '.png':
-                        fix_iccp_profile(sprite_full_path, backup=False)
-                    
-                    # Sprite laden (nach iCCP-Korrektur sollte keine Warnung mehr erscheinen)
-                    self._sprite_surface = pygame.image.load(str(sprite_full_path)).convert_alpha()
-                    # Immer auf die Projekteinstellungs-Größe skalieren
+                    # Sprite laden und auf die Projekteinstellungs-Größe skalieren
+                    # Mit Cache teilen sich alle Objekte mit gleichem Sprite eine Surface
                     target_size = int(sprite_size)
-                    if self._sprite_surface.get_width() != target_size or \
-                       self._sprite_surface.get_height() != target_size:
-                        self._sprite_surface = pygame.transform.scale(
-                            self._sprite_surface, 
-                            (target_size, target_size)
-                        )
+                    if sprite_cache is not None:
+                        self._sprite_surface = sprite_cache.get(sprite_full_path, target_size)
+                    else:
+                        self._sprite_surface = load_sprite_surface(sprite_full_path, target_size)
                 except Exception as e:
                     print(f"Warnung: Sprite {self._sprite_path} konnte nicht geladen werden: {e}")
         
@@ -126,6 +152,12 @@ class GameObject:
         
         # Referenz zu allen Objekten (für collides_with)
         self._all_objects: list['GameObject'] = []
+        # ID-Index der API (ID -> GameObject), wird beim Registrieren gesetzt
+        self._objects_by_id: Optional[Dict[str, 'GameObject']] = None
+        
+        # Gerendertes ID-Label für den Debug-Modus (wird neu erzeugt, wenn sich die ID ändert)
+        self._debug_label: Optional[pygame.Surface] = None
+        self._debug_label_id: Optional[str] = None
     
     def set_all_objects(self, objects: list['GameObject']):
         """Setzt die Liste aller Objekte (für Kollisionserkennung)"""
@@ -141,15 +173,102 @@ class GameObject:
         """Setzt einen neuen Sprite (relativer Pfad)"""
         self._sprite_path = path
     
+    @property
+    def x(self) -> float:
+        """X-Position des Objekts"""
+        return self._xs[self._slot]
+    
+    @x.setter
+    def x(self, value: float):
+        self._xs[self._slot] = value
+        # Räumlichen Index über Positionsänderung informieren
+        if self._spatial_index is not None:
+            self._spatial_index.update(self)
+    
+    @property
+    def y(self) -> float:
+        """Y-Position des Objekts"""
+        return self._ys[self._slot]
+    
+    @y.setter
+    def y(self, value: float):
+        self._ys[self._slot] = value
+        # Räumlichen Index über Positionsänderung informieren
+        if self._spatial_index is not None:
+            self._spatial_index.update(self)
+    
+    @property
+    def width(self) -> float:
+        """Breite des Objekts"""
+        return self._store.width[self._slot]
+    
+    @width.setter
+    def width(self, value: float):
+        self._store.width[self._slot] = value
+    
+    @property
+    def height(self) -> float:
+        """Höhe des Objekts"""
+        return self._store.height[self._slot]
+    
+    @height.setter
+    def height(self, value: float):
+        self._store.height[self._slot] = value
+    
+    @property
+    def _collider_offset_x(self) -> float:
+        """X-Offset der Kollisionsbox (relativ zum Objekt)"""
+        return self._store.collider_offset_x[self._slot]
+    
+    @_collider_offset_x.setter
+    def _collider_offset_x(self, value: float):
+        self._store.collider_offset_x[self._slot] = value
+    
+    @property
+    def _collider_offset_y(self) -> float:
+        """Y-Offset der Kollisionsbox (relativ zum Objekt)"""
+        return self._store.collider_offset_y[self._slot]
+    
+    @_collider_offset_y.setter
+    def _collider_offset_y(self, value: float):
+        self._store.collider_offset_y[self._slot] = value
+    
+    @property
+    def _collider_width(self) -> float:
+        """Breite der Kollisionsbox"""
+        return self._store.collider_width[self._slot]
+    
+    @_collider_width.setter
+    def _collider_width(self, value: float):
+        self._store.collider_width[self._slot] = value
+    
+    @property
+    def _collider_height(self) -> float:
+        """Höhe der Kollisionsbox"""
+        return self._store.collider_height[self._slot]
+    
+    @_collider_height.setter
+    def _collider_height(self, value: float):
+        self._store.collider_height[self._slot] = value
+    
     @property
     def _collider_x(self) -> float:
         """Gibt die absolute X-Position der Kollisionsbox zurück (dynamisch berechnet)"""
-        return self.x + self._collider_offset_x
+        slot = self._slot
+        return self._xs[slot] + self._store.collider_offset_x[slot]
     
     @property
     def _collider_y(self) -> float:
         """Gibt die absolute Y-Position der Kollisionsbox zurück (dynamisch berechnet)"""
-        return self.y + self._collider_offset_y
+        slot = self._slot
+        return self._ys[slot] + self._store.collider_offset_y[slot]
+    
+    def __del__(self):
+        # Slot im Speicher freigeben (wird für neue Objekte wiederverwendet)
+        try:
+            self._store.release(self._slot)
+        except AttributeError:
+            pass
     
     def collides_with(self, other_id: str) -> bool:
         """
@@ -164,28 +283,42 @@ class GameObject:
         if not self._collider_enabled:
             return False
         
-        # Anderes Objekt finden
-        other = None
-        for obj in self._all_objects:
-            if obj.id == other_id and obj._collider_enabled:
-                other = obj
-                break
-        
-        if other is None:
-            return False
+        # Anderes Objekt finden (über ID-Index, sonst lineare Suche)
+        if self._objects_by_id is not None:
+            other = self._objects_by_id.get(other_id)
+            if other is None or not other._collider_enabled:
+                return False
+        else:
+            other = None
+            for obj in self._all_objects:
+                if obj.id == other_id and obj._collider_enabled:
+                    other = obj
+                    break
+            
+            if other is None:
+                return False
         
         # AABB Collision Detection mit Kollisionsboxen
-        # Verwende Kollisionsbox-Positionen und -Größen
-        return (self._collider_x < other._collider_x + other._collider_width and
-                self._collider_x + self._collider_width > other._collider_x and
-                self._collider_y < other._collider_y + other._collider_height and
-                self._collider_y + self._collider_height > other._collider_y)
+        # Verwende Kollisionsbox-Positionen und -Größen (direkt aus den Spalten des Speichers)
+        store, slot = self._store, self._slot
+        other_store, other_slot = other._store, other._slot
+        left = store.x[slot] + store.collider_offset_x[slot]
+        top = store.y[slot] + store.collider_offset_y[slot]
+        other_left = other_store.x[other_slot] + other_store.collider_offset_x[other_slot]
+        other_top = other_store.y[other_slot] + other_store.collider_offset_y[other_slot]
+        return (left < other_left + other_store.collider_width[other_slot] and
+                left + store.collider_width[slot] > other_left and
+                top < other_top + other_store.collider_height[other_slot] and
+                top + store.collider_height[slot] > other_top)
     
     def destroy(self):
         """Markiert das Objekt zum Entfernen"""
         self.visible = False
         # Objekt wird in der nächsten Update-Phase aus der Liste entfernt
     
+    # Deutsche Methoden-Aliase
+    # WICHTIG: Neue Aliase auch in api_aliases.GAMEOBJECT_METHOD_ALIASES eintragen (Übersetzer)
+    
     def kollidiert_mit(self, andere_id: str) -> bool:
         """
         Deutsche Version von collides_with()
@@ -231,15 +364,39 @@ class GameObject:
             pygame.draw.rect(screen, color, 
                            (draw_x, draw_y, int(self.width), int(self.height)))
         
+        # Debug: Collider-Box und Objekt-ID
+        if debug:
+            self.draw_debug(screen, offset_x, offset_y)
+    
+    def _visual_size(self) -> tuple:
+        """Gibt die gezeichnete Größe zurück (Sprite-Größe, sonst width/height)"""
+        if self._sprite_surface:
+            return self._sprite_surface.get_size()
+        return (self.width, self.height)
+    
+    def draw_debug(self, screen: pygame.Surface, offset_x: float = 0, offset_y: float = 0):
+        """Zeichnet Debug-Informationen (Kollisionsbox und Objekt-ID)
+        
+        Args:
+            screen: Pygame Surface zum Zeichnen
+            offset_x: X-Offset für Kamera (Standard: 0)
+            offset_y: Y-Offset für Kamera (Standard: 0)
+        """
+        if not self.visible:
+            return
+        
         # Debug: Collider-Box (rote Box für Kollisionsbox)
-        if debug and self._collider_enabled:
+        if self._collider_enabled:
+            draw_x = int(self.x + offset_x)
+            draw_y = int(self.y + offset_y)
             collider_draw_x = int(self._collider_x + offset_x)
             collider_draw_y = int(self._collider_y + offset_y)
             pygame.draw.rect(screen, (255, 0, 0), 
                            (collider_draw_x, collider_draw_y, 
                             int(self._collider_width), int(self._collider_height)), 
                            2)
-            # Objekt-ID anzeigen
-            font = pygame.font.Font(None, 24)
-            text = font.render(self.id, True, (255, 255, 255))
-            screen.blit(text, (draw_x, draw_y - 20))
+            # Objekt-ID anzeigen (Label nur neu rendern, wenn sich die ID geändert hat)
+            if self._debug_label is None or self._debug_label_id != self.id:
+                self._debug_label = get_font(24).render(self.id, True, (255, 255, 255))
+                self._debug_label_id = self.id
+            screen.blit(self._debug_label, (draw_x, draw_y - 20))
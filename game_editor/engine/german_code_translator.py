@@ -3,10 +3,19 @@ Deutscher Code-Translator - Übersetzt deutschen Code in Python
 
 Übersetzt deutsche Schlüsselwörter (definiere, wenn, für, etc.) in Python-Schlüsselwörter.
 """
+import os
 import re
-from typing import Tuple, Dict, List
+from bisect import bisect_left
+from collections.abc import Mapping
+from itertools import repeat
+from typing import Tuple, Dict, List, Optional
+from .api_aliases import API_FUNCTION_ALIASES, GAMEOBJECT_METHOD_ALIASES
 
 
+# Version der Übersetzung - bei jeder Änderung an den Übersetzungsregeln erhöhen,
+# damit zwischengespeicherter Bytecode (.cache/bytecode/) neu erzeugt wird
+TRANSLATOR_VERSION = 5
+
 # Python-Schlüsselwörter (für Validierung)
 PYTHON_KEYWORDS = {
     "def", "class", "if", "else", "elif", "for", "while",
@@ -52,27 +61,111 @@ GERMAN_TO_PYTHON = {
     "mit": "with",
 }
 
-# Mapping: Deutsche API-Funktionen → Englische API-Funktionen
-GERMAN_API_TO_ENGLISH = {
-    "hole_objekt": "get_object",
-    "hole_alle_objekte": "get_all_objects",
-    "taste_gedrückt": "key_pressed",
-    "taste_runter": "key_down",
-    "maus_position": "mouse_position",
-    "drucke_debug": "print_debug",
-    "erstelle_objekt": "spawn_object",
-    "bewege_mit_kollision": "move_with_collision",
-    "drücke_objekte": "push_objects",
-    "fixiere_y_position": "lock_y_position",
-    "entferne_y_fixierung": "unlock_y_position",
-    # GameObject-Methoden
-    "kollidiert_mit": "collides_with",
-    "zerstöre": "destroy",
-}
+# Mapping: Deutsche API-Funktionen → Englische API-Funktionen (eingetragen in api_aliases.py)
+GERMAN_API_TO_ENGLISH = {**API_FUNCTION_ALIASES, **GAMEOBJECT_METHOD_ALIASES}
 
 # Reverse-Mapping: Englische API-Funktionen → Deutsche API-Funktionen
 ENGLISH_API_TO_GERMAN = {v: k for k, v in GERMAN_API_TO_ENGLISH.items()}
 
+# Reverse-Mapping: Python → Deutsch (für Rückübersetzung)
+PYTHON_TO_GERMAN = {}
+# Für mehrdeutige Mappings (z.B. "gib_zurueck" und "gib_zurück" beide → "return")
+# Verwende die bevorzugte Version als Standard
+for german, python in GERMAN_TO_PYTHON.items():
+    if python not in PYTHON_TO_GERMAN:
+        PYTHON_TO_GERMAN[python] = german
+    # Wenn beide Versionen existieren, bevorzuge "definiere" über "funktion"
+    elif python == "def" and german == "definiere":
+        PYTHON_TO_GERMAN[python] = german  # "definiere" hat Vorrang
+    # Wenn beide Versionen existieren, bevorzuge die mit Umlaut
+    elif 'ü' in german or 'ä' in german or 'ö' in german:
+        PYTHON_TO_GERMAN[python] = german
+
+
+# Ein Durchlauf über den Code: re.split() zerlegt den Code in Tokens, jedes Token wird
+# einmal im Wörterbuch nachgeschlagen (statt einem re.sub pro Schlüsselwort).
+# Gruppe 1: f-Strings (nur die Ausdrücke in {...} werden übersetzt)
+# Gruppe 2: Namen, Attribute (.name), Strings und Kommentare (bleiben unverändert), Zahlen
+# Der Lookahead am Anfang überspringt Leerzeichen und Operatoren, ohne alle Varianten zu prüfen.
+# Ein Name direkt vor einem Anführungszeichen ist ein String-Präfix (r"...", b'...').
+# WICHTIG: Keine possessiven Quantoren (*+) - die gibt es in re erst ab Python 3.11
+_STRING_LITERAL = r'''(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"[^"\\\n]*(?:\\.[^"\\\n]*)*"|'[^'\\\n]*(?:\\.[^'\\\n]*)*')'''
+_TOKEN_PATTERN = re.compile(r'''
+    (?=[\w"'\#.])
+    (?: ([rR]?[fF][rR]?''' + _STRING_LITERAL + r''')
+      | ( [^\W\d]\w*(?![\w"'])
+        | \.[ \t]*[^\W\d]\w*
+        | [rRbBuU]{0,2}''' + _STRING_LITERAL + r'''
+        | \#[^\n]*
+        | \d\w*))
+''', re.VERBOSE)
+
+# Ersetzungsfelder in f-Strings ({ausdruck}, aber nicht {{ oder }})
+_FSTRING_FIELD_PATTERN = re.compile(r"\{\{|\}\}|\{([^{}]*)\}")
+
+# Schlüsselwörter für Erkennung und Validierung ("in", "global" sind in beiden Sprachen gleich)
+_COMMON_KEYWORDS = {"in", "global"}
+_GERMAN_KEYWORDS = frozenset(GERMAN_TO_PYTHON) - _COMMON_KEYWORDS
+_ENGLISH_KEYWORDS = frozenset(PYTHON_KEYWORDS) - _COMMON_KEYWORDS
+
+
+def _scan_keywords(code: str, forbidden: frozenset = frozenset()) -> Tuple[int, int, List[Tuple[str, int, int]]]:
+    """
+    Zählt deutsche und englische Schlüsselwörter und sucht verbotene in einem Durchlauf
+    
+    Strings und Kommentare werden übersprungen, Attribute (obj.wenn) zählen nicht.
+    In f-Strings werden die Ausdrücke in {...} mitgezählt (wie bei der Übersetzung).
+    
+    Args:
+        code: Quelltext
+        forbidden: Schlüsselwörter, die nicht vorkommen dürfen
+    
+    Returns:
+        Tuple (german_count, english_count, violations)
+        - violations: Liste von (Schlüsselwort, Zeile ab 1, Spalte ab 0), sortiert nach Position
+    """
+    german_count = 0
+    english_count = 0
+    found: List[Tuple[int, str]] = []  # (Position im Code, Schlüsselwort)
+    pending = [(code, 0)]  # Code-Stücke (Gesamt-Code und f-String-Ausdrücke) mit Position
+    while pending:
+        text, offset = pending.pop()
+        parts = _TOKEN_PATTERN.split(text)
+        tokens = parts[2::3]
+        german_count += len([token for token in tokens if token in _GERMAN_KEYWORDS])
+        english_count += len([token for token in tokens if token in _ENGLISH_KEYWORDS])
+        # Positionen werden nur gebraucht, wenn es verbotene Wörter oder f-Strings gibt
+        if forbidden.isdisjoint(tokens) and not any(parts[1::3]):
+            continue
+        position = offset
+        for index, part in enumerate(parts):
+            if not part:
+                continue
+            kind = index % 3
+            if kind == 2:
+                if part in forbidden:
+                    found.append((position, part))
+            elif kind == 1:
+                for field in _FSTRING_FIELD_PATTERN.finditer(part):
+                    if field.group(1) is not None:
+                        pending.append((field.group(1), position + field.start(1)))
+            position += len(part)
+    
+    # Positionen in Zeile/Spalte umrechnen (Zeilenumbrüche werden nur einmal gezählt)
+    found.sort()
+    violations = []
+    line = 1
+    line_start = 0
+    last_position = 0
+    for position, keyword in found:
+        newlines = code.count("\n", last_position, position)
+        if newlines:
+            line += newlines
+            line_start = code.rfind("\n", last_position, position) + 1
+        last_position = position
+        violations.append((keyword, line, position - line_start))
+    return german_count, english_count, violations
+
 
 def detect_code_language(code: str) -> str:
     """
@@ -80,40 +173,15 @@ def detect_code_language(code: str) -> str:
     
     Args:
         code: Code zum Analysieren
-        
+    
     Returns:
         "deutsch" oder "englisch" (Standard: "deutsch" wenn unklar)
     """
     if not code or not code.strip():
         return "deutsch"  # Standard
     
-    # Strings maskieren, damit Schlüsselwörter in Strings nicht gezählt werden
-    string_pattern = r'"[^"]*"|\'[^\']*\''
-    masked_code = re.sub(string_pattern, "__STRING__", code)
-    
-    # Zähle deutsche und englische Schlüsselwörter
-    german_count = 0
-    english_count = 0
-    
-    # Deutsche Schlüsselwörter zählen
-    for german_keyword in GERMAN_TO_PYTHON.keys():
-        # Überspringe gemeinsame Keywords
-        if german_keyword in {"in", "global"}:
-            continue
-        pattern = r'\b' + re.escape(german_keyword) + r'\b'
-        matches = len(re.findall(pattern, masked_code))
-        german_count += matches
-    
-    # Englische Schlüsselwörter zählen
-    for english_keyword in PYTHON_KEYWORDS:
-        # Überspringe gemeinsame Keywords
-        if english_keyword in {"in", "global"}:
-            continue
-        # Überspringe Keywords die auch in GERMAN_TO_PYTHON.values() vorkommen
-        # (weil die schon übersetzt sein könnten)
-        pattern = r'\b' + re.escape(english_keyword) + r'\b'
-        matches = len(re.findall(pattern, masked_code))
-        english_count += matches
+    # Zähle deutsche und englische Schlüsselwörter (Strings und Kommentare zählen nicht)
+    german_count, english_count, _ = _scan_keywords(code)
     
     # Entscheidung: Welche Sprache dominiert?
     if german_count > english_count:
@@ -125,6 +193,36 @@ def detect_code_language(code: str) -> str:
         return "deutsch"
 
 
+def find_language_violations(code: str, expected_language: str) -> List[Tuple[int, int, str]]:
+    """
+    Sucht alle Schlüsselwörter der falschen Sprache
+    
+    Args:
+        code: Code zum Validieren
+        expected_language: "deutsch" oder "englisch"
+    
+    Returns:
+        Liste von (Zeile ab 1, Spalte ab 1, Fehlermeldung), sortiert nach Position
+        (leer wenn der Code die richtige Sprache verwendet)
+    """
+    if not code or not code.strip():
+        return []
+    
+    if expected_language == "deutsch":
+        # Fehler wenn englische Schlüsselwörter gefunden werden
+        message = "Englisches Schlüsselwort '{}' gefunden. Bitte verwende die deutsche Version."
+        forbidden = _ENGLISH_KEYWORDS
+    elif expected_language == "englisch":
+        # Fehler wenn deutsche Schlüsselwörter gefunden werden
+        message = "Deutsches Schlüsselwort '{}' gefunden. Bitte verwende die englische Version."
+        forbidden = _GERMAN_KEYWORDS
+    else:
+        return []  # Unbekannte Sprache = keine Validierung
+    
+    _, _, violations = _scan_keywords(code, forbidden)
+    return [(line, column + 1, message.format(keyword)) for keyword, line, column in violations]
+
+
 def validate_code_language(code: str, expected_language: str) -> Tuple[bool, str, int]:
     """
     Validiert ob Code die erwartete Sprache verwendet
@@ -132,62 +230,310 @@ def validate_code_language(code: str, expected_language: str) -> Tuple[bool, str
     Args:
         code: Code zum Validieren
         expected_language: "deutsch" oder "englisch"
-        
+    
     Returns:
         Tuple (is_valid, error_message, error_line)
         - is_valid: True wenn Code die richtige Sprache verwendet
-        - error_message: Fehlermeldung wenn falsch
+        - error_message: Fehlermeldung wenn falsch (erstes falsches Schlüsselwort)
         - error_line: Zeile mit Fehler (0 wenn kein Fehler)
     """
-    if not code or not code.strip():
-        return True, "", 0
+    violations = find_language_violations(code, expected_language)
+    if violations:
+        line, _, error_message = violations[0]
+        return False, error_message, line
+    return True, "", 0
+
+
+def _token_table(keywords: Dict[str, str], api_names: Dict[str, str]) -> Dict[str, str]:
+    """
+    Baut das Wörterbuch Token -> Ersatz für _translate_tokens()
     
-    # Schlüsselwörter die in beiden Sprachen gleich sind (nicht validieren)
-    # "in", "global" sind in beiden Sprachen gleich
-    common_keywords = {"in", "global"}
+    Schlüsselwörter werden nach einem Punkt nicht ersetzt (dort stehen nur Attribute),
+    API-Namen schon (z.B. spieler.zerstöre() -> spieler.destroy()).
+    """
+    table = {**keywords, **api_names}
+    table.update({"." + name: "." + replacement for name, replacement in api_names.items()})
+    return table
+
+
+def _translate_tokens(code: str, table: Dict[str, str]) -> str:
+    """
+    Ersetzt alle Tokens aus `table` in einem Durchlauf (Strings und Kommentare bleiben unverändert)
     
-    if expected_language == "deutsch":
-        # Code sollte deutsche Schlüsselwörter verwenden
-        # Fehler wenn englische Schlüsselwörter gefunden werden
-        lines = code.split('\n')
-        for line_num, line in enumerate(lines, start=1):
-            # Strings maskieren
-            string_pattern = r'"[^"]*"|\'[^\']*\''
-            masked_line = re.sub(string_pattern, "__STRING__", line)
-            
-            # Prüfe auf englische Schlüsselwörter (außer gemeinsame)
-            for keyword in PYTHON_KEYWORDS:
-                if keyword in common_keywords:
-                    continue  # Überspringen
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, masked_line):
-                    return False, f"Englisches Schlüsselwort '{keyword}' gefunden. Bitte verwende die deutsche Version.", line_num
-        
-        return True, "", 0
+    Args:
+        code: Quelltext
+        table: Token -> Ersatz (siehe _token_table())
     
-    elif expected_language == "englisch":
-        # Code sollte englische Schlüsselwörter verwenden
-        # Fehler wenn deutsche Schlüsselwörter gefunden werden
-        lines = code.split('\n')
-        for line_num, line in enumerate(lines, start=1):
-            # Strings maskieren
-            string_pattern = r'"[^"]*"|\'[^\']*\''
-            masked_line = re.sub(string_pattern, "__STRING__", line)
-            
-            # Prüfe auf deutsche Schlüsselwörter (außer gemeinsame)
-            for german_keyword in GERMAN_TO_PYTHON.keys():
-                if german_keyword in common_keywords:
-                    continue  # Überspringen
-                pattern = r'\b' + re.escape(german_keyword) + r'\b'
-                if re.search(pattern, masked_line):
-                    return False, f"Deutsches Schlüsselwort '{german_keyword}' gefunden. Bitte verwende die englische Version.", line_num
+    Returns:
+        Übersetzter Code
+    """
+    return _translate_parts(_TOKEN_PATTERN.split(code), table)
+
+
+def _translate_parts(parts: List[Optional[str]], table: Dict[str, str]) -> str:
+    """
+    Wie _translate_tokens(), aber mit schon zerlegtem Code (Ergebnis von _TOKEN_PATTERN.split())
+    
+    split() liefert: Text, f-String, Token, Text, f-String, Token, ..., Text
+    (die jeweils nicht passende Gruppe ist None). `parts` wird dabei verändert.
+    """
+    get = table.get
+    parts[2::3] = [get(token, token) or "" for token in parts[2::3]]
+    parts[1::3] = [_translate_fstring(fstring, table) if fstring else "" for fstring in parts[1::3]]
+    return "".join(parts)
+
+
+def _translate_fstring(fstring: str, table: Dict[str, str]) -> str:
+    """Übersetzt die Ausdrücke in den {...}-Feldern eines f-Strings"""
+    def replace_field(field) -> str:
+        expression = field.group(1)
+        if expression is None:
+            return field.group(0)
+        return "{" + _translate_tokens(expression, table) + "}"
+    
+    return _FSTRING_FIELD_PATTERN.sub(replace_field, fstring)
+
+
+def _collect_replacements(code: str, table: Dict[str, str], offset: int,
+                          replacements: List[Tuple[int, int, int]]):
+    """
+    Sammelt die Ersetzungen, die _translate_tokens() vornimmt (gleiche Zerlegung)
+    
+    Args:
+        code: Quelltext
+        table: Token -> Ersatz
+        offset: Position von `code` im gesamten Quelltext (für f-String-Ausdrücke)
+        replacements: Liste für (Position im Original, Länge Original, Länge Ersatz)
+    """
+    position = offset
+    for index, part in enumerate(_TOKEN_PATTERN.split(code)):
+        if not part:
+            continue
+        kind = index % 3
+        if kind == 2:
+            replacement = table.get(part)
+            if replacement is not None:
+                if part[0] == ".":
+                    # Attribut: Der Punkt bleibt stehen
+                    replacements.append((position + 1, len(part) - 1, len(replacement) - 1))
+                else:
+                    replacements.append((position, len(part), len(replacement)))
+        elif kind == 1:
+            for field in _FSTRING_FIELD_PATTERN.finditer(part):
+                if field.group(1) is not None:
+                    _collect_replacements(field.group(1), table, position + field.start(1), replacements)
+        position += len(part)
+
+
+class PositionMap(Mapping):
+    """
+    Positionen im übersetzten Code → Positionen im Original-Code
+    
+    Die Übersetzung ersetzt nur Wörter innerhalb einer Zeile, Zeilennummern bleiben
+    gleich. Als Mapping verhält sich die Klasse wie das bisherige Zeilen-Mapping
+    (Python-Zeile → Original-Zeile), source_position() rechnet zusätzlich Spalten um.
+    
+    WICHTIG: Die Spalten werden erst bei der ersten Abfrage (z.B. für eine
+    Fehlermeldung) berechnet - die Übersetzung selbst bleibt ein einziger Durchlauf.
+    """
+    
+    __slots__ = ("num_lines", "_source", "_table", "_replacements", "_line_starts")
+    
+    def __init__(self, num_lines: int, source: str = "", table: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            num_lines: Anzahl Zeilen
+            source: Original-Code
+            table: Wörterbuch der Übersetzung (None = Code wurde nicht übersetzt)
+        """
+        self.num_lines = num_lines
+        self._source = source
+        self._table = table
+        self._replacements: Optional[List[Tuple[int, int, int]]] = None
+        self._line_starts: Optional[List[int]] = None
+    
+    def __getitem__(self, line: int) -> int:
+        if isinstance(line, int) and 1 <= line <= self.num_lines:
+            return line
+        raise KeyError(line)
+    
+    def __iter__(self):
+        return iter(range(1, self.num_lines + 1))
+    
+    def __len__(self) -> int:
+        return self.num_lines
+    
+    def source_position(self, line: int, column: int) -> Tuple[int, int]:
+        """
+        Rechnet eine Position im übersetzten Code in den Original-Code um
+        
+        Args:
+            line: Zeile im übersetzten Code (ab 1)
+            column: Spalte im übersetzten Code (ab 0, wie bei ast/tokenize)
         
-        return True, "", 0
+        Returns:
+            Tuple (Zeile, Spalte) im Original-Code (innerhalb eines ersetzten Worts: dessen Anfang)
+        """
+        if self._replacements is None:
+            self._replacements = []
+            if self._table is not None:
+                _collect_replacements(self._source, self._table, 0, self._replacements)
+            self._line_starts = [0]
+            position = self._source.find("\n")
+            while position != -1:
+                self._line_starts.append(position + 1)
+                position = self._source.find("\n", position + 1)
+        if not 1 <= line <= len(self._line_starts):
+            return line, column
+        line_start = self._line_starts[line - 1]
+        line_end = self._line_starts[line] if line < len(self._line_starts) else len(self._source) + 1
+        delta = 0  # Python-Spalte minus Original-Spalte (durch Ersetzungen davor in der Zeile)
+        index = bisect_left(self._replacements, (line_start,))
+        for start, source_length, python_length in self._replacements[index:]:
+            if start >= line_end:
+                break
+            python_column = start - line_start + delta
+            if column < python_column:
+                break
+            if column < python_column + python_length:
+                return line, start - line_start
+            delta += python_length - source_length
+        return line, column - delta
+
+
+# Ab dieser Gesamtgröße (Zeichen) übersetzt translate_many() automatisch mit mehreren
+# Prozessen - darunter kostet das Starten der Prozesse mehr, als es spart
+PARALLEL_MIN_CHARS = 8_000_000
+
+
+class TranslatorEngine:
+    """
+    Übersetzer Deutsch ↔ Python mit fertig aufgebauten Tabellen
+    
+    Die Tabellen (Schlüsselwörter und API-Namen in beide Richtungen) werden einmal
+    beim Erstellen aufgebaut und für alle Übersetzungen wiederverwendet. Das Modul
+    hat eine gemeinsame Instanz (get_translator()), die translate_code() und
+    translate_code_reverse() verwenden.
+    """
     
-    return True, "", 0  # Unbekannte Sprache = keine Validierung
+    def __init__(self, keywords: Optional[Dict[str, str]] = None,
+                 api_names: Optional[Dict[str, str]] = None,
+                 reverse_keywords: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            keywords: Deutsch → Python Schlüsselwörter (Standard: GERMAN_TO_PYTHON)
+            api_names: Deutsch → Englisch API-Namen (Standard: GERMAN_API_TO_ENGLISH)
+            reverse_keywords: Python → Deutsch Schlüsselwörter (Standard: PYTHON_TO_GERMAN)
+        """
+        keywords = GERMAN_TO_PYTHON if keywords is None else keywords
+        api_names = GERMAN_API_TO_ENGLISH if api_names is None else api_names
+        reverse_keywords = PYTHON_TO_GERMAN if reverse_keywords is None else reverse_keywords
+        # Deutsch → Python
+        self.to_python_table = _token_table(keywords, api_names)
+        # Python → Deutsch ("in", "global" bleiben unverändert)
+        self.to_german_table = _token_table(
+            {python: german for python, german in reverse_keywords.items() if python not in _COMMON_KEYWORDS},
+            {english: german for german, english in api_names.items()})
+        # Python-Schlüsselwörter ohne deutsche Version (Rückübersetzung nicht möglich)
+        self.untranslatable = frozenset(_ENGLISH_KEYWORDS - reverse_keywords.keys())
+    
+    def to_python(self, german_code: str) -> Tuple[str, PositionMap]:
+        """
+        Übersetzt deutschen Code in Python-Code
+    
+        Returns:
+            Tuple (python_code, line_mapping) - siehe translate_code()
+        """
+        if not german_code or not german_code.strip():
+            return german_code, PositionMap(0)
+        # WICHTIG: Es werden ganze Namen nachgeschlagen - "mit" in "bewege_mit_kollision" bleibt unverändert
+        python_code = _translate_tokens(german_code, self.to_python_table)
+        return python_code, PositionMap(german_code.count('\n') + 1, german_code, self.to_python_table)
+    
+    def to_german(self, python_code: str) -> Tuple[str, bool, str]:
+        """
+        Übersetzt Python-Code in deutschen Code (ein Durchlauf)
+    
+        Returns:
+            Tuple (translated_code, success, error_message) - siehe translate_code_reverse()
+        """
+        if not python_code or not python_code.strip():
+            return python_code, True, ""
+    
+        parts = _TOKEN_PATTERN.split(python_code)
+    
+        # Prüfe ob alle Keywords übersetzbar sind (sonst Code unverändert lassen)
+        if not self.untranslatable.isdisjoint(parts[2::3]):
+            untranslatable_keywords = dict.fromkeys(
+                token for token in parts[2::3] if token in self.untranslatable)
+            error_msg = f"Vollständige Übersetzung nicht möglich. Nicht übersetzbare Schlüsselwörter: {', '.join(untranslatable_keywords)}"
+            return python_code, False, error_msg
+    
+        return _translate_parts(parts, self.to_german_table), True, ""
+    
+    def translate(self, code: str, from_language: str, to_language: str) -> Tuple[str, bool, str]:
+        """
+        Übersetzt Code von einer Sprache in die andere
+    
+        Args:
+            code: Quelltext
+            from_language: "deutsch" oder "englisch"
+            to_language: "deutsch" oder "englisch"
+    
+        Returns:
+            Tuple (translated_code, success, error_message)
+        """
+        if from_language == to_language:
+            return code, True, ""
+        if to_language == "englisch":
+            return self.to_python(code)[0], True, ""
+        if to_language == "deutsch":
+            return self.to_german(code)
+        return code, False, f"Unbekannte Zielsprache: {to_language}"
+    
+    def translate_many(self, sources: Dict[str, str], from_language: str, to_language: str,
+                       processes: Optional[int] = None) -> Dict[str, Tuple[str, bool, str]]:
+        """
+        Übersetzt viele Skripte auf einmal (z.B. alle Codes eines Projekts beim Sprachwechsel)
+    
+        Args:
+            sources: Name -> Quelltext (z.B. "game.py" oder Objekt-ID)
+            from_language: "deutsch" oder "englisch"
+            to_language: "deutsch" oder "englisch"
+            processes: Anzahl Prozesse (None = automatisch, mehrere nur bei sehr großen
+                       Projekten ab PARALLEL_MIN_CHARS; 1 = immer im aktuellen Prozess)
+    
+        Returns:
+            Dict Name -> (translated_code, success, error_message)
+        """
+        if processes is None:
+            total_chars = sum(len(code) for code in sources.values() if code)
+            processes = (os.cpu_count() or 1) if total_chars >= PARALLEL_MIN_CHARS else 1
+        if processes > 1 and len(sources) > 1:
+            # Erst hier importieren - der Import kostet beim Start des Spiels sonst Zeit
+            from concurrent.futures import ProcessPoolExecutor
+            try:
+                with ProcessPoolExecutor(max_workers=processes) as pool:
+                    chunksize = max(1, len(sources) // (processes * 4))
+                    results = pool.map(self.translate, sources.values(), repeat(from_language),
+                                       repeat(to_language), chunksize=chunksize)
+                    return dict(zip(sources, results))
+            except (OSError, RuntimeError) as e:
+                # z.B. keine Prozesse erlaubt - dann eben im aktuellen Prozess
+                print(f"WARNUNG: Übersetzung mit mehreren Prozessen nicht möglich: {e}")
+        return {name: self.translate(code, from_language, to_language) for name, code in sources.items()}
+
 
+# Gemeinsamer Übersetzer (Tabellen werden beim Import einmal aufgebaut)
+_TRANSLATOR = TranslatorEngine()
 
-def translate_code(german_code: str, validate_language: bool = False, expected_language: str = "deutsch") -> Tuple[str, Dict[int, int], Tuple[bool, str, int]]:
+
+def get_translator() -> TranslatorEngine:
+    """Gibt den gemeinsamen Übersetzer zurück"""
+    return _TRANSLATOR
+
+
+def translate_code(german_code: str, validate_language: bool = False, expected_language: str = "deutsch") -> Tuple[str, PositionMap, Tuple[bool, str, int]]:
     """
     Übersetzt deutschen Code in Python-Code
     
@@ -195,14 +541,15 @@ def translate_code(german_code: str, validate_language: bool = False, expected_l
         german_code: Code mit deutschen Schlüsselwörtern
         validate_language: Wenn True, wird geprüft ob Code die richtige Sprache verwendet
         expected_language: "deutsch" oder "englisch" (für Validierung)
-        
+    
     Returns:
         Tuple (python_code, line_mapping, validation_result)
         - python_code: Übersetzter Python-Code (oder original wenn englisch)
-        - line_mapping: Mapping von Python-Zeile → Deutsch-Zeile
+        - line_mapping: Python-Zeile → Deutsch-Zeile (PositionMap, rechnet auch Spalten um)
         - validation_result: Tuple (is_valid, error_message, error_line)
     
-    WICHTIG: Strings werden maskiert und bleiben unverändert!
+    WICHTIG: Strings und Kommentare bleiben unverändert! In f-Strings werden nur die
+    Ausdrücke in {...} übersetzt.
     """
     # Validierung (wenn aktiviert)
     validation_result = (True, "", 0)
@@ -210,105 +557,19 @@ def translate_code(german_code: str, validate_language: bool = False, expected_l
         validation_result = validate_code_language(german_code, expected_language)
         if not validation_result[0]:
             # Fehler: Falsche Sprache - Code nicht übersetzen
-            return german_code, {}, validation_result
+            return german_code, PositionMap(0), validation_result
     
     if not german_code or not german_code.strip():
-        return german_code, {}, validation_result
+        return german_code, PositionMap(0), validation_result
     
     # Wenn Englisch erwartet wird, Code nicht übersetzen
     if expected_language == "englisch":
-        line_mapping = {}
-        num_lines = len(german_code.split('\n'))
-        for i in range(1, num_lines + 1):
-            line_mapping[i] = i
-        return german_code, line_mapping, validation_result
-    
-    # Strings maskieren (damit sie nicht übersetzt werden)
-    # Global für gesamten Code
-    string_map = {}
-    string_counter = 0
-    
-    def mask_strings(text: str) -> str:
-        """Maskiert Strings in einem Text"""
-        nonlocal string_counter, string_map
-        
-        # Pattern für Strings: Triple quotes, double quotes, single quotes
-        # Reihenfolge wichtig: Triple quotes zuerst (mehrere Zeilen)
-        # Single/Double quotes (eine Zeile)
-        patterns = [
-            (r'"""[\s\S]*?"""'),  # Triple double quotes (mehrere Zeilen)
-            (r"'''[\s\S]*?'''"),  # Triple single quotes (mehrere Zeilen)
-            (r'"[^"\\]*(\\.[^"\\]*)*"'),  # Double quotes (mit Escapes)
-            (r"'[^'\\]*(\\.[^'\\]*)*'"),  # Single quotes (mit Escapes)
-        ]
-        
-        for pattern in patterns:
-            def replace_match(match):
-                nonlocal string_counter
-                original = match.group(0)
-                placeholder = f"__STRING_{string_counter}__"
-                string_map[placeholder] = original
-                string_counter += 1
-                return placeholder
-            
-            text = re.sub(pattern, replace_match, text)
-        
-        return text
-    
-    def unmask_strings(text: str) -> str:
-        """Demaskiert Strings in einem Text"""
-        # In umgekehrter Reihenfolge ersetzen (größere Platzhalter zuerst)
-        sorted_placeholders = sorted(string_map.keys(), key=len, reverse=True)
-        for placeholder in sorted_placeholders:
-            original = string_map[placeholder]
-            text = text.replace(placeholder, original)
-        return text
-    
-    # Schritt 1: Strings maskieren (über gesamten Code)
-    masked_code = mask_strings(german_code)
-    
-    # Schritt 2: Deutsche Schlüsselwörter übersetzen (nur ganze Wörter!)
-    python_code = masked_code
-    for german, python in GERMAN_TO_PYTHON.items():
-        # Nur ganze Wörter ersetzen (mit Wort-Grenzen)
-        pattern = r'\b' + re.escape(german) + r'\b'
-        python_code = re.sub(pattern, python, python_code)
-    
-    # Schritt 2b: Deutsche API-Funktionen übersetzen (nur ganze Wörter!)
-    # WICHTIG: Muss nach Keywords passieren, damit "mit" nicht übersetzt wird wenn es Teil von "bewege_mit_kollision" ist
-    for german_func, english_func in GERMAN_API_TO_ENGLISH.items():
-        # Nur ganze Wörter ersetzen (mit Wort-Grenzen)
-        pattern = r'\b' + re.escape(german_func) + r'\b'
-        python_code = re.sub(pattern, english_func, python_code)
-    
-    # Schritt 3: Strings demaskieren
-    python_code = unmask_strings(python_code)
-    
-    # Zeile-Mapping: Python-Zeile → Deutsch-Zeile (1:1 Mapping, da Zeilenanzahl gleich bleibt)
-    # Für Fehlermeldungen: Python-Zeile = Deutsch-Zeile (gleiche Nummer)
-    line_mapping = {}
-    num_lines = len(python_code.split('\n'))
-    for i in range(1, num_lines + 1):
-        line_mapping[i] = i
+        return german_code, PositionMap(german_code.count('\n') + 1, german_code), validation_result
     
+    python_code, line_mapping = _TRANSLATOR.to_python(german_code)
     return python_code, line_mapping, validation_result
 
 
-# Reverse-Mapping: Python → Deutsch (für Rückübersetzung)
-PYTHON_TO_GERMAN = {}
-# Für mehrdeutige Mappings (z.B. "gib_zurueck" und "gib_zurück" beide → "return")
-# Verwende die bevorzugte Version als Standard
-for german, python in GERMAN_TO_PYTHON.items():
-    if python not in PYTHON_TO_GERMAN:
-        PYTHON_TO_GERMAN[python] = german
-    # Wenn beide Versionen existieren, bevorzuge "definiere" über "funktion"
-    elif python == "def" and german == "definiere":
-        PYTHON_TO_GERMAN[python] = german  # "definiere" hat Vorrang
-    # Wenn beide Versionen existieren, bevorzuge die mit Umlaut
-    elif 'ü' in german or 'ä' in german or 'ö' in german:
-        PYTHON_TO_GERMAN[python] = german
-
-
 def translate_code_reverse(python_code: str, target_language: str) -> Tuple[str, bool, str]:
     """
     Übersetzt Python-Code zurück in deutsche oder englische Schlüsselwörter
@@ -316,12 +577,14 @@ def translate_code_reverse(python_code: str, target_language: str) -> Tuple[str,
     Args:
         python_code: Python-Code mit englischen Schlüsselwörtern
         target_language: "deutsch" oder "englisch"
-        
+    
     Returns:
         Tuple (translated_code, success, error_message)
         - translated_code: Übersetzter Code (oder original bei Fehler)
         - success: True wenn Übersetzung erfolgreich war
         - error_message: Fehlermeldung wenn Übersetzung nicht vollständig möglich
+    
+    WICHTIG: Wie bei translate_code() bleiben Strings und Kommentare unverändert.
     """
     if not python_code or not python_code.strip():
         return python_code, True, ""
@@ -333,81 +596,4 @@ def translate_code_reverse(python_code: str, target_language: str) -> Tuple[str,
     if target_language != "deutsch":
         return python_code, False, f"Unbekannte Zielsprache: {target_language}"
     
-    # Übersetzen von Python zu Deutsch
-    # Strings maskieren (damit sie nicht übersetzt werden)
-    string_map = {}
-    string_counter = 0
-    
-    def mask_strings(text: str) -> str:
-        """Maskiert Strings in einem Text"""
-        nonlocal string_counter, string_map
-        
-        patterns = [
-            (r'"""[\s\S]*?"""'),  # Triple double quotes
-            (r"'''[\s\S]*?'''"),  # Triple single quotes
-            (r'"[^"\\]*(\\.[^"\\]*)*"'),  # Double quotes
-            (r"'[^'\\]*(\\.[^'\\]*)*'"),  # Single quotes
-        ]
-        
-        for pattern in patterns:
-            def replace_match(match):
-                nonlocal string_counter
-                original = match.group(0)
-                placeholder = f"__STRING_{string_counter}__"
-                string_map[placeholder] = original
-                string_counter += 1
-                return placeholder
-            
-            text = re.sub(pattern, replace_match, text)
-        
-        return text
-    
-    def unmask_strings(text: str) -> str:
-        """Demaskiert Strings in einem Text"""
-        sorted_placeholders = sorted(string_map.keys(), key=len, reverse=True)
-        for placeholder in sorted_placeholders:
-            original = string_map[placeholder]
-            text = text.replace(placeholder, original)
-        return text
-    
-    # Schritt 1: Strings maskieren
-    masked_code = mask_strings(python_code)
-    
-    # Schritt 2: Python-Schlüsselwörter in deutsche übersetzen
-    german_code = masked_code
-    untranslatable_keywords = []
-    
-    # Prüfe ob alle Keywords übersetzbar sind
-    for python_keyword in PYTHON_KEYWORDS:
-        # Überspringe gemeinsame Keywords
-        if python_keyword in {"in", "global"}:
-            continue
-        pattern = r'\b' + re.escape(python_keyword) + r'\b'
-        if re.search(pattern, masked_code):
-            if python_keyword not in PYTHON_TO_GERMAN:
-                untranslatable_keywords.append(python_keyword)
-    
-    # Wenn nicht alle Keywords übersetzbar sind, Fehler zurückgeben
-    if untranslatable_keywords:
-        error_msg = f"Vollständige Übersetzung nicht möglich. Nicht übersetzbare Schlüsselwörter: {', '.join(untranslatable_keywords)}"
-        return python_code, False, error_msg
-    
-    # Übersetzen: Zuerst Keywords
-    for python, german in PYTHON_TO_GERMAN.items():
-        # Überspringe gemeinsame Keywords
-        if python in {"in", "global"}:
-            continue
-        pattern = r'\b' + re.escape(python) + r'\b'
-        german_code = re.sub(pattern, german, german_code)
-    
-    # Schritt 2b: Englische API-Funktionen in deutsche übersetzen
-    # WICHTIG: Muss nach Keywords passieren, damit "with" nicht übersetzt wird wenn es Teil von "move_with_collision" ist
-    for english_func, german_func in ENGLISH_API_TO_GERMAN.items():
-        # Nur ganze Wörter ersetzen (mit Wort-Grenzen)
-        pattern = r'\b' + re.escape(english_func) + r'\b'
-        german_code = re.sub(pattern, german_func, german_code)
-    
-    # Schritt 3: Strings demaskieren
-    german_code = unmask_strings(german_code)
-    
-    return german_code, True, ""
+    return _TRANSLATOR.to_german(python_code)
@@ -0,0 +1,202 @@
+"""
+Eingabe-Zustand - Tastatur und Maus aus den pygame-Events eines Frames
+
+Statt bei jeder Abfrage pygame.key.get_pressed() aufzurufen, sammelt die Runtime
+die Tastatur- und Maus-Events aus der Event-Schleife. Zu Beginn jedes
+Simulationsschritts entsteht daraus ein fester Zustand:
+
+- gedrückte Tasten/Maustasten (solange gehalten)
+- gerade gedrückte und gerade losgelassene Tasten (nur in diesem Schritt)
+
+Abfragen sind damit nur noch Mengen-Zugriffe. Kurze Tastendrücke gehen nicht
+verloren: Auch wenn eine Taste zwischen zwei Schritten gedrückt und wieder
+losgelassen wird, meldet der nächste Schritt sie als gedrückt und losgelassen.
+"""
+from typing import Dict, Optional, Set, Tuple
+import pygame
+
+
+# Tasten-Namen, die pygame nicht kennt oder anders schreibt (Englisch und Deutsch)
+# Alle anderen Namen ("A", "F5", "1", "TAB", "ESCAPE", ...) löst pygame.key.key_code() auf
+KEY_ALIASES: Dict[str, int] = {
+    # Englische Tasten-Namen
+    "LEFT": pygame.K_LEFT,
+    "RIGHT": pygame.K_RIGHT,
+    "UP": pygame.K_UP,
+    "DOWN": pygame.K_DOWN,
+    "SPACE": pygame.K_SPACE,
+    "ENTER": pygame.K_RETURN,
+    "ESC": pygame.K_ESCAPE,
+    "SHIFT": pygame.K_LSHIFT,
+    "CTRL": pygame.K_LCTRL,
+    "ALT": pygame.K_LALT,
+    "W": pygame.K_w,
+    "A": pygame.K_a,
+    "S": pygame.K_s,
+    "D": pygame.K_d,
+    "F1": pygame.K_F1,
+    # Deutsche Tasten-Namen (Aliase)
+    "LINKS": pygame.K_LEFT,
+    "RECHTS": pygame.K_RIGHT,
+    "HOCH": pygame.K_UP,
+    "RUNTER": pygame.K_DOWN,
+    "LEERTASTE": pygame.K_SPACE,
+    "EINGABE": pygame.K_RETURN,
+    "UMSCHALT": pygame.K_LSHIFT,
+    "STRG": pygame.K_LCTRL,
+    "RÜCKTASTE": pygame.K_BACKSPACE,
+    "ENTF": pygame.K_DELETE,
+    "EINFG": pygame.K_INSERT,
+    "POS1": pygame.K_HOME,
+    "ENDE": pygame.K_END,
+}
+
+# Maustasten (Englisch und Deutsch) -> pygame-Nummer
+MOUSE_BUTTONS: Dict[str, int] = {
+    "LEFT": 1,
+    "MIDDLE": 2,
+    "RIGHT": 3,
+    "LINKS": 1,
+    "MITTE": 2,
+    "RECHTS": 3,
+}
+
+# Aufgelöste Namen (Name -> Tasten-Code oder None), jeder Name wird nur einmal nachgeschlagen
+_key_codes: Dict[str, Optional[int]] = {}
+
+
+def resolve_key(name: str) -> Optional[int]:
+    """
+    Gibt den pygame-Tasten-Code zu einem Tastennamen zurück
+
+    Args:
+        name: Tastenname, Groß-/Kleinschreibung egal (z.B. "LINKS", "space", "F5", "q")
+
+    Returns:
+        Tasten-Code oder None (unbekannter Name)
+    """
+    try:
+        return _key_codes[name]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    key = str(name).upper()
+    code = KEY_ALIASES.get(key)
+    if code is None:
+        try:
+            code = pygame.key.key_code(key.lower())
+        except (ValueError, pygame.error):
+            code = None
+    _key_codes[name] = code
+    return code
+
+
+def resolve_mouse_button(button) -> Optional[int]:
+    """
+    Gibt die pygame-Nummer einer Maustaste zurück
+
+    Args:
+        button: "LEFT"/"LINKS", "MIDDLE"/"MITTE", "RIGHT"/"RECHTS" oder Nummer (1-5)
+    """
+    if isinstance(button, int):
+        return button
+    try:
+        return MOUSE_BUTTONS.get(button.upper())
+    except AttributeError:
+        return None
+
+
+class InputState:
+    """
+    Tastatur- und Maus-Zustand eines Simulationsschritts
+
+    Events werden mit handle_event() (oder key_event()/mouse_button_event()) gesammelt,
+    begin_step() macht daraus den Zustand für den nächsten Schritt.
+
+    WICHTIG: Gedrückt/losgelassen gilt genau für einen Schritt. Läuft in einem Frame
+    kein Schritt (Zeichnen schneller als die Simulation), bleiben die Events bis zum
+    nächsten Schritt erhalten.
+    """
+
+    __slots__ = ("keys_held", "keys_down", "keys_up", "buttons_held", "buttons_down", "buttons_up",
+                 "mouse_pos", "_held", "_down", "_up", "_buttons", "_buttons_down", "_buttons_up")
+
+    def __init__(self):
+        # Zustand des aktuellen Schritts (wird von den Abfragen gelesen)
+        self.keys_held: Set[int] = set()
+        self.keys_down: Set[int] = set()
+        self.keys_up: Set[int] = set()
+        self.buttons_held: Set[int] = set()
+        self.buttons_down: Set[int] = set()
+        self.buttons_up: Set[int] = set()
+        self.mouse_pos: Tuple[int, int] = (0, 0)
+        # Gesammelte Events seit dem letzten Schritt
+        self._held: Set[int] = set()
+        self._down: Set[int] = set()
+        self._up: Set[int] = set()
+        self._buttons: Set[int] = set()
+        self._buttons_down: Set[int] = set()
+        self._buttons_up: Set[int] = set()
+
+    def handle_event(self, event: pygame.event.Event):
+        """Nimmt ein pygame-Event auf (andere Event-Typen werden ignoriert)"""
+        event_type = event.type
+        if event_type == pygame.KEYDOWN:
+            self.key_event(event.key, True)
+        elif event_type == pygame.KEYUP:
+            self.key_event(event.key, False)
+        elif event_type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+        elif event_type == pygame.MOUSEBUTTONDOWN:
+            self.mouse_pos = event.pos
+            self.mouse_button_event(event.button, True)
+        elif event_type == pygame.MOUSEBUTTONUP:
+            self.mouse_pos = event.pos
+            self.mouse_button_event(event.button, False)
+        elif event_type == pygame.WINDOWFOCUSLOST:
+            # Ohne Fokus kommen keine KEYUP-Events mehr - alles als losgelassen werten
+            self.release_all()
+
+    def key_event(self, key_code: int, pressed: bool):
+        """Taste gedrückt (pressed=True) oder losgelassen"""
+        if pressed:
+            if key_code not in self._held:
+                self._held.add(key_code)
+                self._down.add(key_code)
+        elif key_code in self._held:
+            self._held.discard(key_code)
+            self._up.add(key_code)
+
+    def mouse_button_event(self, button: int, pressed: bool):
+        """Maustaste gedrückt (pressed=True) oder losgelassen"""
+        if pressed:
+            if button not in self._buttons:
+                self._buttons.add(button)
+                self._buttons_down.add(button)
+        elif button in self._buttons:
+            self._buttons.discard(button)
+            self._buttons_up.add(button)
+
+    def release_all(self):
+        """Lässt alle gedrückten Tasten und Maustasten los"""
+        for key_code in list(self._held):
+            self.key_event(key_code, False)
+        for button in list(self._buttons):
+            self.mouse_button_event(button, False)
+
+    def begin_step(self):
+        """Übernimmt die gesammelten Events als Zustand des nächsten Simulationsschritts"""
+        self.keys_held = set(self._held)
+        self.keys_down, self._down = self._down, set()
+        self.keys_up, self._up = self._up, set()
+        self.buttons_held = set(self._buttons)
+        self.buttons_down, self._buttons_down = self._buttons_down, set()
+        self.buttons_up, self._buttons_up = self._buttons_up, set()
+
+    def reset(self, mouse_pos: Tuple[int, int] = (0, 0)):
+        """Vergisst alle Tasten (z.B. beim Spielstart)"""
+        for name in ("keys_held", "keys_down", "keys_up", "buttons_held", "buttons_down",
+                     "buttons_up", "_held", "_down", "_up", "_buttons", "_buttons_down", "_buttons_up"):
+            getattr(self, name).clear()
+        self.mouse_pos = mouse_pos
@@ -3,8 +3,11 @@ Loader - Lädt Projekt- und Szenen-Daten aus JSON
 """
 import json
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .gameobject import GameObject
+from .world import TransformStore
+from .sprite_cache import SpriteCache
+from .project_context import ProjectContext
 
 
 def load_project(project_dir: Path) -> Dict[str, Any]:
@@ -46,13 +49,17 @@ def load_scene(project_dir: Path, scene_name: str) -> Dict[str, Any]:
     return scene_data
 
 
-def create_objects_from_scene(scene_data: Dict[str, Any], project_dir: Path) -> List[GameObject]:
+def create_objects_from_scene(scene_data: Dict[str, Any], project_dir: Path,
+                              sprite_cache: Optional[SpriteCache] = None,
+                              context: Optional[ProjectContext] = None) -> List[GameObject]:
     """
     Erstellt GameObject-Liste aus Szenen-Daten
     
     Args:
         scene_data: Geladene Szenen-Daten
         project_dir: Projektverzeichnis
+        sprite_cache: Gemeinsamer Sprite-Cache (None = Cache aus dem Kontext)
+        context: Projekt-Kontext (None = neuer Kontext, liest project.json einmal)
         
     Returns:
         Liste von GameObject-Instanzen
@@ -62,28 +69,36 @@ def create_objects_from_scene(scene_data: Dict[str, Any], project_dir: Path) ->
     if "objects" not in scene_data:
         return objects
     
-    # Sprite-Größe aus Projekteinstellungen laden
-    sprite_size = None
-    try:
-        project_file = project_dir / "project.json"
-        if project_file.exists():
-            with open(project_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            sprite_size_config = config.get("sprite_size", 64)
-            if isinstance(sprite_size_config, dict):
-                sprite_size = sprite_size_config.get("width", sprite_size_config.get("size", 64))
-            else:
-                sprite_size = sprite_size_config if isinstance(sprite_size_config, int) else 64
-    except Exception:
-        sprite_size = 64  # Standard bei Fehler
+    # Projekteinstellungen einmal laden und an alle Objekte weitergeben
+    if context is None:
+        context = ProjectContext(project_dir)
+    sprite_size = context.sprite_size
     
+    # Jedes Sprite wird nur einmal geladen und skaliert - gleiche Sprites teilen eine Surface
+    # (iCCP-Zustand in .cache/iccp.json des Projekts)
+    if sprite_cache is None:
+        sprite_cache = context.sprite_cache
+    
+    # Position/Größe aller Objekte der Szene liegen zusammen in einem Speicher (siehe world.py)
+    store = TransformStore(len(scene_data["objects"]))
+
     for obj_data in scene_data["objects"]:
-        obj = GameObject(obj_data, project_dir, sprite_size)
+        obj = GameObject(obj_data, project_dir, sprite_size, sprite_cache, context, store)
         objects.append(obj)
     
+    # Geprüfte Bilder merken, damit sie beim nächsten Start übersprungen werden
+    sprite_cache.save_fix_state()
+    
     # Alle Objekte kennen die komplette Liste (für collides_with)
+    # Statische Objekte markieren: Boden-Tiles und Dekoration (ohne Kollisionsbox)
+    # bewegen sich normalerweise nie. Die API backt sie in eine eigene Ebene
+    # (siehe StaticGeometry), der Renderer zeichnet sie als vorgerenderte Chunks -
+    # aber nur die vor dem ersten dynamischen Objekt (Listen-Reihenfolge = Zeichenreihenfolge).
+    # Wird ein statisches Objekt doch bewegt, wird es automatisch dynamisch.
     for obj in objects:
         obj.set_all_objects(objects)
+        obj._is_static = ((obj.is_ground and obj._collider_enabled) or
+                          (not obj._collider_enabled and not obj.is_camera))
     
     return objects
 
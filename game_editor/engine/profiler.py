@@ -0,0 +1,234 @@
+"""
+Profiler - Misst die Zeit der einzelnen Phasen im Game Loop
+
+Die Runtime ruft pro Frame begin_frame(), danach nach jeder Phase mark(phase)
+und am Ende end_frame() auf. Zeiten, die innerhalb einer Phase in einer
+verschachtelten Phase verbracht werden (z.B. Kollision während der
+Schüler-Updates), werden mit add_nested() gemeldet und von der äußeren Phase
+abgezogen - die Phasen eines Frames ergeben zusammen also die Frame-Zeit.
+
+Alle Werte liegen in Ringpuffern fester Größe: Der Profiler kann dauerhaft
+mitlaufen, ohne dass der Speicher wächst. Zusätzlich werden die Zeitspannen
+der letzten Frames als Ereignisse gemerkt und können als Chrome-Trace
+(chrome://tracing, Perfetto) gespeichert werden.
+"""
+import json
+from array import array
+from collections import deque
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Phasen in der Reihenfolge des Game Loops
+PHASES = ("events", "keys", "setup", "update", "collision", "destroy",
+          "lock_y", "ride_along", "camera", "draw")
+
+# Zusammengefasste Phasen (für den Benchmark-Bericht)
+PHASE_GROUPS = {
+    "input": ("events", "keys", "setup"),
+    "update": ("update", "destroy"),
+    "collision": ("collision",),
+    "ride_along": ("lock_y", "ride_along"),
+    "render": ("camera", "draw"),
+}
+
+DEFAULT_CAPACITY = 600  # Frames im Ringpuffer (10 Sekunden bei 60 FPS)
+MAX_TRACE_EVENTS = 200000  # Obergrenze für gemerkte Zeitspannen (Chrome-Trace)
+SCRIPT_SMOOTHING = 0.1  # Gewicht eines neuen Werts im gleitenden Mittel der Skript-Zeiten
+
+
+class _Ring:
+    """Ringpuffer für Nanosekunden-Werte (ältester Wert wird überschrieben)"""
+
+    __slots__ = ("values", "capacity", "count", "index")
+
+    def __init__(self, capacity: int):
+        self.values = array("q", [0]) * capacity
+        self.capacity = capacity
+        self.count = 0
+        self.index = 0
+
+    def append(self, value: int):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def latest(self, n: Optional[int] = None) -> List[int]:
+        """Gibt die letzten n Werte zurück (ältester zuerst)"""
+        n = self.count if n is None else min(n, self.count)
+        start = (self.index - n) % self.capacity
+        if start + n <= self.capacity:
+            return list(self.values[start:start + n])
+        return list(self.values[start:]) + list(self.values[:self.index])
+
+
+class PhaseProfiler:
+    """Sammelt die Zeiten aller Phasen und Schüler-Skripte der letzten Frames"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, trace: bool = True):
+        """
+        Args:
+            capacity: Anzahl Frames, die in den Ringpuffern gehalten werden
+            trace: Zeitspannen für den Chrome-Trace merken
+        """
+        self.capacity = capacity
+        self.phases: Dict[str, _Ring] = {phase: _Ring(capacity) for phase in PHASES}
+        self.frame_times = _Ring(capacity)
+        # Objekt-ID -> (gleitendes Mittel, Maximum) der update()-Zeit in Nanosekunden
+        self.scripts: Dict[str, Tuple[float, int]] = {}
+        self.trace_enabled = trace
+        # (Name, Kategorie, Start, Dauer) in Nanosekunden
+        self.events: deque = deque(maxlen=MAX_TRACE_EVENTS)
+        self._frame: Dict[str, int] = {}
+        self._frame_start = 0
+        self._last = 0
+        self._nested = 0
+
+    def begin_frame(self):
+        """Startet die Zeitmessung für einen neuen Frame"""
+        self._frame = dict.fromkeys(self.phases, 0)
+        self._nested = 0
+        self._frame_start = self._last = perf_counter_ns()
+
+    def mark(self, phase: str):
+        """
+        Beendet eine Phase: Zeit seit dem letzten mark() wird ihr zugerechnet
+
+        Args:
+            phase: Name der Phase (siehe PHASES)
+        """
+        now = perf_counter_ns()
+        self._frame[phase] = self._frame.get(phase, 0) + (now - self._last - self._nested)
+        if self.trace_enabled:
+            self.events.append((phase, "phase", self._last, now - self._last))
+        self._nested = 0
+        self._last = now
+
+    def add_nested(self, phase: str, duration_ns: int):
+        """
+        Rechnet Zeit einer verschachtelten Phase zu (wird von der umgebenden Phase abgezogen)
+
+        Args:
+            phase: Name der verschachtelten Phase (z.B. "collision")
+            duration_ns: Dauer in Nanosekunden
+        """
+        self._frame[phase] = self._frame.get(phase, 0) + duration_ns
+        self._nested += duration_ns
+
+    def add_script(self, obj_id: str, start_ns: int, duration_ns: int):
+        """
+        Merkt die Laufzeit des update()/aktualisiere() eines Objekts
+
+        Args:
+            obj_id: ID des Objekts
+            start_ns: Startzeitpunkt (perf_counter_ns)
+            duration_ns: Dauer in Nanosekunden (inkl. Kollision)
+        """
+        previous = self.scripts.get(obj_id)
+        if previous is None:
+            self.scripts[obj_id] = (float(duration_ns), duration_ns)
+        else:
+            mean, peak = previous
+            self.scripts[obj_id] = (mean + (duration_ns - mean) * SCRIPT_SMOOTHING,
+                                    max(peak, duration_ns))
+        if self.trace_enabled:
+            self.events.append((obj_id, "script", start_ns, duration_ns))
+
+    def end_frame(self):
+        """Schließt den Frame ab und speichert seine Phasen-Zeiten"""
+        now = perf_counter_ns()
+        for phase, duration in self._frame.items():
+            ring = self.phases.get(phase)
+            if ring is None:
+                ring = self.phases[phase] = _Ring(self.capacity)
+            ring.append(duration)
+        self.frame_times.append(now - self._frame_start)
+        if self.trace_enabled:
+            self.events.append(("frame", "frame", self._frame_start, now - self._frame_start))
+
+    def remove_scripts(self, obj_ids):
+        """Vergisst die Skript-Zeiten zerstörter Objekte"""
+        for obj_id in obj_ids:
+            self.scripts.pop(obj_id, None)
+
+    def recent_frame_times(self, n: Optional[int] = None) -> List[int]:
+        """Gibt die Frame-Zeiten der letzten n Frames zurück (ältester zuerst)"""
+        return self.frame_times.latest(n)
+
+    def top_scripts(self, n: int = 5) -> List[Tuple[str, float, int]]:
+        """
+        Gibt die langsamsten Schüler-Skripte zurück
+
+        Returns:
+            Liste von (Objekt-ID, Mittel in ns, Maximum in ns), langsamstes zuerst
+        """
+        ranked = sorted(self.scripts.items(), key=lambda item: item[1][0], reverse=True)
+        return [(obj_id, mean, peak) for obj_id, (mean, peak) in ranked[:n]]
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Fasst alle Frames im Ringpuffer zusammen
+
+        Returns:
+            Dict mit Anzahl der Frames, Frame-Zeit, Statistik pro Phase und pro
+            Phasen-Gruppe (in Millisekunden) sowie den langsamsten Skripten
+        """
+        phases = {phase: ring.latest() for phase, ring in self.phases.items()}
+        groups = {}
+        for group, members in PHASE_GROUPS.items():
+            columns = [phases[m] for m in members if m in phases]
+            groups[group] = _summarize([sum(values) for values in zip(*columns)])
+        return {
+            "frames": self.frame_times.count,
+            "frame": _summarize(self.frame_times.latest()),
+            "groups": groups,
+            "phases": {phase: _summarize(values) for phase, values in phases.items()},
+            "slowest_scripts": [
+                {"object": obj_id, "mean_ms": round(mean / 1e6, 4), "max_ms": round(peak / 1e6, 4)}
+                for obj_id, mean, peak in self.top_scripts(10)
+            ],
+        }
+
+    def export_chrome_trace(self, path: Path, seconds: float = 5.0) -> int:
+        """
+        Speichert die Zeitspannen der letzten Sekunden als Chrome-Trace (JSON)
+
+        Die Datei kann in chrome://tracing oder https://ui.perfetto.dev geöffnet werden.
+
+        Args:
+            path: Zieldatei
+            seconds: Wie viele Sekunden zurück exportiert werden
+
+        Returns:
+            Anzahl der exportierten Ereignisse
+        """
+        since = perf_counter_ns() - int(seconds * 1e9)
+        trace_events = [
+            {"name": name, "cat": category, "ph": "X", "pid": 1, "tid": 1,
+             "ts": start / 1000, "dur": duration / 1000}
+            for name, category, start, duration in self.events
+            if start >= since
+        ]
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+        return len(trace_events)
+
+
+def _summarize(times_ns: List[int]) -> Dict[str, float]:
+    """Mittelwert, Median, 95%-Perzentil, Maximum und Summe in Millisekunden"""
+    if not times_ns:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0}
+    ordered = sorted(times_ns)
+    count = len(ordered)
+    total = sum(ordered)
+    return {
+        "mean_ms": round(total / count / 1e6, 4),
+        "p50_ms": round(ordered[count // 2] / 1e6, 4),
+        "p95_ms": round(ordered[min(count - 1, int(count * 0.95))] / 1e6, 4),
+        "max_ms": round(ordered[-1] / 1e6, 4),
+        "total_ms": round(total / 1e6, 3),
+    }
@@ -0,0 +1,100 @@
+"""
+Projekt-Kontext - Lädt Projekteinstellungen einmal pro Spielstart
+
+project.json und code_editor_settings.json werden nur einmal gelesen und an
+Loader, GameObjects und das Laden des Schüler-Codes weitergereicht, statt
+pro Objekt erneut geöffnet zu werden.
+"""
+import json
+from pathlib import Path
+from typing import Optional, Dict, Any
+from .sprite_cache import SpriteCache
+from .code_cache import BytecodeCache
+from ..utils.image_fixer import IccpFixCache
+
+
+def get_sprite_size(config: Dict[str, Any]) -> int:
+    """
+    Liest die Sprite-Größe aus der Projekt-Konfiguration
+    
+    Args:
+        config: Geladene project.json
+        
+    Returns:
+        Sprite-Größe in Pixeln (Standard: 64)
+    """
+    sprite_size_config = config.get("sprite_size", 64)
+    if isinstance(sprite_size_config, dict):
+        return sprite_size_config.get("width", sprite_size_config.get("size", 64))
+    return sprite_size_config if isinstance(sprite_size_config, int) else 64
+
+
+def _read_json(file_path: Path) -> Dict[str, Any]:
+    """Liest eine JSON-Datei, gibt bei Fehler oder fehlender Datei {} zurück"""
+    try:
+        if file_path.exists():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+    except Exception:
+        pass  # Standard verwenden
+    return {}
+
+
+class ProjectContext:
+    """
+    Gemeinsame Projektdaten für einen Spielstart
+    
+    Dateien werden erst beim ersten Zugriff gelesen und danach wiederverwendet.
+    """
+    
+    def __init__(self, project_dir: Path, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            project_dir: Projektverzeichnis
+            config: Bereits geladene project.json (None = bei Bedarf laden)
+        """
+        self.project_dir = Path(project_dir)
+        self._config = config
+        self._editor_settings: Optional[Dict[str, Any]] = None
+        self._sprite_cache: Optional[SpriteCache] = None
+        self._code_cache: Optional[BytecodeCache] = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Inhalt von project.json ({} wenn nicht vorhanden)"""
+        if self._config is None:
+            self._config = _read_json(self.project_dir / "project.json")
+        return self._config
+    
+    @property
+    def editor_settings(self) -> Dict[str, Any]:
+        """Inhalt von code_editor_settings.json ({} wenn nicht vorhanden)"""
+        if self._editor_settings is None:
+            self._editor_settings = _read_json(self.project_dir / "code_editor_settings.json")
+        return self._editor_settings
+    
+    @property
+    def sprite_size(self) -> int:
+        """Sprite-Größe aus den Projekteinstellungen"""
+        return get_sprite_size(self.config)
+    
+    @property
+    def code_language(self) -> str:
+        """Sprache des Schüler-Codes ("deutsch" oder "englisch", Standard: deutsch)"""
+        return self.editor_settings.get("code_language", "deutsch")
+    
+    @property
+    def sprite_cache(self) -> SpriteCache:
+        """Gemeinsamer Sprite-Cache (mit iCCP-Zustand in .cache/iccp.json)"""
+        if self._sprite_cache is None:
+            self._sprite_cache = SpriteCache(IccpFixCache.for_project(self.project_dir))
+        return self._sprite_cache
+    
+    @property
+    def code_cache(self) -> BytecodeCache:
+        """Gemeinsamer Bytecode-Cache für Schüler-Code (Dateien in .cache/bytecode/)"""
+        if self._code_cache is None:
+            self._code_cache = BytecodeCache.for_project(self.project_dir)
+        return self._code_cache
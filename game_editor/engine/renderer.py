@@ -0,0 +1,324 @@
+"""
+Renderer - Zeichnet die Spielobjekte eines Frames
+
+Objekte außerhalb des Kamera-Ausschnitts werden über das räumliche Gitter
+aussortiert, alle sichtbaren Sprites werden gesammelt mit einem einzigen
+Surface.blits()-Aufruf gezeichnet.
+
+Statische Objekte (Boden-Tiles, Dekoration) werden einmal in große Chunks
+vorgerendert (StaticLayerCache) und pro Frame nur noch als wenige Bilder gezeichnet.
+Das gilt nur für statische Objekte, die in der Liste vor allen dynamischen Objekten
+stehen - spätere (z.B. ein Busch vor dem Spieler) werden normal darüber gezeichnet.
+"""
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Iterable, Optional
+import pygame
+from .gameobject import GameObject
+from .api import _query_visible
+from .fonts import GlyphText
+from .profiler import PhaseProfiler
+
+
+CHUNK_SIZE = 1024  # Kantenlänge eines Chunks in Welt-Pixeln
+MAX_CACHED_CHUNKS = 16  # So viele gerenderte Chunks bleiben höchstens im Speicher
+
+GRAPH_FRAMES = 120  # Frames im Frame-Zeit-Diagramm
+GRAPH_HEIGHT = 60  # Höhe des Diagramms in Pixeln (= 2 Frames bei 60 FPS)
+FRAME_BUDGET_NS = 16_666_667  # Ein Frame bei 60 FPS
+
+
+def get_visible_objects(view_x: float, view_y: float, view_width: float, view_height: float,
+                        include_static: bool = True,
+                        previous_positions: Optional[Dict[GameObject, Tuple[float, float]]] = None,
+                        static_from_order: Optional[int] = None) -> List[GameObject]:
+    """
+    Gibt alle Objekte im Kamera-Ausschnitt zurück (in Zeichenreihenfolge)
+    
+    Args:
+        view_x, view_y: Linke obere Ecke des Ausschnitts in Welt-Koordinaten
+        view_width, view_height: Größe des Ausschnitts (Fenstergröße)
+        include_static: False = statische Objekte weglassen (werden als Chunks gezeichnet)
+        previous_positions: Positionen vor dem letzten Simulationsschritt (für interpoliertes
+                            Zeichnen - Objekte zählen dann an alter und neuer Position)
+        static_from_order: Statische Objekte ab dieser Registrierungs-Reihenfolge trotzdem
+                           liefern (StaticLayerCache.unbaked_from)
+    """
+    return _query_visible(view_x, view_y, view_x + view_width, view_y + view_height,
+                          include_static=include_static, previous_positions=previous_positions,
+                          static_from_order=static_from_order)
+
+
+class StaticLayerCache:
+    """
+    Vorgerenderte Ebene für statische Objekte (Boden-Tiles, Dekoration)
+    
+    Die Welt wird in Chunks von CHUNK_SIZE x CHUNK_SIZE Pixeln aufgeteilt. Beim Laden
+    wird nur berechnet, welche Objekte in welchem Chunk liegen - gerendert wird ein
+    Chunk erst, wenn er zum ersten Mal ins Bild kommt. Danach kostet er pro Frame
+    nur noch einen Blit, egal wie viele Tiles darin liegen.
+    
+    Die Chunks werden mit der Hintergrundfarbe gefüllt und sind damit undurchsichtig:
+    Das Ergebnis ist pixelgleich mit dem einzelnen Zeichnen über dem Hintergrund.
+    
+    WICHTIG: Die statische Ebene liegt immer UNTER allen dynamischen Objekten. Damit
+    die Listen-Reihenfolge (= Zeichenreihenfolge) erhalten bleibt, werden nur statische
+    Objekte gebacken, die vor dem ersten dynamischen Objekt stehen. Alle späteren
+    (ab unbaked_from) zeichnet der Renderer zusammen mit den dynamischen Objekten.
+    
+    Verlässt ein Objekt die statische Ebene (zerstört oder bewegt), wird invalidate()
+    aufgerufen und die betroffenen Chunks werden beim nächsten Zeichnen neu gerendert.
+    """
+    
+    def __init__(self, background_color: Tuple[int, int, int],
+                 chunk_size: int = CHUNK_SIZE, max_chunks: int = MAX_CACHED_CHUNKS):
+        """
+        Args:
+            background_color: Hintergrundfarbe der Szene (Füllung der Chunks)
+            chunk_size: Kantenlänge eines Chunks in Welt-Pixeln
+            max_chunks: Maximale Anzahl gerenderter Chunks im Speicher
+        """
+        self.background_color = background_color
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        # (cx, cy) -> Objekte in Zeichenreihenfolge
+        self._members: Dict[Tuple[int, int], List[GameObject]] = {}
+        # Objekt -> Chunks, die es berührt
+        self._chunks_of: Dict[GameObject, Tuple[Tuple[int, int], ...]] = {}
+        # Gerenderte Chunks (zuletzt benutzte am Ende)
+        self._surfaces: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self.renders = 0  # Wie oft ein Chunk gerendert wurde (für Statistik)
+        # Registrierungs-Reihenfolge, ab der statische Objekte nicht gebacken sind
+        # (None = alle gebacken)
+        self.unbaked_from: Optional[int] = None
+    
+    def build(self, objects: Iterable[GameObject], first_dynamic_order: Optional[int] = None):
+        """
+        Verteilt die statischen Objekte auf die Chunks
+        
+        Args:
+            objects: Statische Objekte in Zeichenreihenfolge
+            first_dynamic_order: _index_order des ersten dynamischen Objekts - statische
+                                 Objekte danach werden nicht gebacken (None = alle backen)
+        """
+        self.clear()
+        for obj in objects:
+            if not obj.visible:
+                continue
+            if first_dynamic_order is not None and obj._index_order > first_dynamic_order:
+                self.unbaked_from = first_dynamic_order
+                continue
+            keys = self._chunk_keys(obj)
+            self._chunks_of[obj] = keys
+            for key in keys:
+                self._members.setdefault(key, []).append(obj)
+    
+    def invalidate(self, obj: GameObject):
+        """Entfernt ein Objekt aus der Ebene und verwirft die betroffenen Chunks"""
+        if obj not in self._chunks_of:
+            return
+        self._remove(obj)
+        if obj.visible:
+            # Bewegt statt zerstört: Das Objekt wird ab jetzt dynamisch gezeichnet. Später
+            # gebackene Objekte lägen sonst unter ihm - sie werden ebenfalls normal gezeichnet.
+            later = [other for other in self._chunks_of if other._index_order > obj._index_order]
+            for other in later:
+                self._remove(other)
+            if later:
+                self.unbaked_from = obj._index_order
+    
+    def _remove(self, obj: GameObject):
+        keys = self._chunks_of.pop(obj, ())
+        for key in keys:
+            members = self._members.get(key)
+            if members is not None:
+                members.remove(obj)
+                if not members:
+                    del self._members[key]
+            self._surfaces.pop(key, None)
+    
+    def clear(self):
+        self._members.clear()
+        self._chunks_of.clear()
+        self._surfaces.clear()
+        self.unbaked_from = None
+    
+    def __len__(self) -> int:
+        return len(self._chunks_of)
+    
+    def draw(self, screen: pygame.Surface, view_x: int, view_y: int,
+             view_width: int, view_height: int) -> int:
+        """
+        Zeichnet alle Chunks, die den Kamera-Ausschnitt berühren
+        
+        Args:
+            screen: Pygame Surface zum Zeichnen
+            view_x, view_y: Linke obere Ecke des Ausschnitts in Welt-Koordinaten
+            view_width, view_height: Größe des Ausschnitts (Fenstergröße)
+        
+        Returns:
+            Anzahl der gezeichneten Chunks
+        """
+        if not self._members:
+            return 0
+        size = self.chunk_size
+        cx0, cy0 = int(view_x // size), int(view_y // size)
+        cx1, cy1 = int((view_x + view_width - 1) // size), int((view_y + view_height - 1) // size)
+        batch: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                key = (cx, cy)
+                if key not in self._members:
+                    continue  # Leerer Chunk: Hintergrund ist schon gefüllt
+                batch.append((self._get_surface(key), (cx * size - view_x, cy * size - view_y)))
+        if batch:
+            screen.blits(batch, doreturn=False)
+        return len(batch)
+    
+    def _chunk_keys(self, obj: GameObject) -> Tuple[Tuple[int, int], ...]:
+        """Berechnet alle Chunks, die der gezeichnete Bereich des Objekts berührt"""
+        size = self.chunk_size
+        width, height = obj._visual_size()
+        left, top = int(obj.x), int(obj.y)
+        cx0, cy0 = left // size, top // size
+        cx1 = (left + max(int(width), 1) - 1) // size
+        cy1 = (top + max(int(height), 1) - 1) // size
+        return tuple((cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1))
+    
+    def _get_surface(self, key: Tuple[int, int]) -> pygame.Surface:
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = self._render_chunk(key)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_chunks:
+            self._surfaces.popitem(last=False)  # Am längsten nicht benutzten Chunk verwerfen
+        return surface
+    
+    def _render_chunk(self, key: Tuple[int, int]) -> pygame.Surface:
+        size = self.chunk_size
+        surface = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(self.background_color)
+        draw_objects(surface, self._members[key], offset_x=-key[0] * size, offset_y=-key[1] * size)
+        self.renders += 1
+        return surface
+
+
+def interpolated_position(obj: GameObject, previous_positions: Optional[Dict[GameObject, Tuple[float, float]]],
+                          alpha: float) -> Tuple[float, float]:
+    """
+    Gibt die Zeichenposition zwischen letztem und aktuellem Simulationsschritt zurück
+    
+    Args:
+        obj: Das Objekt
+        previous_positions: Positionen vor dem letzten Simulationsschritt (None = keine Interpolation)
+        alpha: Anteil des nächsten Schritts, der schon vergangen ist (0.0 - 1.0)
+    """
+    if previous_positions is not None:
+        previous = previous_positions.get(obj)
+        if previous is not None:
+            return (previous[0] + (obj.x - previous[0]) * alpha,
+                    previous[1] + (obj.y - previous[1]) * alpha)
+    return obj.x, obj.y
+
+
+def draw_objects(screen: pygame.Surface, objects: List[GameObject],
+                 offset_x: float = 0, offset_y: float = 0, debug: bool = False,
+                 previous_positions: Optional[Dict[GameObject, Tuple[float, float]]] = None,
+                 alpha: float = 1.0):
+    """
+    Zeichnet Objekte gesammelt mit Surface.blits()
+    
+    Die Zeichenreihenfolge bleibt erhalten: Objekte ohne Sprite (Rechteck-Fallback)
+    beenden den aktuellen Stapel und werden einzeln gezeichnet.
+    
+    Args:
+        screen: Pygame Surface zum Zeichnen
+        objects: Zu zeichnende Objekte (bereits aussortiert)
+        offset_x: X-Offset für Kamera
+        offset_y: Y-Offset für Kamera
+        debug: Debug-Informationen (Kollisionsbox, ID) über alle Objekte zeichnen
+        previous_positions: Positionen vor dem letzten Simulationsschritt
+                            (None = aktuelle Positionen zeichnen, keine Interpolation)
+        alpha: Interpolations-Faktor zwischen vorheriger und aktueller Position
+    """
+    batch: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+    for obj in objects:
+        if not obj.visible:
+            continue
+        previous = previous_positions.get(obj) if previous_positions is not None else None
+        if previous is not None:
+            # Zwischen den Simulationsschritten weich zeichnen
+            shift_x = (previous[0] - obj.x) * (1.0 - alpha)
+            shift_y = (previous[1] - obj.y) * (1.0 - alpha)
+        else:
+            shift_x = shift_y = 0
+        surface = obj._sprite_surface
+        if surface:
+            batch.append((surface, (int(obj.x + shift_x + offset_x), int(obj.y + shift_y + offset_y))))
+        else:
+            # Rechteck-Fallback: bisherigen Stapel zuerst zeichnen (Reihenfolge!)
+            if batch:
+                screen.blits(batch, doreturn=False)
+                batch = []
+            obj.draw(screen, offset_x=offset_x + shift_x, offset_y=offset_y + shift_y)
+    if batch:
+        screen.blits(batch, doreturn=False)
+    
+    if debug:
+        draw_debug_overlay(screen, objects, offset_x, offset_y)
+
+
+def draw_debug_overlay(screen: pygame.Surface, objects: List[GameObject],
+                       offset_x: float = 0, offset_y: float = 0):
+    """Zeichnet Debug-Informationen (Kollisionsbox, ID) über alle Objekte"""
+    for obj in objects:
+        obj.draw_debug(screen, offset_x, offset_y)
+
+
+def draw_profiler_overlay(screen: pygame.Surface, profiler: PhaseProfiler, text: GlyphText,
+                          pos: Tuple[int, int], top_n: int = 5):
+    """
+    Zeichnet das Frame-Zeit-Diagramm und die langsamsten Schüler-Skripte
+    
+    Grün = im 60-FPS-Budget, Gelb = unter 30 FPS-Budget, Rot = langsamer.
+    
+    Args:
+        screen: Pygame Surface zum Zeichnen
+        profiler: Profiler mit den Zeiten der letzten Frames
+        text: Gecachte Zeichen für die Beschriftung
+        pos: Linke obere Ecke des Overlays
+        top_n: Anzahl der angezeigten Skripte
+    """
+    x, y = pos
+    width = GRAPH_FRAMES * 2
+    pygame.draw.rect(screen, (0, 0, 0), (x, y, width, GRAPH_HEIGHT))
+    
+    times = profiler.recent_frame_times(GRAPH_FRAMES)
+    full_scale = FRAME_BUDGET_NS * 2
+    bar_x = x + width - len(times) * 2
+    bottom = y + GRAPH_HEIGHT - 1
+    for duration in times:
+        bar_height = min(GRAPH_HEIGHT, duration * GRAPH_HEIGHT // full_scale)
+        if duration <= FRAME_BUDGET_NS:
+            color = (0, 200, 0)
+        elif duration <= FRAME_BUDGET_NS * 2:
+            color = (230, 200, 0)
+        else:
+            color = (230, 0, 0)
+        if bar_height > 0:
+            pygame.draw.line(screen, color, (bar_x, bottom), (bar_x, bottom - bar_height + 1), 2)
+        bar_x += 2
+    # Linie für das 60-FPS-Budget
+    budget_y = y + GRAPH_HEIGHT // 2
+    pygame.draw.line(screen, (255, 255, 255), (x, budget_y), (x + width - 1, budget_y))
+    
+    line_y = y + GRAPH_HEIGHT + 4
+    if times:
+        text.draw(screen, f"Frame: {times[-1] / 1e6:.1f} ms", (x, line_y))
+        line_y += 22
+    for obj_id, mean, peak in profiler.top_scripts(top_n):
+        text.draw(screen, f"{obj_id}: {mean / 1e6:.2f} ms (max {peak / 1e6:.1f})", (x, line_y))
+        line_y += 22
@@ -1,23 +1,36 @@
 """
 Runtime Engine - Pygame Game Loop und Schüler-Code Ausführung
 """
+import builtins
 import pygame
 import sys
-import json
+import time
 import warnings
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from .loader import load_project, load_scene, create_objects_from_scene
+from .project_context import ProjectContext
+from .renderer import (get_visible_objects, draw_objects, draw_debug_overlay, draw_profiler_overlay,
+                       interpolated_position, StaticLayerCache)
 from .gameobject import GameObject
-from .german_code_translator import translate_code
-from .api import (_init_api, _update_key_states, get_debug_output, 
-                  clear_debug_output, print_debug, get_object, get_all_objects,
-                  key_pressed, key_down, mouse_position, spawn_object,
+from .fonts import get_font, clear_font_cache, GlyphText
+from .script_table import ScriptTable
+from .profiler import PhaseProfiler
+from .code_cache import translate_source
+from .api import (BROAD_PHASES, _init_api, _unregister_objects, _update_key_states, get_debug_output,
+                  _handle_input_event, _reset_input,
+                  _set_spawn_context, _flush_spawns, _recycle_objects,
+                  _begin_contact_frame, _apply_support_contacts,
+                  _static_objects, _add_static_removal_callback, _remove_static_removal_callback,
+                  _set_profiler, _set_delta_time, _snapshot_positions, delta_time, zeit_delta,
+                  clear_debug_output, print_debug, get_object, get_all_objects, all_collisions,
+                  key_pressed, key_down, key_up, mouse_position, mouse_pressed, mouse_down, mouse_up,
+                  spawn_object,
                   move_with_collision, push_objects, lock_y_position,
                   unlock_y_position, apply_locked_y_positions,
                   # Deutsche Aliase
-                  hole_objekt, hole_alle_objekte, taste_gedrückt, taste_runter,
-                  maus_position, drucke_debug, erstelle_objekt, bewege_mit_kollision,
+                  hole_objekt, hole_alle_objekte, alle_kollisionen, taste_gedrückt, taste_runter,
+                  taste_losgelassen, maus_position, maus_gedrückt, maus_runter, maus_losgelassen, drucke_debug, erstelle_objekt, bewege_mit_kollision,
                   drücke_objekte, fixiere_y_position, entferne_y_fixierung)
 
 # libpng Warnungen werden direkt auf stderr geschrieben, nicht als Python warnings
@@ -32,6 +45,121 @@ ERROR_TRANSLATIONS: Dict[str, str] = {
 }
 
 
+# Alle Funktionen, die Schüler-Code verwenden darf (Englisch und Deutsch)
+STUDENT_API: Dict[str, Any] = {
+    # Objekte (Englisch)
+    "get_object": get_object,
+    "get_all_objects": get_all_objects,
+    "all_collisions": all_collisions,
+    
+    # Objekte (Deutsch)
+    "hole_objekt": hole_objekt,
+    "hole_alle_objekte": hole_alle_objekte,
+    "alle_kollisionen": alle_kollisionen,
+    
+    # Input (Englisch)
+    "key_pressed": key_pressed,
+    "key_down": key_down,
+    "key_up": key_up,
+    "mouse_position": mouse_position,
+    "mouse_pressed": mouse_pressed,
+    "mouse_down": mouse_down,
+    "mouse_up": mouse_up,
+    
+    # Input (Deutsch)
+    "taste_gedrückt": taste_gedrückt,
+    "taste_runter": taste_runter,
+    "taste_losgelassen": taste_losgelassen,
+    "maus_position": maus_position,
+    "maus_gedrückt": maus_gedrückt,
+    "maus_runter": maus_runter,
+    "maus_losgelassen": maus_losgelassen,
+    
+    # Utility (Englisch)
+    "print_debug": print_debug,
+    "spawn_object": spawn_object,
+    "move_with_collision": move_with_collision,
+    "push_objects": push_objects,
+    "lock_y_position": lock_y_position,
+    "unlock_y_position": unlock_y_position,
+    
+    # Utility (Deutsch)
+    "drucke_debug": drucke_debug,
+    "erstelle_objekt": erstelle_objekt,
+    "bewege_mit_kollision": bewege_mit_kollision,
+    "drücke_objekte": drücke_objekte,
+    "fixiere_y_position": fixiere_y_position,
+    "entferne_y_fixierung": entferne_y_fixierung,
+    
+    # Zeit
+    "delta_time": delta_time,
+    "zeit_delta": zeit_delta,
+}
+
+DEFAULT_PHYSICS_HZ = 60  # Simulationsschritte pro Sekunde (project.json: "physics_hz")
+MAX_STEPS_PER_FRAME = 5  # Mehr Schritte pro Frame holt die Simulation nicht nach (sonst Zeitlupe)
+
+
+def get_physics_hz(config: Dict[str, Any]) -> int:
+    """
+    Liest die Simulationsrate aus project.json ("physics_hz", Standard: 60)
+    
+    Args:
+        config: Inhalt von project.json
+    """
+    try:
+        physics_hz = int(config.get("physics_hz", DEFAULT_PHYSICS_HZ))
+    except (TypeError, ValueError):
+        return DEFAULT_PHYSICS_HZ
+    return physics_hz if physics_hz > 0 else DEFAULT_PHYSICS_HZ
+
+
+def get_broad_phase(config: Dict[str, Any]) -> str:
+    """
+    Liest die Kollisions-Vorauswahl aus project.json ("broad_phase", Standard: "hash")
+    
+    "hash" = räumliches Gitter, "sap" = Sweep and Prune (für viele bewegte Objekte)
+    
+    Args:
+        config: Inhalt von project.json
+    """
+    broad_phase = config.get("broad_phase", "hash")
+    if broad_phase not in BROAD_PHASES:
+        print(f"WARNUNG: Unbekannte Kollisions-Vorauswahl '{broad_phase}' in project.json - verwende 'hash'")
+        return "hash"
+    return broad_phase
+
+# Gemeinsame Basis aller Skript-Namespaces: Python-Builtins + Schüler-API
+# WICHTIG: Wird als __builtins__ eingesetzt - Python sucht globale Namen zuerst im
+# Namespace des Skripts und dann hier. Jedes Skript hat dadurch nur seine eigenen
+# Variablen im Namespace, die API existiert nur einmal. Weist ein Skript einem
+# API-Namen etwas zu, landet das in seinem eigenen Namespace (die Basis bleibt unverändert).
+_API_BUILTINS: Dict[str, Any] = {**builtins.__dict__, **STUDENT_API}
+
+
+def _new_script_namespace() -> Dict[str, Any]:
+    """Erstellt einen leeren Namespace für ein Skript (API kommt aus der gemeinsamen Basis)"""
+    return {"__builtins__": _API_BUILTINS}
+
+
+def _empty_function():
+    pass
+
+
+def _is_empty_function(func: Any) -> bool:
+    """
+    Prüft ob eine Funktion nichts tut (Rumpf nur "überspringen"/pass)
+    
+    Vergleicht den Bytecode mit einer leeren Funktion - "global"-Zeilen und
+    Kommentare erzeugen keinen Bytecode und werden damit auch erkannt.
+    """
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return False
+    empty = _empty_function.__code__
+    return code.co_code == empty.co_code and code.co_consts == empty.co_consts
+
+
 def translate_error(error_msg: str) -> str:
     """Übersetzt Python-Fehlermeldungen ins Deutsche"""
     error_lower = error_msg.lower()
@@ -41,13 +169,49 @@ def translate_error(error_msg: str) -> str:
     return error_msg
 
 
-def load_student_code(game_code_path: Path, game_objects: list[GameObject]) -> Dict[str, Any]:
+def _error_location(error: SyntaxError, position_map) -> str:
+    """
+    Gibt die Fehlerstelle im Original-Code zurück (z.B. "Zeile 3, Spalte 9")
+    
+    Args:
+        error: SyntaxError aus dem übersetzten Code
+        position_map: Positions-Mapping der Übersetzung (siehe translate_source)
+    """
+    if not error.lineno or not position_map or error.lineno not in position_map:
+        return f"Zeile {error.lineno}"
+    if not error.offset:
+        return f"Zeile {position_map[error.lineno]}"
+    # Ersetzte Wörter sind im Original oft länger/kürzer (z.B. "wenn" -> "if")
+    line, column = position_map.source_position(error.lineno, error.offset - 1)
+    return f"Zeile {line}, Spalte {column + 1}"
+
+
+def _call_script_hooks(hooks, hook_name: str):
+    """
+    Ruft start()/on_destroy() von Objekt-Skripten auf (Fehler werden gemeldet, Spiel läuft weiter)
+    
+    Args:
+        hooks: Liste von (Objekt, Funktion)
+        hook_name: Name für Fehlermeldungen (z.B. "start()/starte()")
+    """
+    for obj, hook in hooks:
+        try:
+            hook()
+        except Exception as e:
+            error_msg = translate_error(str(e))
+            print(f"FEHLER in {hook_name} für Objekt {obj.id}: {error_msg}")
+            print(f"Typ: {type(e).__name__}")
+
+
+def load_student_code(game_code_path: Path, game_objects: list[GameObject],
+                      context: Optional[ProjectContext] = None) -> Dict[str, Any]:
     """
     Lädt und kompiliert Schüler-Code
     
     Args:
         game_code_path: Pfad zu game.py
         game_objects: Liste aller GameObjects
+        context: Projekt-Kontext (None = Einstellungen aus dem Projektordner von game.py laden)
         
     Returns:
         Namespace-Dict mit Funktionen und Variablen
@@ -59,96 +223,34 @@ def load_student_code(game_code_path: Path, game_objects: list[GameObject]) -> D
     _init_api(game_objects)
     clear_debug_output()
     
-    # Namespace für Schüler-Code vorbereiten
-    game_namespace = {
-        # Objekte (Englisch)
-        "get_object": get_object,
-        "get_all_objects": get_all_objects,
-        
-        # Objekte (Deutsch)
-        "hole_objekt": hole_objekt,
-        "hole_alle_objekte": hole_alle_objekte,
-        
-        # Input (Englisch)
-        "key_pressed": key_pressed,
-        "key_down": key_down,
-        "mouse_position": mouse_position,
-        
-        # Input (Deutsch)
-        "taste_gedrückt": taste_gedrückt,
-        "taste_runter": taste_runter,
-        "maus_position": maus_position,
-        
-        # Utility (Englisch)
-        "print_debug": print_debug,
-        "spawn_object": spawn_object,
-        "move_with_collision": move_with_collision,
-        "push_objects": push_objects,
-        "lock_y_position": lock_y_position,
-        "unlock_y_position": unlock_y_position,
-        
-        # Utility (Deutsch)
-        "drucke_debug": drucke_debug,
-        "erstelle_objekt": erstelle_objekt,
-        "bewege_mit_kollision": bewege_mit_kollision,
-        "drücke_objekte": drücke_objekte,
-        "fixiere_y_position": fixiere_y_position,
-        "entferne_y_fixierung": entferne_y_fixierung,
-        
-        # Standard-Python (für Schüler nützlich)
-        "print": print,
-        "len": len,
-        "range": range,
-        "str": str,
-        "int": int,
-        "float": float,
-        "bool": bool,
-        "list": list,
-        "dict": dict,
-    }
+    # Namespace für Schüler-Code vorbereiten (API kommt aus der gemeinsamen Basis)
+    game_namespace = _new_script_namespace()
     
     # Code laden und kompilieren
-    line_mapping = {}  # Für Fehlermeldungen
+    code = ""
+    code_language = "deutsch"
     try:
         with open(game_code_path, 'r', encoding='utf-8') as f:
             code = f.read()
         
         # Sprache prüfen: Ist Deutsch aktiviert?
-        # Prüfe code_editor_settings.json oder verwende Standard (deutsch)
-        code_language = "deutsch"  # Standard
-        try:
-            settings_file = game_code_path.parent.parent / "code_editor_settings.json"
-            if settings_file.exists():
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    code_language = settings.get("code_language", "deutsch")
-        except Exception:
-            pass  # Standard verwenden
-        
-        # Übersetzen nur wenn Deutsch gewählt ist
-        if code_language == "deutsch":
-            # DEUTSCH: Übersetze deutschen Code in Python (ohne Validierung in Runtime)
-            python_code, line_mapping, _ = translate_code(code, validate_language=False, expected_language="deutsch")
-        else:
-            # ENGLISCH: Code nicht übersetzen
-            python_code = code
-            num_lines = len(code.split('\n'))
-            for i in range(1, num_lines + 1):
-                line_mapping[i] = i
+        # Aus code_editor_settings.json (über den Projekt-Kontext) oder Standard (deutsch)
+        if context is None:
+            context = ProjectContext(game_code_path.parent.parent)
+        code_language = context.code_language
         
-        # Test-Compile (mit Python-Code)
-        compile(python_code, str(game_code_path), 'exec')
+        # Übersetzen (nur Deutsch) und kompilieren - oder fertigen Bytecode aus .cache/bytecode/ laden
+        compiled_code = context.code_cache.get(code, code_language)
         
-        # Code ausführen (mit Python-Code)
-        exec(python_code, game_namespace)
+        # Code ausführen
+        exec(compiled_code, game_namespace)
         
     except SyntaxError as e:
         error_msg = translate_error(str(e))
-        # Zeile-Nummer zurückübersetzen (falls Übersetzung verwendet wurde)
-        error_line = e.lineno
-        if e.lineno and line_mapping and e.lineno in line_mapping:
-            error_line = line_mapping[e.lineno]
-        print(f"SYNTAXFEHLER in Zeile {error_line}: {error_msg}")
+        # Zeile und Spalte zurückübersetzen (falls Übersetzung verwendet wurde)
+        # Nur im Fehlerfall wird das Positions-Mapping gebraucht
+        _, position_map = translate_source(code, code_language)
+        print(f"SYNTAXFEHLER in {_error_location(e, position_map)}: {error_msg}")
         print(f"Details: {e.msg}")
         raise
     
@@ -161,12 +263,28 @@ def load_student_code(game_code_path: Path, game_objects: list[GameObject]) -> D
     return game_namespace
 
 
-def main(project_path: str):
+def main(project_path: str, max_frames: Optional[int] = None, fps_limit: int = 60,
+         profiler: Optional[PhaseProfiler] = None,
+         on_frame: Optional[Callable[[int], None]] = None,
+         lockstep: bool = False):
     """
     Hauptfunktion - Startet das Spiel
     
     Args:
         project_path: Pfad zum Projektordner
+        max_frames: Spiel nach so vielen Frames beenden (None = bis das Fenster geschlossen wird)
+        fps_limit: Maximale Frames pro Sekunde (0 = unbegrenzt, z.B. für den Benchmark)
+        profiler: Misst die Zeit der einzelnen Phasen pro Frame (None = nur im Debug-Modus)
+        on_frame: Wird zu Beginn jedes Frames mit der Frame-Nummer aufgerufen
+                  (z.B. für gescriptete Eingaben im Benchmark)
+        lockstep: Genau ein Simulationsschritt pro Frame, unabhängig von der echten Zeit
+                  (reproduzierbar, z.B. für den Benchmark)
+    
+    Die Simulation (Schüler-Updates, Kollision, Mitbewegung) läuft mit fester Rate
+    (physics_hz in project.json). Gezeichnet wird so oft wie fps_limit erlaubt - die
+    Positionen werden dabei zwischen zwei Simulationsschritten interpoliert. Ist das
+    Zeichnen zu langsam, werden pro Frame mehrere Schritte simuliert: Das Spiel läuft
+    dann ruckeliger, aber nicht in Zeitlupe.
     """
     project_dir = Path(project_path)
     if not project_dir.exists():
@@ -180,6 +298,9 @@ def main(project_path: str):
         print(f"FEHLER beim Laden von project.json: {e}")
         sys.exit(1)
     
+    # Projekt-Kontext: Einstellungen werden einmal geladen und überall weitergereicht
+    context = ProjectContext(project_dir, config)
+    
     # Pygame initialisieren
     pygame.init()
     
@@ -200,14 +321,25 @@ def main(project_path: str):
         pygame.quit()
         sys.exit(1)
     
-    # Objekte erstellen
-    game_objects = create_objects_from_scene(scene_data, project_dir)
+    # Objekte erstellen (Sprites werden über einen gemeinsamen Cache geladen)
+    # Bereits geprüfte PNGs (iCCP-Profil) werden über .cache/iccp.json übersprungen
+    game_objects = create_objects_from_scene(scene_data, project_dir, context=context)
+    cache_stats = context.sprite_cache.stats()
+    if cache_stats["hits"]:
+        print(f"Sprites: {cache_stats['sprites']} geladen, {cache_stats['hits']} wiederverwendet "
+              f"({cache_stats['resident_bytes'] / 1024:.0f} KB belegt, "
+              f"{cache_stats['saved_bytes'] / 1024:.0f} KB gespart)")
+    
+    # API mit räumlichem Gitter (Zellgröße = Sprite-Größe) bzw. Sweep and Prune initialisieren
+    _init_api(game_objects, cell_size=context.sprite_size, broad_phase=get_broad_phase(config))
+    # spawn_object(): neue Objekte teilen Sprite-Cache und Speicher mit der Szene
+    _set_spawn_context(project_dir, context, game_objects[0]._store if game_objects else None)
     
     # Schüler-Code laden (code/game.py)
     game_code_path = project_dir / "code" / "game.py"
     game_namespace = None
     try:
-        game_namespace = load_student_code(game_code_path, game_objects)
+        game_namespace = load_student_code(game_code_path, game_objects, context)
     except Exception as e:
         print(f"FEHLER beim Laden von game.py: {e}")
         # Spiel trotzdem starten, aber ohne update()
@@ -215,95 +347,41 @@ def main(project_path: str):
     
     # Code aus allen Objekten laden und ausführen
     # WICHTIG: Jedes Objekt kann eigenen Code haben, der in jedem Frame ausgeführt wird
-    object_namespaces = {}  # Dict: obj_id -> namespace
+    # Die Skript-Tabelle merkt sich update()/start()/on_destroy() jedes Objekts;
+    # update()-Funktionen, die nichts tun (nur "überspringen"), werden nicht aufgerufen
+    script_table = ScriptTable(skip_update=_is_empty_function)
+    # Szenen-Daten nach ID (erstes Objekt gewinnt, wie bei der Suche in der Liste)
+    scene_objects_by_id = {}
+    for o in scene_data.get("objects", []):
+        scene_objects_by_id.setdefault(o.get("id"), o)
+    # Sprache einmal bestimmen - gleiche Sprache wie game.py
+    code_language = context.code_language
+    code_cache = context.code_cache
     for obj in game_objects:
-        obj_code = scene_data.get("objects", [])
         # Finde das Objekt in der Szene
-        obj_data = None
-        for o in obj_code:
-            if o.get("id") == obj.id:
-                obj_data = o
-                break
+        obj_data = scene_objects_by_id.get(obj.id)
         
         if obj_data and obj_data.get("code"):
-            obj_line_mapping = {}  # Für Fehlermeldungen
             try:
                 # Code für dieses Objekt ausführen
                 obj_code = obj_data["code"]
                 
-                # Sprache prüfen: Ist Deutsch aktiviert?
-                # Verwende gleiche Sprache wie game.py
-                code_language = "deutsch"  # Standard
-                try:
-                    settings_file = project_dir / "code_editor_settings.json"
-                    if settings_file.exists():
-                        with open(settings_file, 'r', encoding='utf-8') as f:
-                            settings = json.load(f)
-                            code_language = settings.get("code_language", "deutsch")
-                except Exception:
-                    pass  # Standard verwenden
-                
-                # Übersetzen nur wenn Deutsch gewählt ist
-                if code_language == "deutsch":
-                    # DEUTSCH: Übersetze deutschen Code in Python (ohne Validierung in Runtime)
-                    python_obj_code, obj_line_mapping, _ = translate_code(obj_code, validate_language=False, expected_language="deutsch")
-                else:
-                    # ENGLISCH: Code nicht übersetzen
-                    python_obj_code = obj_code
-                    num_lines = len(obj_code.split('\n'))
-                    for i in range(1, num_lines + 1):
-                        obj_line_mapping[i] = i
+                # Übersetzen (nur Deutsch) und kompilieren - gleiche Skripte werden nur
+                # einmal kompiliert, bekannte Skripte kommen fertig aus .cache/bytecode/
+                compiled_obj_code = code_cache.get(obj_code, code_language)
                 
-                obj_namespace = {
-                    # Objekte (Englisch)
-                    "get_object": get_object,
-                    "get_all_objects": get_all_objects,
-                    # Objekte (Deutsch)
-                    "hole_objekt": hole_objekt,
-                    "hole_alle_objekte": hole_alle_objekte,
-                    # Input (Englisch)
-                    "key_pressed": key_pressed,
-                    "key_down": key_down,
-                    "mouse_position": mouse_position,
-                    # Input (Deutsch)
-                    "taste_gedrückt": taste_gedrückt,
-                    "taste_runter": taste_runter,
-                    "maus_position": maus_position,
-                    # Utility (Englisch)
-                    "print_debug": print_debug,
-                    "spawn_object": spawn_object,
-                    "move_with_collision": move_with_collision,
-                    "push_objects": push_objects,
-                    "lock_y_position": lock_y_position,
-                    "unlock_y_position": unlock_y_position,
-                    # Utility (Deutsch)
-                    "drucke_debug": drucke_debug,
-                    "erstelle_objekt": erstelle_objekt,
-                    "bewege_mit_kollision": bewege_mit_kollision,
-                    "drücke_objekte": drücke_objekte,
-                    "fixiere_y_position": fixiere_y_position,
-                    "entferne_y_fixierung": entferne_y_fixierung,
-                    # Standard-Python
-                    "print": print,
-                    "len": len,
-                    "range": range,
-                    "str": str,
-                    "int": int,
-                    "float": float,
-                    "bool": bool,
-                    "list": list,
-                    "dict": dict,
-                }
-                # Code ausführen (mit Python-Code)
-                exec(python_obj_code, obj_namespace)
-                object_namespaces[obj.id] = obj_namespace
+                # Eigener Namespace pro Objekt - die API wird nicht kopiert, sondern
+                # aus der gemeinsamen Basis gelesen (siehe _new_script_namespace)
+                obj_namespace = _new_script_namespace()
+                # Code ausführen
+                exec(compiled_obj_code, obj_namespace)
+                script_table.add(obj, obj_namespace)
             except SyntaxError as e:
                 error_msg = translate_error(str(e))
-                # Zeile-Nummer zurückübersetzen (falls Übersetzung verwendet wurde)
-                error_line = e.lineno
-                if e.lineno and obj_line_mapping and e.lineno in obj_line_mapping:
-                    error_line = obj_line_mapping[e.lineno]
-                print(f"SYNTAXFEHLER in Code für Objekt {obj.id}, Zeile {error_line}: {error_msg}")
+                # Zeile und Spalte zurückübersetzen (falls Übersetzung verwendet wurde)
+                _, obj_position_map = translate_source(obj_data["code"], code_language)
+                print(f"SYNTAXFEHLER in Code für Objekt {obj.id}, "
+                      f"{_error_location(e, obj_position_map)}: {error_msg}")
                 print(f"Details: {e.msg}")
                 # Objekt-Code wird übersprungen, aber Spiel läuft weiter
             except Exception as e:
@@ -311,6 +389,15 @@ def main(project_path: str):
                 print(f"FEHLER beim Laden von Code für Objekt {obj.id}: {error_msg}")
                 # Objekt-Code wird übersprungen, aber Spiel läuft weiter
     
+    code_stats = code_cache.stats()
+    if code_stats["disk_hits"] or code_stats["shared"]:
+        print(f"Skripte: {code_stats['compiled']} kompiliert, {code_stats['disk_hits']} aus dem Cache, "
+              f"{code_stats['shared']} geteilt")
+    
+    # game.py-update() läuft nur, wenn beim Start kein Objekt eigenen Code hatte
+    # (auch wenn diese Objekte später zerstört werden)
+    has_object_scripts = len(script_table) > 0
+    
     # Background-Farbe
     bg_color = scene_data.get("background_color", [135, 206, 235])
     if isinstance(bg_color, list) and len(bg_color) >= 3:
@@ -318,126 +405,187 @@ def main(project_path: str):
     else:
         background_color = (135, 206, 235)
     
+    # Statische Ebene (Boden-Tiles, Dekoration) als vorgerenderte Chunks
+    # Zerstörte oder bewegte statische Objekte verwerfen ihre Chunks automatisch
+    # WICHTIG: Nur Objekte vor dem ersten dynamischen Objekt (Listen-Reihenfolge = Zeichenreihenfolge)
+    static_layer = StaticLayerCache(background_color)
+    first_dynamic = next((obj for obj in game_objects if not obj._is_static), None)
+    static_layer.build(_static_objects(), first_dynamic._index_order if first_dynamic is not None else None)
+    _add_static_removal_callback(static_layer.invalidate)
+    
+    # Eingaben eines vorherigen Spiels vergessen (Tasten kommen ab jetzt aus den Events)
+    _reset_input()
+    
     # Debug-Modus
     debug_mode = False
     
+    # Zeitmessung der Phasen: läuft im Debug-Modus (F1) mit, ein übergebener Profiler
+    # (Benchmark) misst immer. F2 speichert die letzten Sekunden als Chrome-Trace.
+    frame_profiler = profiler if profiler is not None else PhaseProfiler()
+    active_profiler = profiler
+    dump_trace = False
+    
+    # Feste Simulationsrate: Schüler-Code bekommt die Schrittdauer über delta_time()
+    physics_hz = get_physics_hz(config)
+    fixed_dt = 1.0 / physics_hz
+    _set_delta_time(fixed_dt)
+    # Erster Frame simuliert sofort einen Schritt
+    accumulator = fixed_dt
+    last_time = time.perf_counter()
+    # Positionen vor dem letzten Simulationsschritt (für interpoliertes Zeichnen)
+    previous_positions = None
+    
     # Game Loop
     running = True
     fps = 0
-    fps_font = pygame.font.Font(None, 24)
+    frame_count = 0
+    # Debug-Overlay aus gecachten Zeichen (kein font.render() pro Frame)
+    overlay_text = GlyphText(get_font(24), (255, 255, 255))
     
     while running:
-        # Events verarbeiten
+        # Profiler nur zwischen zwei Frames ein-/ausschalten (Messung immer vollständig)
+        if profiler is None:
+            active_profiler = frame_profiler if debug_mode else None
+        _set_profiler(active_profiler)
+        if active_profiler:
+            active_profiler.begin_frame()
+        if on_frame:
+            on_frame(frame_count)
+        
+        # Events verarbeiten (Tastatur/Maus werden für den nächsten Simulationsschritt gesammelt)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F1:
                     debug_mode = not debug_mode
+                elif event.key == pygame.K_F2:
+                    dump_trace = True
+            _handle_input_event(event)
+        if active_profiler:
+            active_profiler.mark("events")
         
-        # Tastatur-Status aktualisieren (für key_down)
-        _update_key_states()
+        # Wie viele Simulationsschritte sind seit dem letzten Frame fällig?
+        if lockstep:
+            steps = 1
+        else:
+            now = time.perf_counter()
+            accumulator += now - last_time
+            last_time = now
+            steps = int(accumulator / fixed_dt)
+            if steps > MAX_STEPS_PER_FRAME:
+                # Zu weit zurück: Rest verwerfen statt immer weiter hinterherzulaufen
+                steps = MAX_STEPS_PER_FRAME
+                accumulator = 0.0
+            else:
+                accumulator -= steps * fixed_dt
         
-        # API aktualisieren (falls Objekte-Liste sich geändert hat)
-        # WICHTIG: Muss vor jedem Update aufgerufen werden, damit get_object() die aktuelle Liste verwendet
-        _init_api(game_objects)
+        for step in range(steps):
+            # Positionen vor dem letzten Schritt merken (Zeichnen interpoliert zwischen beiden)
+            if not lockstep and step == steps - 1:
+                previous_positions = _snapshot_positions()
+            
+            # Tastatur-/Maus-Status für diesen Schritt übernehmen (für key_down/key_up)
+            _update_key_states()
+            if active_profiler:
+                active_profiler.mark("keys")
         
-        # Positionen vor Updates speichern (für Mitbewegung)
-        # WICHTIG: Speichere Positionen BEVOR Updates ausgeführt werden
-        frame_start_positions = {}
-        for obj in game_objects:
-            frame_start_positions[obj.id] = (obj.x, obj.y)
+            # API aktualisieren (falls Objekte-Liste sich geändert hat)
+            # WICHTIG: Muss vor jedem Update aufgerufen werden, damit get_object() die aktuelle Liste verwendet
+            _init_api(game_objects)
         
-        # Update-Funktionen aus allen Objekten aufrufen
-        # WICHTIG: Code für alle Objekte wird ausgeführt, nicht nur für das aktuell ausgewählte
-        for obj_id, obj_namespace in object_namespaces.items():
-            # Akzeptiere sowohl "update" als auch "aktualisiere"
-            update_func = None
-            if "update" in obj_namespace:
-                update_func = obj_namespace["update"]
-            elif "aktualisiere" in obj_namespace:
-                update_func = obj_namespace["aktualisiere"]
-            
-            if update_func:
+            # Stütz-Kontakte prüfen und Trägerpositionen merken (für Mitbewegung)
+            # WICHTIG: Muss VOR den Updates passieren
+            _begin_contact_frame()
+            if active_profiler:
+                active_profiler.mark("setup")
+        
+            # start()/starte() neuer Objekt-Skripte (einmalig, vor ihrem ersten update())
+            starts = script_table.take_starts()
+            if starts:
+                _call_script_hooks(starts, "start()/starte()")
+        
+            # Update-Funktionen aus allen Objekten aufrufen
+            # WICHTIG: Code für alle Objekte wird ausgeführt, nicht nur für das aktuell ausgewählte
+            for obj, update_func in script_table.updates:
                 try:
-                    update_func()
+                    if active_profiler:
+                        # Laufzeit pro Skript messen (für "langsamste Skripte" im Overlay)
+                        script_start = time.perf_counter_ns()
+                        update_func()
+                        active_profiler.add_script(obj.id, script_start,
+                                                   time.perf_counter_ns() - script_start)
+                    else:
+                        update_func()
                 except Exception as e:
                     error_msg = translate_error(str(e))
-                    print(f"FEHLER in update()/aktualisiere() für Objekt {obj_id}: {error_msg}")
+                    print(f"FEHLER in update()/aktualisiere() für Objekt {obj.id}: {error_msg}")
                     print(f"Typ: {type(e).__name__}")
                     # Spiel pausiert nicht, läuft weiter
         
-        # Schüler-Update aufrufen (code/game.py)
-        # WICHTIG: Nur ausführen wenn keine Objekte eigenen Code haben, um Doppelausführung zu vermeiden
-        # Wenn Objekte Code haben, wird nur deren Code ausgeführt
-        if not object_namespaces and game_namespace:
-            # Akzeptiere sowohl "update" als auch "aktualisiere"
-            update_func = None
-            if "update" in game_namespace:
-                update_func = game_namespace["update"]
-            elif "aktualisiere" in game_namespace:
-                update_func = game_namespace["aktualisiere"]
+            # Schüler-Update aufrufen (code/game.py)
+            # WICHTIG: Nur ausführen wenn keine Objekte eigenen Code haben, um Doppelausführung zu vermeiden
+            # Wenn Objekte Code haben, wird nur deren Code ausgeführt
+            if not has_object_scripts and game_namespace:
+                # Akzeptiere sowohl "update" als auch "aktualisiere"
+                update_func = None
+                if "update" in game_namespace:
+                    update_func = game_namespace["update"]
+                elif "aktualisiere" in game_namespace:
+                    update_func = game_namespace["aktualisiere"]
             
-            if update_func:
-                try:
-                    update_func()
-                except Exception as e:
-                    error_msg = translate_error(str(e))
-                    print(f"FEHLER in update()/aktualisiere() (game.py): {error_msg}")
-                    print(f"Typ: {type(e).__name__}")
-                    # Spiel pausiert nicht, läuft weiter
+                if update_func:
+                    try:
+                        update_func()
+                    except Exception as e:
+                        error_msg = translate_error(str(e))
+                        print(f"FEHLER in update()/aktualisiere() (game.py): {error_msg}")
+                        print(f"Typ: {type(e).__name__}")
+                        # Spiel pausiert nicht, läuft weiter
+            if active_profiler:
+                active_profiler.mark("update")
         
-        # Unsichtbare Objekte entfernen (destroy())
-        game_objects[:] = [obj for obj in game_objects if obj.visible]
+            # Unsichtbare Objekte entfernen (destroy())
+            destroyed_objects = [obj for obj in game_objects if not obj.visible]
+            if destroyed_objects:
+                game_objects[:] = [obj for obj in game_objects if obj.visible]
+                # Skripte zerstörter Objekte laufen nicht mehr - vorher on_destroy() aufrufen
+                destroy_hooks = script_table.remove(destroyed_objects)
+                if destroy_hooks:
+                    _call_script_hooks(destroy_hooks, "on_destroy()/beim_zerstören()")
+                _unregister_objects(destroyed_objects)
+                frame_profiler.remove_scripts(obj.id for obj in destroyed_objects)
+                # Gespawnte Objekte werden für spätere spawn_object()-Aufrufe aufgehoben
+                _recycle_objects(destroyed_objects)
+            
+            # Gespawnte Objekte aufnehmen (ab dem nächsten Schritt in Listen, Gitter und Kollisionen)
+            spawned_objects = _flush_spawns()
+            if spawned_objects and previous_positions is not None:
+                # Wiederverwendete Objekte nicht von ihrer alten Position aus interpolieren
+                for obj in spawned_objects:
+                    previous_positions.pop(obj, None)
+            if active_profiler:
+                active_profiler.mark("destroy")
         
-        # Fixierte Y-Positionen anwenden (NACH Updates, VOR Mitbewegung)
-        apply_locked_y_positions()
+            # Fixierte Y-Positionen anwenden (NACH Updates, VOR Mitbewegung)
+            apply_locked_y_positions()
+            if active_profiler:
+                active_profiler.mark("lock_y")
         
-        # Mitbewegung: Objekte, die auf anderen Objekten stehen, mitbewegen
-        # Prüfe für jedes Objekt, ob es sich bewegt hat (vergleiche mit Position vor Updates)
-        for moved_obj in game_objects:
-            if moved_obj.id not in frame_start_positions:
-                continue
-            
-            start_x, start_y = frame_start_positions[moved_obj.id]
-            curr_x, curr_y = moved_obj.x, moved_obj.y
-            dx = curr_x - start_x
-            dy = curr_y - start_y
-            
-            # Wenn sich das Objekt bewegt hat
-            if abs(dx) > 0.01 or abs(dy) > 0.01:
-                # Prüfe alle anderen Objekte, ob sie auf diesem Objekt stehen
-                for other_obj in game_objects:
-                    if other_obj.id == moved_obj.id or not other_obj._collider_enabled:
-                        continue
-                    
-                    # Prüfe ob other_obj auf moved_obj steht (verwende Positionen VOR Updates)
-                    # WICHTIG: Prüfe mit den Positionen, die vor den Updates gespeichert wurden
-                    other_start_x, other_start_y = frame_start_positions.get(other_obj.id, (other_obj.x, other_obj.y))
-                    other_collider_bottom = other_start_y + other_obj._collider_offset_y + other_obj._collider_height
-                    moved_collider_top = start_y + moved_obj._collider_offset_y
-                    
-                    # Prüfe auch horizontale Überlappung (Objekte müssen sich überlappen)
-                    other_collider_left = other_start_x + other_obj._collider_offset_x
-                    other_collider_right = other_collider_left + other_obj._collider_width
-                    moved_collider_left = start_x + moved_obj._collider_offset_x
-                    moved_collider_right = moved_collider_left + moved_obj._collider_width
-                    
-                    horizontal_overlap = (other_collider_left < moved_collider_right and 
-                                         other_collider_right > moved_collider_left)
-                    
-                    # Toleranz von 3 Pixeln für "darauf stehen"
-                    is_standing_on = (horizontal_overlap and
-                                     other_collider_bottom >= moved_collider_top - 3.0 and 
-                                     other_collider_bottom <= moved_collider_top + 3.0)
-                    
-                    if is_standing_on:
-                        # Objekt steht darauf - mitbewegen
-                        other_obj.x += dx
-                        other_obj.y += dy
+            # Mitbewegung: Objekte, die auf anderen Objekten stehen, mitbewegen
+            # Folgt den Stütz-Kontakten aus move_with_collision() - Träger vor Mitfahrern,
+            # dadurch werden auch Stapel (Kiste auf Kiste auf Plattform) mitbewegt
+            _apply_support_contacts()
+            if active_profiler:
+                active_profiler.mark("ride_along")
         
-        # Fixierte Y-Positionen erneut anwenden (NACH Mitbewegung)
-        apply_locked_y_positions()
+            # Fixierte Y-Positionen erneut anwenden (NACH Mitbewegung)
+            apply_locked_y_positions()
+            if active_profiler:
+                active_profiler.mark("lock_y")
+        
+        # Anteil des nächsten Simulationsschritts, der schon vergangen ist (für Interpolation)
+        alpha = min(1.0, accumulator / fixed_dt) if previous_positions is not None else 1.0
         
         # Kamera finden und Offset berechnen
         camera_offset_x = 0
@@ -446,32 +594,70 @@ def main(project_path: str):
         for obj in game_objects:
             if obj.is_camera:
                 camera_obj = obj
-                # Kamera in Bildschirmmitte zentrieren
-                camera_offset_x = int(obj.x + obj.width / 2 - window_width / 2)
-                camera_offset_y = int(obj.y + obj.height / 2 - window_height / 2)
+                # Kamera in Bildschirmmitte zentrieren (an der interpolierten Position)
+                camera_x, camera_y = interpolated_position(obj, previous_positions, alpha)
+                camera_offset_x = int(camera_x + obj.width / 2 - window_width / 2)
+                camera_offset_y = int(camera_y + obj.height / 2 - window_height / 2)
                 break
+        if active_profiler:
+            active_profiler.mark("camera")
         
         # Rendering
         screen.fill(background_color)
         
-        # Alle Objekte zeichnen (mit Kamera-Offset)
-        for obj in game_objects:
-            obj.draw(screen, debug=debug_mode, offset_x=-camera_offset_x, offset_y=-camera_offset_y)
+        # Statische Ebene zuerst (nur Chunks im Kamera-Ausschnitt)
+        static_layer.draw(screen, camera_offset_x, camera_offset_y, window_width, window_height)
+        
+        # Dynamische Objekte im Kamera-Ausschnitt darüber (mit Kamera-Offset, gesammelt per blits())
+        # WICHTIG: Gezeichnet wird interpoliert - daher alte und neue Position prüfen
+        # Späte statische Objekte (nicht in den Chunks) kommen in Listen-Reihenfolge dazu
+        visible_objects = get_visible_objects(camera_offset_x, camera_offset_y, window_width, window_height,
+                                              include_static=False, previous_positions=previous_positions,
+                                              static_from_order=static_layer.unbaked_from)
+        draw_objects(screen, visible_objects, offset_x=-camera_offset_x, offset_y=-camera_offset_y,
+                     previous_positions=previous_positions, alpha=alpha)
+        
+        if debug_mode:
+            # Kollisionsboxen und IDs aller Objekte im Ausschnitt (auch statische)
+            debug_objects = get_visible_objects(camera_offset_x, camera_offset_y, window_width, window_height)
+            draw_debug_overlay(screen, debug_objects, offset_x=-camera_offset_x, offset_y=-camera_offset_y)
         
         # Debug-Overlay
         if debug_mode:
             # FPS-Counter
-            fps_text = fps_font.render(f"FPS: {fps}", True, (255, 255, 255))
-            screen.blit(fps_text, (10, 10))
+            overlay_text.draw(screen, f"FPS: {fps}", (10, 10))
             
             # Objekt-Zähler
-            obj_text = fps_font.render(f"Objekte: {len(game_objects)}", True, (255, 255, 255))
-            screen.blit(obj_text, (10, 35))
+            overlay_text.draw(screen, f"Objekte: {len(game_objects)}", (10, 35))
+            
+            # Frame-Zeit-Diagramm und langsamste Skripte
+            draw_profiler_overlay(screen, frame_profiler, overlay_text, (10, 60))
         
         pygame.display.flip()
+        if active_profiler:
+            active_profiler.mark("draw")
+            active_profiler.end_frame()
+        
+        # Chrome-Trace der letzten Sekunden speichern (F2)
+        if dump_trace:
+            dump_trace = False
+            if frame_profiler.frame_times.count:
+                trace_path = (project_dir / ".cache" / "traces" /
+                              f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+                event_count = frame_profiler.export_chrome_trace(trace_path)
+                print(f"Trace gespeichert: {trace_path} ({event_count} Ereignisse)")
+            else:
+                print("Noch keine Messwerte - der Profiler läuft im Debug-Modus (F1)")
         fps = int(clock.get_fps())
-        clock.tick(60)
+        clock.tick(fps_limit)
+        
+        frame_count += 1
+        if max_frames is not None and frame_count >= max_frames:
+            running = False
     
+    _set_profiler(None)
+    _remove_static_removal_callback(static_layer.invalidate)
+    clear_font_cache()
     pygame.quit()
 
 
@@ -0,0 +1,109 @@
+"""
+Skript-Tabelle - Welche Funktion wird für welches Objekt aufgerufen
+
+Die Funktionen der Objekt-Skripte (update/aktualisiere, start/starte,
+on_destroy/beim_zerstören) werden einmal beim Hinzufügen eines Objekts
+nachgeschlagen. Pro Frame läuft die Runtime dann nur noch über eine fertige
+Liste von (Objekt, Funktion)-Paaren - ohne Dict-Zugriffe.
+
+Die Liste wird nur neu gebaut, wenn Objekte hinzukommen oder zerstört werden.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from .gameobject import GameObject
+
+
+# Funktionsnamen (Englisch zuerst, wie bisher bei update/aktualisiere)
+UPDATE_NAMES = ("update", "aktualisiere")
+START_NAMES = ("start", "starte")
+DESTROY_NAMES = ("on_destroy", "beim_zerstören")
+
+
+def find_hook(namespace: Dict[str, Any], names: Tuple[str, ...]) -> Optional[Callable]:
+    """Gibt die erste aufrufbare Funktion mit einem der Namen zurück (oder None)"""
+    for name in names:
+        func = namespace.get(name)
+        if func is not None:
+            return func if callable(func) else None
+    return None
+
+
+class ScriptTable:
+    """
+    Aufruf-Tabelle für Objekt-Skripte
+
+    WICHTIG: Die Funktionen werden beim Hinzufügen aufgelöst. Definiert ein Skript
+    update() später neu, wird die neue Funktion nicht mehr aufgerufen.
+    """
+
+    def __init__(self, skip_update: Optional[Callable[[Callable], bool]] = None):
+        """
+        Args:
+            skip_update: Prüft ob eine update()-Funktion übersprungen werden kann
+                         (z.B. weil sie nur "überspringen" enthält)
+        """
+        self._skip_update = skip_update
+        # Objekt -> (update, on_destroy), in Reihenfolge des Hinzufügens
+        self._scripts: Dict[GameObject, Tuple[Optional[Callable], Optional[Callable]]] = {}
+        self._pending_starts: List[Tuple[GameObject, Callable]] = []
+        self._updates: List[Tuple[GameObject, Callable]] = []
+        self._dirty = False
+
+    def add(self, obj: GameObject, namespace: Dict[str, Any]):
+        """
+        Nimmt das Skript eines Objekts auf (start() wird über take_starts() abgeholt)
+
+        Args:
+            obj: Das Objekt
+            namespace: Namespace des ausgeführten Skripts
+        """
+        update = find_hook(namespace, UPDATE_NAMES)
+        if update is not None and self._skip_update is not None and self._skip_update(update):
+            update = None
+        self._scripts[obj] = (update, find_hook(namespace, DESTROY_NAMES))
+        start = find_hook(namespace, START_NAMES)
+        if start is not None:
+            self._pending_starts.append((obj, start))
+        self._dirty = True
+
+    def remove(self, objects: Iterable[GameObject]) -> List[Tuple[GameObject, Callable]]:
+        """
+        Entfernt zerstörte Objekte aus der Tabelle
+
+        Returns:
+            Liste von (Objekt, on_destroy) für alle entfernten Objekte mit on_destroy()
+        """
+        removed = set()
+        destroy_hooks = []
+        for obj in objects:
+            entry = self._scripts.pop(obj, None)
+            if entry is None:
+                continue
+            removed.add(obj)
+            if entry[1] is not None:
+                destroy_hooks.append((obj, entry[1]))
+        if removed:
+            self._dirty = True
+            if self._pending_starts:
+                self._pending_starts = [(o, f) for o, f in self._pending_starts if o not in removed]
+        return destroy_hooks
+
+    def take_starts(self) -> List[Tuple[GameObject, Callable]]:
+        """Gibt alle noch nicht aufgerufenen start()-Funktionen zurück (jede nur einmal)"""
+        starts = self._pending_starts
+        self._pending_starts = []
+        return starts
+
+    @property
+    def updates(self) -> List[Tuple[GameObject, Callable]]:
+        """(Objekt, update)-Paare für den Frame - wird nur nach Änderungen neu gebaut"""
+        if self._dirty:
+            self._updates = [(obj, update) for obj, (update, _) in self._scripts.items()
+                             if update is not None]
+            self._dirty = False
+        return self._updates
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
+    def __contains__(self, obj: GameObject) -> bool:
+        return obj in self._scripts
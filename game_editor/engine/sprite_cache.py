@@ -0,0 +1,121 @@
+"""
+Sprite-Cache - Lädt jedes Sprite nur einmal pro Spielstart
+
+Viele Objekte verwenden dasselbe Bild (z.B. hunderte Boden-Tiles mit
+assets/images/066.png). Der Cache lädt und skaliert jedes Bild nur einmal
+pro (Pfad, Zielgröße) - alle Objekte teilen sich dieselbe Surface.
+"""
+from pathlib import Path
+from typing import Optional, Dict, Tuple, Any
+import pygame
+from ..utils.image_fixer import fix_iccp_profile_cached, IccpFixCache
+
+
+def load_sprite_surface(sprite_path: Path, target_size: int,
+                        iccp_cache: Optional[IccpFixCache] = None) -> pygame.Surface:
+    """
+    Lädt ein Sprite von der Festplatte und skaliert es auf die Zielgröße
+    
+    Args:
+        sprite_path: Absoluter Pfad zum Bild
+        target_size: Kantenlänge in Pixeln (Sprite-Größe aus Projekteinstellungen)
+        iccp_cache: Merkt sich bereits geprüfte Bilder (None = jedes Mal Chunks prüfen)
+        
+    Returns:
+        Skalierte Surface (mit Alpha-Kanal)
+        
+    Raises:
+        Exception: Wenn das Bild nicht geladen werden kann
+    """
+    # libpng Warnungen unterdrücken (iCCP: known incorrect sRGB profile)
+    # iCCP-Profil-Korrektur für PNG-Bilder (behebt libpng-Warnung dauerhaft)
+    # Bild wird nur neu geschrieben, wenn es wirklich einen iCCP-Chunk hat
+    fix_iccp_profile_cached(sprite_path, iccp_cache)
+    
+    # Sprite laden (nach iCCP-Korrektur sollte keine Warnung mehr erscheinen)
+    surface = pygame.image.load(str(sprite_path)).convert_alpha()
+    # Immer auf die Projekteinstellungs-Größe skalieren
+    if surface.get_width() != target_size or surface.get_height() != target_size:
+        surface = pygame.transform.scale(surface, (target_size, target_size))
+    return surface
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Speicherbedarf der Pixeldaten einer Surface in Bytes"""
+    return surface.get_pitch() * surface.get_height()
+
+
+class SpriteCache:
+    """
+    Gemeinsamer Speicher für geladene Sprites (ein Cache pro Spielstart)
+    
+    Zählt Treffer/Fehlschläge und den belegten Speicher, damit sichtbar wird,
+    wie viel große Level durch das Teilen der Surfaces sparen.
+    """
+    
+    def __init__(self, iccp_cache: Optional[IccpFixCache] = None):
+        """
+        Args:
+            iccp_cache: Zustands-Cache der iCCP-Korrektur (z.B. IccpFixCache.for_project())
+        """
+        self.iccp_cache = iccp_cache
+        self._surfaces: Dict[Tuple[str, int], pygame.Surface] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.saved_bytes: int = 0  # Speicher, der ohne Cache zusätzlich belegt wäre
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
+    
+    def get(self, sprite_path: Path, target_size: int) -> pygame.Surface:
+        """
+        Gibt die (geteilte) Surface für ein Sprite zurück und lädt sie bei Bedarf
+        
+        Args:
+            sprite_path: Absoluter Pfad zum Bild
+            target_size: Kantenlänge in Pixeln
+            
+        Returns:
+            Skalierte Surface - WICHTIG: wird von allen Objekten geteilt, nicht verändern!
+            
+        Raises:
+            Exception: Wenn das Bild nicht geladen werden kann (wird nicht gecacht)
+        """
+        key = (str(sprite_path), int(target_size))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.saved_bytes += _surface_bytes(surface)
+            return surface
+        
+        self.misses += 1
+        surface = load_sprite_surface(sprite_path, int(target_size), self.iccp_cache)
+        self._surfaces[key] = surface
+        return surface
+    
+    @property
+    def resident_bytes(self) -> int:
+        """Tatsächlich belegter Speicher aller gecachten Surfaces in Bytes"""
+        return sum(_surface_bytes(surface) for surface in self._surfaces.values())
+    
+    def stats(self) -> Dict[str, Any]:
+        """Gibt Cache-Statistiken zurück (Treffer, Fehlschläge, Speicher)"""
+        return {
+            "sprites": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "resident_bytes": self.resident_bytes,
+            "saved_bytes": self.saved_bytes,
+        }
+    
+    def save_fix_state(self):
+        """Speichert den Zustand der iCCP-Korrektur (falls ein Cache gesetzt ist)"""
+        if self.iccp_cache is not None:
+            self.iccp_cache.save()
+    
+    def clear(self):
+        """Leert den Cache und setzt die Statistiken zurück"""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
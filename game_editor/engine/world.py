@@ -0,0 +1,86 @@
+"""
+World-Speicher - Positionen und Größen aller Objekte in zusammenhängenden Arrays
+
+Statt jedes GameObject seine Zahlen in einem eigenen __dict__ halten zu lassen,
+liegen x, y, Breite, Höhe und die Kollisionsbox aller Objekte einer Szene
+spaltenweise in array('d')-Spalten (ein Eintrag pro Objekt). Ein GameObject
+kennt nur noch seinen Speicher und seinen Platz (Slot) darin.
+
+Der Kollisions-Hot-Path (SpatialHash, collides_with) liest die Spalten direkt
+über den Slot, ohne Umweg über die Properties des Objekts.
+"""
+from array import array
+from typing import List
+
+
+# Spalten des Speichers (jede Spalte ist ein array('d'))
+COLUMNS = ("x", "y", "width", "height",
+           "collider_offset_x", "collider_offset_y", "collider_width", "collider_height")
+
+DEFAULT_CAPACITY = 64  # Anfangsgröße (wird bei Bedarf verdoppelt)
+
+
+class TransformStore:
+    """
+    Spaltenweiser Speicher für Position, Größe und Kollisionsbox
+
+    WICHTIG: Die Spalten werden beim Wachsen in-place verlängert (array.extend),
+    gespeicherte Referenzen auf eine Spalte bleiben also gültig. Solange ein
+    Buffer (memoryview, numpy.frombuffer) auf eine Spalte existiert, kann der
+    Speicher nicht wachsen - solche Views nur kurz halten.
+    """
+
+    __slots__ = COLUMNS + ("capacity", "_next", "_free")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Anfangsgröße (Anzahl Objekte)
+        """
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        for name in COLUMNS:
+            setattr(self, name, array("d", bytes(8 * capacity)))
+        self._next = 0  # Erster nie benutzter Slot
+        self._free: List[int] = []  # Freigegebene Slots (werden wiederverwendet)
+
+    def allocate(self) -> int:
+        """
+        Reserviert einen Slot für ein neues Objekt (alle Werte 0.0)
+
+        Returns:
+            Index des Slots
+        """
+        if self._free:
+            slot = self._free.pop()
+            for name in COLUMNS:
+                getattr(self, name)[slot] = 0.0
+            return slot
+        if self._next >= self.capacity:
+            self._grow(self.capacity * 2)
+        slot = self._next
+        self._next += 1
+        return slot
+
+    def release(self, slot: int):
+        """Gibt einen Slot frei (wird beim nächsten allocate() wiederverwendet)"""
+        self._free.append(slot)
+
+    def _grow(self, capacity: int):
+        extra = bytes(8 * (capacity - self.capacity))
+        for name in COLUMNS:
+            getattr(self, name).frombytes(extra)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        """Anzahl belegter Slots"""
+        return self._next - len(self._free)
+
+
+# Speicher für Objekte, die ohne eigenen Speicher erzeugt werden (z.B. in Tests)
+_shared_store = TransformStore()
+
+
+def get_shared_store() -> TransformStore:
+    """Gibt den gemeinsamen Standard-Speicher zurück"""
+    return _shared_store
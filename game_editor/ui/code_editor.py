@@ -16,6 +16,7 @@ import json
 # LSP-Module importieren
 from .lsp_client import LSPClient
 from .syntax_highlighter import LSPSyntaxHighlighter
+from ..engine.code_cache import ValidationCache
 
 # Editor-Import: Nur QTextEdit (kein QScintilla mehr)
 # WICHTIG: Nur eine Binding-Ebene (PySide6) - keine PyQt5/PyQt6
@@ -38,11 +39,13 @@ class CustomTextEdit(QTextEdit):
         """Richtet grundlegende Auto-Vervollständigung ein (Fallback wenn LSP nicht verfügbar)"""
         # API-Funktionen für Auto-Vervollständigung
         api_keywords = [
-            "get_object", "get_all_objects",
-            "key_pressed", "key_down", "mouse_position",
+            "get_object", "get_all_objects", "all_collisions",
+            "key_pressed", "key_down", "key_up", "mouse_position",
+            "mouse_pressed", "mouse_down", "mouse_up",
             "print_debug", "spawn_object",
             "move_with_collision", "push_objects",
             "lock_y_position", "unlock_y_position",
+            "delta_time",
         ]
         
         # GameObject-Attribute
@@ -230,6 +233,7 @@ class CodeEditor(QWidget):
         self.undo_redo_manager = None  # Wird vom main_window gesetzt
         self.scene_canvas = None
         self.code_language: str = "deutsch"  # "deutsch" oder "englisch"  # Wird vom main_window gesetzt (für Objekt-Updates)
+        self.validation_cache = ValidationCache()  # Sprach-Prüfung pro Skript (für den Start-Button)
         self.last_text = ""  # Letzter Text für Undo/Redo
         self.last_syntax_text = ""  # Letzter Text für Syntax-Highlighting-Check
         self.text_change_timer = QTimer()
@@ -492,6 +496,7 @@ class CodeEditor(QWidget):
         """Lädt Projekt und öffnet game.py"""
         self.project_path = project_path
         self.current_object_id = None
+        self.validation_cache = ValidationCache()
         
         # Sprache laden (vor allem anderen)
         self._load_language_setting()
@@ -773,6 +778,9 @@ definiere aktualisiere():
             with open(scene_file, 'w', encoding='utf-8') as f:
                 json.dump(scene_data, f, indent=2, ensure_ascii=False)
             
+            # Sprach-Prüfung schon jetzt im Hintergrund (Start-Button nutzt das Ergebnis)
+            self.validation_cache.validate_in_background(f"Objekt {object_id}", code, self.code_language)
+            
             # WICHTIG: Auch self.objects in scene_canvas aktualisieren, damit die Daten synchron bleiben
             if self.scene_canvas:
                 for obj in self.scene_canvas.objects:
@@ -1022,11 +1030,25 @@ spieler = hole_objekt("player")</pre>
         <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
 alle_objekte = hole_alle_objekte()</pre>
         
+        <h3 style="color: #90caf9;">alle_kollisionen(objekt)</h3>
+        <p>Gibt alle Objekte zurück, deren Kollisionsbox die des Objekts berührt (ohne eigene Schleife über alle Objekte).</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+für andere in alle_kollisionen(spieler):
+    wenn andere.id.startswith("muenze"):
+        andere.zerstöre()</pre>
+        
+        <h3 style="color: #90caf9;">erstelle_objekt(vorlage)</h3>
+        <p>Erstellt während des Spiels ein neues Objekt (z.B. Schüsse). Zerstörte Objekte werden wiederverwendet.</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+kugel = erstelle_objekt({"id": "kugel", "x": spieler.x, "y": spieler.y,
+                         "sprite": "assets/images/kugel.png",
+                         "collider": {"enabled": wahr}})</pre>
+        
         <h2 style="color: #4a9eff;">Input-Funktionen</h2>
         
         <h3 style="color: #90caf9;">taste_gedrückt(taste)</h3>
         <p>Prüft ob eine Taste gedrückt gehalten wird.</p>
-        <p><b>Verfügbare Tasten:</b> "LINKS", "RECHTS", "HOCH", "RUNTER", "SPACE", "ENTER", "W", "A", "S", "D", "F1"</p>
+        <p><b>Verfügbare Tasten:</b> "LINKS", "RECHTS", "HOCH", "RUNTER", "SPACE", "ENTER", "W", "A", "S", "D", "F1" - und alle anderen Tasten wie "Q", "1", "F5", "TAB", "UMSCHALT"</p>
         <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
 wenn taste_gedrückt("RECHTS") oder taste_gedrückt("D"):
     spieler.x += 4</pre>
@@ -1037,11 +1059,29 @@ wenn taste_gedrückt("RECHTS") oder taste_gedrückt("D"):
 wenn taste_runter("SPACE"):
     drucke_debug("Springen!")</pre>
         
+        <h3 style="color: #90caf9;">taste_losgelassen(taste)</h3>
+        <p>Prüft ob eine Taste gerade losgelassen wurde (nur einmal beim Loslassen).</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+wenn taste_losgelassen("SPACE"):
+    drucke_debug("Sprung-Taste losgelassen")</pre>
+        
         <h3 style="color: #90caf9;">maus_position()</h3>
         <p>Gibt die aktuelle Mausposition zurück (x, y).</p>
         <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
 mx, my = maus_position()</pre>
         
+        <h3 style="color: #90caf9;">maus_gedrückt(taste) / maus_runter(taste) / maus_losgelassen(taste)</h3>
+        <p>Wie bei den Tasten: gedrückt gehalten, gerade gedrückt, gerade losgelassen. Maustasten: "LINKS", "MITTE", "RECHTS".</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+wenn maus_runter("LINKS"):
+    mx, my = maus_position()
+    drucke_debug(f"Klick bei {mx}, {my}")</pre>
+        
+        <h3 style="color: #90caf9;">zeit_delta()</h3>
+        <p>Gibt die Dauer eines Simulationsschritts in Sekunden zurück (z.B. 0.0167 bei 60 Schritten pro Sekunde).</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+spieler.x += 120 * zeit_delta()  # 120 Pixel pro Sekunde</pre>
+        
         <h2 style="color: #4a9eff;">GameObject-Eigenschaften</h2>
         
         <p>Jedes Objekt hat folgende Eigenschaften:</p>
@@ -1191,11 +1231,25 @@ player = get_object("player")</pre>
         <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
 all_objects = get_all_objects()</pre>
         
+        <h3 style="color: #90caf9;">all_collisions(obj)</h3>
+        <p>Returns all objects whose collision box touches the object's box (no need to loop over all objects yourself).</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+for other in all_collisions(player):
+    if other.id.startswith("coin"):
+        other.destroy()</pre>
+        
+        <h3 style="color: #90caf9;">spawn_object(template)</h3>
+        <p>Creates a new object while the game is running (e.g. bullets). Destroyed objects are reused.</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+bullet = spawn_object({"id": "bullet", "x": player.x, "y": player.y,
+                       "sprite": "assets/images/bullet.png",
+                       "collider": {"enabled": True}})</pre>
+        
         <h2 style="color: #4a9eff;">Input Functions</h2>
         
         <h3 style="color: #90caf9;">key_pressed(key)</h3>
         <p>Checks if a key is being held down.</p>
-        <p><b>Available keys:</b> "LEFT", "RIGHT", "UP", "DOWN", "SPACE", "ENTER", "W", "A", "S", "D", "F1"</p>
+        <p><b>Available keys:</b> "LEFT", "RIGHT", "UP", "DOWN", "SPACE", "ENTER", "W", "A", "S", "D", "F1" - and every other key such as "Q", "1", "F5", "TAB", "SHIFT"</p>
         <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
 if key_pressed("RIGHT") or key_pressed("D"):
     player.x += 4</pre>
@@ -1206,11 +1260,29 @@ if key_pressed("RIGHT") or key_pressed("D"):
 if key_down("SPACE"):
     print_debug("Jumping!")</pre>
         
+        <h3 style="color: #90caf9;">key_up(key)</h3>
+        <p>Checks if a key was just released (only once when released).</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+if key_up("SPACE"):
+    print_debug("Jump key released")</pre>
+        
         <h3 style="color: #90caf9;">mouse_position()</h3>
         <p>Returns the current mouse position (x, y).</p>
         <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
 mx, my = mouse_position()</pre>
         
+        <h3 style="color: #90caf9;">mouse_pressed(button) / mouse_down(button) / mouse_up(button)</h3>
+        <p>Like the key functions: held down, just pressed, just released. Buttons: "LEFT", "MIDDLE", "RIGHT".</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+if mouse_down("LEFT"):
+    mx, my = mouse_position()
+    print_debug(f"Click at {mx}, {my}")</pre>
+        
+        <h3 style="color: #90caf9;">delta_time()</h3>
+        <p>Returns the duration of one simulation step in seconds (e.g. 0.0167 at 60 steps per second).</p>
+        <pre style="background-color: #1e1e1e; padding: 10px; border-radius: 3px; color: #d4d4d4;">
+player.x += 120 * delta_time()  # 120 pixels per second</pre>
+        
         <h2 style="color: #4a9eff;">GameObject Properties</h2>
         
         <p>Every object has the following properties:</p>
@@ -1378,6 +1450,9 @@ def update():
             with open(code_file, 'w', encoding='utf-8') as f:
                 f.write(code)
             
+            # Sprach-Prüfung schon jetzt im Hintergrund (Start-Button nutzt das Ergebnis)
+            self.validation_cache.validate_in_background("game.py", code, self.code_language)
+            
         except Exception as e:
             print(f"Fehler beim Speichern von game.py: {e}")
     
@@ -1545,47 +1620,28 @@ def update():
             return False
         
         try:
-            from game_editor.engine.german_code_translator import translate_code_reverse, translate_code
+            from game_editor.engine.german_code_translator import get_translator
             import json
             
             success = True
             error_messages = []
+            sources = {}  # Name -> Code, alles wird in einem Aufruf übersetzt
             
-            # 1. game.py übersetzen
+            # 1. game.py einlesen
             game_code_file = self.project_path / "code" / "game.py"
             if game_code_file.exists():
                 try:
                     with open(game_code_file, 'r', encoding='utf-8') as f:
                         code = f.read()
-                    
                     if code and code.strip():
-                        translated_code = code
-                        error_msg = ""
-                        
-                        if from_language == "deutsch" and to_language == "englisch":
-                            translated_code, _, _ = translate_code(code, validate_language=False, expected_language="deutsch")
-                        elif from_language == "englisch" and to_language == "deutsch":
-                            translated_code, trans_success, error_msg = translate_code_reverse(code, "deutsch")
-                            if not trans_success:
-                                success = False
-                                error_messages.append(f"game.py: {error_msg}")
-                        
-                        if success:
-                            with open(game_code_file, 'w', encoding='utf-8') as f:
-                                f.write(translated_code)
-                            
-                            # Wenn aktuell game.py im Editor ist, aktualisieren
-                            if not self.current_object_id:
-                                if hasattr(self.editor, 'setText'):
-                                    self.editor.setText(translated_code)
-                                else:
-                                    self.editor.setPlainText(translated_code)
-                                self.editor.apply_syntax_highlighting(translated_code)
+                        sources["game.py"] = code
                 except Exception as e:
                     error_messages.append(f"game.py: {str(e)}")
                     success = False
             
-            # 2. Alle Objekt-Codes übersetzen
+            # 2. Alle Objekt-Codes einlesen
+            scene_file = None
+            objects = []
             project_file = self.project_path / "project.json"
             if project_file.exists():
                 try:
@@ -1598,50 +1654,80 @@ def update():
                     if scene_file.exists():
                         with open(scene_file, 'r', encoding='utf-8') as f:
                             scene_data = json.load(f)
-                        
                         objects = scene_data.get("objects", [])
-                        for obj in objects:
-                            obj_id = obj.get("id")
+                        for index, obj in enumerate(objects):
                             obj_code = obj.get("code", "")
-                            
                             if obj_code and obj_code.strip():
-                                translated_code = obj_code
-                                error_msg = ""
-                                
-                                if from_language == "deutsch" and to_language == "englisch":
-                                    translated_code, _, _ = translate_code(obj_code, validate_language=False, expected_language="deutsch")
-                                elif from_language == "englisch" and to_language == "deutsch":
-                                    translated_code, trans_success, error_msg = translate_code_reverse(obj_code, "deutsch")
-                                    if not trans_success:
-                                        error_messages.append(f"Objekt {obj_id}: {error_msg}")
-                                        success = False
-                                        continue
-                                
-                                # Code im Objekt aktualisieren
-                                obj["code"] = translated_code
-                                
-                                # Wenn aktuell dieses Objekt im Editor ist, aktualisieren
-                                if self.current_object_id == obj_id:
-                                    if hasattr(self.editor, 'setText'):
-                                        self.editor.setText(translated_code)
-                                    else:
-                                        self.editor.setPlainText(translated_code)
-                                    self.editor.apply_syntax_highlighting(translated_code)
+                                sources[f"objekt_{index}"] = obj_code
+                    else:
+                        scene_file = None
+                except Exception as e:
+                    error_messages.append(f"Szene: {str(e)}")
+                    success = False
+                    scene_file = None
+            
+            # 3. Alles auf einmal übersetzen (sehr große Projekte mit mehreren Prozessen)
+            results = get_translator().translate_many(sources, from_language, to_language)
+            
+            # 4. game.py speichern
+            if "game.py" in results:
+                try:
+                    translated_code, trans_success, error_msg = results["game.py"]
+                    if not trans_success:
+                        success = False
+                        error_messages.append(f"game.py: {error_msg}")
+                    
+                    if success:
+                        with open(game_code_file, 'w', encoding='utf-8') as f:
+                            f.write(translated_code)
+                        
+                        # Wenn aktuell game.py im Editor ist, aktualisieren
+                        if not self.current_object_id:
+                            if hasattr(self.editor, 'setText'):
+                                self.editor.setText(translated_code)
+                            else:
+                                self.editor.setPlainText(translated_code)
+                            self.editor.apply_syntax_highlighting(translated_code)
+                except Exception as e:
+                    error_messages.append(f"game.py: {str(e)}")
+                    success = False
+            
+            # 5. Objekt-Codes aktualisieren und Szene speichern
+            if scene_file is not None:
+                try:
+                    for index, obj in enumerate(objects):
+                        if f"objekt_{index}" not in results:
+                            continue
+                        obj_id = obj.get("id")
+                        translated_code, trans_success, error_msg = results[f"objekt_{index}"]
+                        if not trans_success:
+                            error_messages.append(f"Objekt {obj_id}: {error_msg}")
+                            success = False
+                            continue
+                        
+                        # Code im Objekt aktualisieren
+                        obj["code"] = translated_code
+                        
+                        # Wenn aktuell dieses Objekt im Editor ist, aktualisieren
+                        if self.current_object_id == obj_id:
+                            if hasattr(self.editor, 'setText'):
+                                self.editor.setText(translated_code)
+                            else:
+                                self.editor.setPlainText(translated_code)
+                            self.editor.apply_syntax_highlighting(translated_code)
+                    
+                    # Szene speichern
+                    if success:
+                        with open(scene_file, 'w', encoding='utf-8') as f:
+                            json.dump(scene_data, f, indent=2, ensure_ascii=False)
                         
-                        # Szene speichern
-                        if success:
-                            with open(scene_file, 'w', encoding='utf-8') as f:
-                                json.dump(scene_data, f, indent=2, ensure_ascii=False)
-                            
-                            # Auch self.objects in scene_canvas aktualisieren
-                            if self.scene_canvas:
-                                for obj in self.scene_canvas.objects:
-                                    obj_id = obj.get("id")
-                                    # Finde entsprechende Übersetzung
-                                    for updated_obj in objects:
-                                        if updated_obj.get("id") == obj_id:
-                                            obj["code"] = updated_obj.get("code", "")
-                                            break
+                        # Auch self.objects in scene_canvas aktualisieren
+                        if self.scene_canvas:
+                            codes_by_id = {obj.get("id"): obj.get("code", "") for obj in objects}
+                            for obj in self.scene_canvas.objects:
+                                obj_id = obj.get("id")
+                                if obj_id in codes_by_id:
+                                    obj["code"] = codes_by_id[obj_id]
                 except Exception as e:
                     error_messages.append(f"Szene: {str(e)}")
                     success = False
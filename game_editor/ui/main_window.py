@@ -708,28 +708,35 @@ class EditorMainWindow(QMainWindow):
         """
         Validiert alle Codes (game.py + alle Objekt-Codes) auf Sprach-Konformität
         
+        Nur seit dem letzten Speichern geänderte Skripte werden neu geprüft (ValidationCache).
+        
         Returns:
             True wenn alle Codes gültig sind, False wenn Fehler gefunden wurden
         """
         if not self.project_path:
             return True
         
-        # Sprache laden
-        code_language = "deutsch"  # Standard
-        try:
-            settings_file = self.project_path / "code_editor_settings.json"
-            if settings_file.exists():
-                import json
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    code_language = settings.get("code_language", "deutsch")
-        except Exception:
-            pass
-        
-        from game_editor.engine.german_code_translator import validate_code_language
+        # Sprache und Cache vom Code-Editor (Ergebnisse vom Speichern wiederverwenden)
+        from game_editor.engine.code_cache import ValidationCache
         import json
         
-        all_errors = []  # Liste von (datei, zeile, nachricht) Tuples
+        if self.code_editor:
+            code_language = self.code_editor.code_language
+            validation_cache = self.code_editor.validation_cache
+        else:
+            code_language = "deutsch"  # Standard
+            try:
+                settings_file = self.project_path / "code_editor_settings.json"
+                if settings_file.exists():
+                    with open(settings_file, 'r', encoding='utf-8') as f:
+                        settings = json.load(f)
+                        code_language = settings.get("code_language", "deutsch")
+            except Exception:
+                pass
+            validation_cache = ValidationCache()
+        
+        all_errors = []  # Liste von (datei, zeile, spalte, nachricht) Tuples
+        script_ids = []  # Alle geprüften Skripte (Rest wird im Cache vergessen)
         
         # 1. game.py validieren
         game_code_file = self.project_path / "code" / "game.py"
@@ -737,44 +744,50 @@ class EditorMainWindow(QMainWindow):
             try:
                 with open(game_code_file, 'r', encoding='utf-8') as f:
                     code = f.read()
-                if code and code.strip():
-                    is_valid, error_message, error_line = validate_code_language(code, code_language)
-                    if not is_valid:
-                        all_errors.append(("game.py", error_line, error_message))
+                script_ids.append("game.py")
+                for error_line, error_column, error_message in validation_cache.validate("game.py", code, code_language):
+                    all_errors.append(("game.py", error_line, error_column, error_message))
             except Exception:
                 pass  # Fehler ignorieren
         
         # 2. Alle Objekt-Codes validieren
+        # Die Szene ist gerade gespeichert worden - die Objekte im Scene Canvas sind
+        # auf dem gleichen Stand (der Code-Editor aktualisiert beide), Szene nicht neu laden
         try:
-            project_file = self.project_path / "project.json"
-            if project_file.exists():
-                with open(project_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                start_scene = config.get("start_scene", "level1")
-                scene_file = self.project_path / "scenes" / f"{start_scene}.json"
-                
-                if scene_file.exists():
-                    with open(scene_file, 'r', encoding='utf-8') as f:
-                        scene_data = json.load(f)
+            if self.scene_canvas:
+                objects = self.scene_canvas.objects
+            else:
+                objects = []
+                project_file = self.project_path / "project.json"
+                if project_file.exists():
+                    with open(project_file, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
+                    
+                    start_scene = config.get("start_scene", "level1")
+                    scene_file = self.project_path / "scenes" / f"{start_scene}.json"
                     
-                    objects = scene_data.get("objects", [])
-                    for obj in objects:
-                        obj_id = obj.get("id")
-                        obj_code = obj.get("code", "")
-                        if obj_code and obj_code.strip():
-                            is_valid, error_message, error_line = validate_code_language(obj_code, code_language)
-                            if not is_valid:
-                                all_errors.append((f"Objekt {obj_id}", error_line, error_message))
+                    if scene_file.exists():
+                        with open(scene_file, 'r', encoding='utf-8') as f:
+                            scene_data = json.load(f)
+                        objects = scene_data.get("objects", [])
+            
+            for obj in objects:
+                script_id = f"Objekt {obj.get('id')}"
+                script_ids.append(script_id)
+                for error_line, error_column, error_message in validation_cache.validate(
+                        script_id, obj.get("code") or "", code_language):
+                    all_errors.append((script_id, error_line, error_column, error_message))
         except Exception:
             pass  # Fehler ignorieren
         
+        validation_cache.retain(script_ids)
+        
         # Fehler im Console ausgeben (mit Counter)
         if all_errors:
             # Fehler gruppieren nach Nachricht
             error_counter = {}
-            for datei, zeile, nachricht in all_errors:
-                key = (datei, zeile, nachricht)
+            for datei, zeile, spalte, nachricht in all_errors:
+                key = (datei, zeile, spalte, nachricht)
                 if key not in error_counter:
                     error_counter[key] = 0
                 error_counter[key] += 1
@@ -786,11 +799,11 @@ class EditorMainWindow(QMainWindow):
             self.console.append_error(f"SPRACH-FEHLER: Code verwendet falsche Sprache (erwartet: {code_language})")
             self.console.append_error("=" * 60)
             
-            for (datei, zeile, nachricht), count in error_counter.items():
+            for (datei, zeile, spalte, nachricht), count in error_counter.items():
                 if count > 1:
-                    self.console.append_error(f"[{count}x] {datei}, Zeile {zeile}: {nachricht}")
+                    self.console.append_error(f"[{count}x] {datei}, Zeile {zeile}, Spalte {spalte}: {nachricht}")
                 else:
-                    self.console.append_error(f"{datei}, Zeile {zeile}: {nachricht}")
+                    self.console.append_error(f"{datei}, Zeile {zeile}, Spalte {spalte}: {nachricht}")
             
             self.console.append_error("")
             self.console.append_error("FEHLER: Spiel kann nicht gestartet werden.")
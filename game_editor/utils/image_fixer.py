@@ -3,8 +3,10 @@ Image Fixer - Behebt iCCP-Profil-Probleme in PNG-Bildern
 Verwendet Pillow (PIL) als primäre Methode, ImageMagick (Wand) als Fallback
 """
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, List
+import json
 import logging
+import struct
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,152 @@ else:
     HAS_WAND = False
 
 
+# PNG-Signatur (erste 8 Bytes jeder PNG-Datei)
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def has_iccp_chunk(image_path: Path) -> bool:
+    """
+    Prüft ob eine PNG-Datei einen iCCP-Chunk (ICC-Farbprofil) enthält
+    
+    Liest nur die Chunk-Köpfe (Länge + Typ) und überspringt die Daten -
+    die Pixel werden nicht dekodiert. iCCP muss laut PNG-Spezifikation vor
+    dem ersten IDAT-Chunk stehen, daher wird dort abgebrochen.
+    
+    Args:
+        image_path: Pfad zum Bild
+    
+    Returns:
+        True wenn ein iCCP-Chunk vorhanden ist, sonst False (auch bei Nicht-PNG/Fehler)
+    """
+    try:
+        with open(image_path, 'rb') as f:
+            if f.read(8) != _PNG_SIGNATURE:
+                return False
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return False
+                length, chunk_type = struct.unpack('>I4s', header)
+                if chunk_type == b'iCCP':
+                    return True
+                if chunk_type in (b'IDAT', b'IEND'):
+                    return False
+                # Chunk-Daten und CRC (4 Bytes) überspringen
+                f.seek(length + 4, 1)
+    except OSError as e:
+        logger.debug(f"PNG-Chunks konnten nicht gelesen werden ({image_path}): {e}")
+        return False
+
+
+class IccpFixCache:
+    """
+    Merkt sich, welche Bilder bereits geprüft/korrigiert wurden (z.B. .cache/iccp.json)
+    
+    Schlüssel ist der Pfad, gültig ist ein Eintrag nur solange Dateigröße und
+    Änderungszeit übereinstimmen. Bereits saubere Bilder werden so bei jedem
+    Spielstart übersprungen, ohne sie zu öffnen oder neu zu schreiben.
+    """
+    
+    def __init__(self, cache_file: Path, base_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_file: JSON-Datei für den Zustand
+            base_dir: Pfade werden relativ dazu gespeichert (z.B. Projektordner)
+        """
+        self.cache_file = cache_file
+        self.base_dir = base_dir
+        self._entries: Dict[str, List[int]] = {}
+        self._dirty = False
+        self._load()
+    
+    @classmethod
+    def for_project(cls, project_dir: Path) -> 'IccpFixCache':
+        """Erstellt den Cache für ein Projekt (.cache/iccp.json im Projektordner)"""
+        return cls(project_dir / ".cache" / "iccp.json", base_dir=project_dir)
+    
+    def _load(self):
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = {key: value for key, value in data.items()
+                                 if isinstance(value, list) and len(value) == 2}
+        except Exception as e:
+            logger.debug(f"iCCP-Cache konnte nicht gelesen werden ({self.cache_file}): {e}")
+            self._entries = {}
+    
+    def _key(self, image_path: Path) -> str:
+        if self.base_dir is not None:
+            try:
+                return image_path.relative_to(self.base_dir).as_posix()
+            except ValueError:
+                pass
+        return str(image_path)
+    
+    @staticmethod
+    def _signature(image_path: Path) -> Optional[List[int]]:
+        try:
+            stat = image_path.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def is_clean(self, image_path: Path) -> bool:
+        """True wenn das Bild unverändert seit der letzten Prüfung ist"""
+        entry = self._entries.get(self._key(image_path))
+        return entry is not None and entry == self._signature(image_path)
+    
+    def mark_clean(self, image_path: Path):
+        """Merkt sich den aktuellen Zustand des Bildes als geprüft"""
+        signature = self._signature(image_path)
+        if signature is None:
+            return
+        key = self._key(image_path)
+        if self._entries.get(key) != signature:
+            self._entries[key] = signature
+            self._dirty = True
+    
+    def save(self):
+        """Schreibt den Cache (nur wenn sich etwas geändert hat)"""
+        if not self._dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"iCCP-Cache konnte nicht gespeichert werden ({self.cache_file}): {e}")
+
+
+def fix_iccp_profile_cached(image_path: Path, cache: Optional[IccpFixCache] = None) -> bool:
+    """
+    Wie fix_iccp_profile(), schreibt das Bild aber nur neu, wenn es wirklich
+    einen iCCP-Chunk enthält - und überspringt bereits geprüfte Bilder ganz
+    
+    Args:
+        image_path: Pfad zum Bild
+        cache: Zustands-Cache (None = nur Chunk-Prüfung, kein Merken)
+    
+    Returns:
+        True wenn das Bild sauber ist (oder korrigiert wurde), False bei Fehler
+    """
+    if image_path.suffix.lower() != '.png':
+        return True
+    if cache is not None and cache.is_clean(image_path):
+        return True
+    if has_iccp_chunk(image_path):
+        if not fix_iccp_profile(image_path, backup=False):
+            return False
+    if cache is not None:
+        # Nach einer Korrektur mit neuer Größe/Änderungszeit merken
+        cache.mark_clean(image_path)
+    return True
+
+
 def fix_iccp_profile(image_path: Path, backup: bool = False) -> bool:
     """
     Behebt iCCP-Profil-Probleme in PNG-Bildern
@@ -66,8 +214,9 @@ def fix_iccp_profile(image_path: Path, backup: bool = False) -> bool:
             img = PILImage.open(image_path)
             
             # iCCP-Profil entfernen: Bild ohne ICC-Profil neu speichern
-            # Pillow entfernt automatisch fehlerhafte Profile beim Speichern
-            # Wir speichern explizit ohne Profil
+            # WICHTIG: Pillow übernimmt das Profil aus img.info beim Speichern -
+            # wir entfernen es vorher, damit explizit ohne Profil gespeichert wird
+            img.info.pop('icc_profile', None)
             img.save(image_path, 'PNG', optimize=False)
             img.close()
             
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Test-Skript für die Stütz-Kontakte (Mitbewegung auf Plattformen)"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Pfad hinzufügen
+sys.path.insert(0, str(Path(__file__).parent))
+
+from game_editor.engine import api
+from game_editor.engine.gameobject import GameObject
+
+print("=" * 60)
+print("TEST: Stütz-Kontakte")
+print("=" * 60)
+
+
+def make_object(obj_id: str, x: float, y: float, width: int, height: int) -> GameObject:
+    """Erstellt ein Objekt mit Kollisionsbox in Objektgröße"""
+    data = {"id": obj_id, "x": x, "y": y, "width": width, "height": height,
+            "collider": {"enabled": True}}
+    return GameObject(data, Path("."), sprite_size=32)
+
+
+def step(platform: GameObject, dx: float):
+    """Wie die Runtime in einem Simulationsschritt: Kontakte prüfen, Plattform bewegen, mitbewegen"""
+    api._begin_contact_frame()
+    platform.x += dx  # "Update" der Plattform
+    api._apply_support_contacts()
+
+
+ground = make_object("boden", 0, 400, 800, 32)
+ground._is_static = True
+platform = make_object("plattform", 240, 300, 96, 16)
+# Kisten ohne eigenen Code: Kiste auf Kiste auf Plattform
+lower_crate = make_object("kiste_unten", 260, 268, 32, 32)
+upper_crate = make_object("kiste_oben", 260, 236, 32, 32)
+player = make_object("spieler", 600, 360, 32, 32)
+objects = [ground, platform, lower_crate, upper_crate, player]
+for obj in objects:
+    obj.set_all_objects(objects)
+api._init_api(objects, cell_size=32)
+graph = api._contact_graph
+
+# Test 1: Beim Laden werden Objekte ohne Code eingetragen, die schon auf anderen stehen
+try:
+    assert graph.support_of(lower_crate) is platform, "Untere Kiste steht nicht auf der Plattform"
+    assert graph.support_of(upper_crate) is lower_crate, "Obere Kiste steht nicht auf der unteren"
+    assert graph.support_of(player) is None, "Frei stehendes Objekt eingetragen"
+    print("[OK] Stapel beim Laden erkannt")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 2: Stapel fährt in einem Durchgang mit der Plattform mit
+try:
+    step(platform, 2)
+    assert lower_crate.x == 262 and upper_crate.x == 262, \
+        f"Stapel nicht mitbewegt: {lower_crate.x}, {upper_crate.x} (vorher 260)"
+    assert lower_crate.y == 268 and upper_crate.y == 236, "Stapel vertikal verschoben"
+    print("[OK] Kiste auf Kiste auf Plattform wird mitbewegt")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 3: Statische Träger (Boden) werden nicht eingetragen, bewegliche schon
+try:
+    on_ground, _, _ = api.move_with_collision(player, 0, 10)
+    assert on_ground and player.y == 368, f"Spieler nicht auf dem Boden gelandet (y = {player.y})"
+    assert graph.support_of(player) is None, "Kontakt zu statischem Boden eingetragen"
+    player.x, player.y = 300, 260
+    on_ground, _, _ = api.move_with_collision(player, 0, 10)
+    assert on_ground and graph.support_of(player) is platform, "Kontakt zur Plattform fehlt"
+    print("[OK] Nur bewegliche Träger werden eingetragen")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 4: Kontakte bis 3 Pixel Abstand bleiben, größere Abstände werden verworfen
+try:
+    upper_crate.y -= 3
+    step(platform, 2)
+    assert graph.support_of(upper_crate) is lower_crate and upper_crate.x == 264, \
+        "Kontakt innerhalb der Toleranz verworfen"
+    upper_crate.y -= 1  # Jetzt 4 Pixel über der unteren Kiste (abgesprungen)
+    step(platform, 2)
+    assert graph.support_of(upper_crate) is None, "Kontakt trotz 4 Pixel Abstand behalten"
+    assert upper_crate.x == 264 and lower_crate.x == 266, "Abgesprungene Kiste trotzdem mitbewegt"
+    print("[OK] Kontakte werden mit 3 Pixel Toleranz geprüft")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+print("\n" + "=" * 60)
+print("ALLE TESTS BESTANDEN")
+print("=" * 60)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Test-Skript für den Eingabe-Zustand (Tasten und Maus aus Events)"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Pfad hinzufügen
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pygame
+from game_editor.engine import api
+
+pygame.init()
+
+print("=" * 60)
+print("TEST: Eingabe-Zustand")
+print("=" * 60)
+
+
+def key_event(event_type: int, key_code: int) -> pygame.event.Event:
+    return pygame.event.Event(event_type, key=key_code)
+
+
+api._reset_input()
+
+# Test 1: Gedrückt, gerade gedrückt, gerade losgelassen (deutsche und englische Namen)
+try:
+    api._handle_input_event(key_event(pygame.KEYDOWN, pygame.K_LEFT))
+    api._update_key_states()
+    assert api.key_pressed("LEFT") and api.taste_gedrückt("LINKS"), "Taste nicht gedrückt"
+    assert api.key_down("left") and api.taste_runter("LINKS"), "Drücken nicht erkannt"
+    assert not api.key_up("LEFT"), "Loslassen zu früh erkannt"
+    api._update_key_states()
+    assert api.key_pressed("LEFT") and not api.key_down("LEFT"), "Drücken gilt länger als einen Schritt"
+    api._handle_input_event(key_event(pygame.KEYUP, pygame.K_LEFT))
+    api._update_key_states()
+    assert not api.key_pressed("LEFT") and api.taste_losgelassen("LINKS"), "Loslassen nicht erkannt"
+    api._update_key_states()
+    assert not api.key_up("LEFT"), "Loslassen gilt länger als einen Schritt"
+    print("[OK] Gedrückt / gerade gedrückt / gerade losgelassen")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 2: Kurze Tastendrücke gehen nicht verloren, alle Tasten sind abfragbar
+try:
+    api._handle_input_event(key_event(pygame.KEYDOWN, pygame.K_q))
+    api._handle_input_event(key_event(pygame.KEYUP, pygame.K_q))
+    api._update_key_states()
+    assert api.key_down("Q") and api.key_up("Q") and not api.key_pressed("Q"), "Kurzer Druck verloren"
+    api._handle_input_event(key_event(pygame.KEYDOWN, pygame.K_F5))
+    # Kein Simulationsschritt in diesem Frame - der Druck wartet auf den nächsten Schritt
+    api._update_key_states()
+    assert api.key_down("F5"), "Druck vor dem Schritt verloren"
+    assert not api.key_pressed("GIBTS_NICHT") and not api.key_down(None), "Unbekannte Taste gedrückt"
+    print("[OK] Kurze Tastendrücke und beliebige Tasten werden erkannt")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 3: Maustasten und Mausposition
+try:
+    api._handle_input_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 20)))
+    api._update_key_states()
+    assert api.mouse_down() and api.maus_gedrückt("LINKS"), "Klick nicht erkannt"
+    assert api.maus_position() == (10, 20), "Mausposition stimmt nicht"
+    api._handle_input_event(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(12, 20)))
+    api._update_key_states()
+    assert api.mouse_up("LEFT") and not api.mouse_pressed("LEFT"), "Loslassen nicht erkannt"
+    assert not api.maus_runter("RECHTS"), "Falsche Maustaste"
+    # Fokus verloren: alles gilt als losgelassen
+    api._handle_input_event(key_event(pygame.KEYDOWN, pygame.K_SPACE))
+    api._handle_input_event(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    api._update_key_states()
+    assert not api.key_pressed("LEERTASTE"), "Taste bleibt nach Fokusverlust gedrückt"
+    print("[OK] Maustasten, Mausposition und Fokusverlust")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+print("\n" + "=" * 60)
+print("ALLE TESTS BESTANDEN")
+print("=" * 60)
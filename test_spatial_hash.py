@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Test-Skript für das räumliche Gitter (Spatial Hash) der Kollisionserkennung"""
+import os
+import sys
+import random
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Pfad hinzufügen
+sys.path.insert(0, str(Path(__file__).parent))
+
+from game_editor.engine import api
+from game_editor.engine.gameobject import GameObject
+
+print("=" * 60)
+print("TEST: Spatial Hash")
+print("=" * 60)
+
+
+def make_objects(count: int, seed: int) -> list:
+    """Erstellt zufällige Objekte (Boden und bewegliche Objekte)"""
+    rng = random.Random(seed)
+    objects = []
+    for i in range(count):
+        data = {
+            "id": f"obj_{i}",
+            "x": rng.randrange(-20, 40) * 16,
+            "y": rng.randrange(-10, 30) * 16,
+            "width": 32,
+            "height": 32,
+            "ground": rng.random() < 0.5,
+            "collider": {"enabled": True, "offset_x": rng.choice([0, 4]), "width": rng.choice([20, 32])},
+        }
+        objects.append(GameObject(data, Path("."), sprite_size=32))
+    for obj in objects:
+        obj.set_all_objects(objects)
+    return objects
+
+
+def brute_force_candidates(obj, objects):
+    """Alle Objekte, deren Kollisionsbox die von obj überlappt (ohne Gitter)"""
+    return [other for other in objects
+            if other is not obj and other._collider_enabled and obj.collides_with(other.id)]
+
+
+# Test 1: Abfragen liefern dieselben Kollisionen wie eine Prüfung aller Objekte
+try:
+    objects = make_objects(300, seed=1)
+    api._init_api(objects, cell_size=32)
+    rng = random.Random(2)
+    for _ in range(500):
+        obj = rng.choice(objects)
+        obj.x += rng.choice([-40, -3, 0, 3, 40])
+        obj.y += rng.choice([-25, -1, 0, 1, 25])
+        candidates = api._query_region(obj._collider_x, obj._collider_y,
+                                       obj._collider_x + obj._collider_width,
+                                       obj._collider_y + obj._collider_height)
+        expected = brute_force_candidates(obj, objects)
+        found = [other for other in candidates if other in expected]
+        assert found == expected, f"Gitter-Ergebnis weicht ab für {obj.id}"
+    print("[OK] Gitter-Abfragen stimmen mit vollständiger Prüfung überein")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 2: Kandidaten kommen in Listen-Reihenfolge
+try:
+    candidates = api._query_region(-1000, -1000, 1000, 1000)
+    assert candidates == sorted(candidates, key=objects.index), "Reihenfolge stimmt nicht"
+    print("[OK] Kandidaten sind in Listen-Reihenfolge sortiert")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 3: Zerstörte Objekte werden aus dem Gitter entfernt
+try:
+    victim = objects[0]
+    victim.destroy()
+    objects[:] = [obj for obj in objects if obj.visible]
+    api._unregister_objects([victim])
+    candidates = api._query_region(victim._collider_x, victim._collider_y,
+                                   victim._collider_x + 1, victim._collider_y + 1)
+    assert victim not in candidates, "Zerstörtes Objekt noch im Gitter"
+    print("[OK] Zerstörte Objekte werden aus dem Gitter entfernt")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 4: Statische Ebene (Boden-Tiles) liefert dieselben Kandidaten wie das Gitter
+try:
+    objects = make_objects(300, seed=3)
+    for obj in objects:
+        obj._is_static = obj.is_ground
+    api._init_api(objects, cell_size=32)
+    assert len(api._static_geometry) > 0, "Keine statischen Objekte gebacken"
+    rng = random.Random(4)
+    movers = [obj for obj in objects if not obj._is_static]
+    for _ in range(300):
+        obj = rng.choice(movers)
+        obj.x += rng.choice([-40, -3, 3, 40])
+        candidates = api._query_region(obj._collider_x, obj._collider_y,
+                                       obj._collider_x + obj._collider_width,
+                                       obj._collider_y + obj._collider_height)
+        expected = brute_force_candidates(obj, objects)
+        found = [other for other in candidates if other in expected]
+        assert found == expected, f"Statische Ebene weicht ab für {obj.id}"
+    print("[OK] Statische Ebene stimmt mit vollständiger Prüfung überein")
+    
+    # Bewegte Boden-Tiles wechseln automatisch ins dynamische Gitter
+    tile = next(obj for obj in objects if obj._is_static)
+    tile.x += 5
+    assert not tile._is_static and tile in api._spatial_hash, "Tile wurde nicht übernommen"
+    print("[OK] Bewegte Boden-Tiles werden dynamisch")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 5: Gebündelte Abfragen (all_pairs, all_collisions) - mit und ohne NumPy
+try:
+    from game_editor.engine.collision import CollisionSystem, HAS_NUMPY
+    objects = make_objects(300, seed=5)
+    api._init_api(objects, cell_size=32)
+    for use_numpy in sorted({False, HAS_NUMPY}):
+        system = CollisionSystem(objects, use_numpy=use_numpy)
+        pairs = [tuple(int(i) for i in pair) for pair in system.all_pairs()]
+        expected = [(i, j) for i in range(len(system.objects)) for j in range(i + 1, len(system.objects))
+                    if CollisionSystem.check_collision(system.objects[i], system.objects[j])]
+        assert pairs == expected, f"all_pairs weicht ab (NumPy: {use_numpy})"
+    for obj in objects[:50]:
+        assert api.all_collisions(obj) == brute_force_candidates(obj, objects), \
+            f"all_collisions weicht ab für {obj.id}"
+    print(f"[OK] all_pairs und all_collisions stimmen überein (NumPy: {HAS_NUMPY})")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 6: Sweep and Prune liefert dieselben Kollisionen wie eine Prüfung aller Objekte
+try:
+    objects = make_objects(300, seed=6)
+    api._init_api(objects, cell_size=32, broad_phase="sap")
+    sweep = api._spatial_hash
+    rng = random.Random(7)
+    for _ in range(500):
+        obj = rng.choice(objects)
+        obj.x += rng.choice([-40, -3, 0, 3, 40])
+        obj.y += rng.choice([-25, -1, 0, 1, 25])
+        expected = brute_force_candidates(obj, objects)
+        assert api.all_collisions(obj) == expected, f"Sweep and Prune weicht ab für {obj.id}"
+        partners = sorted(sweep.partners(obj), key=objects.index)
+        assert all(other in partners for other in expected), f"Partner fehlen für {obj.id}"
+    api._init_api(objects, cell_size=32)
+    print("[OK] Sweep and Prune stimmt mit vollständiger Prüfung überein")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 7: Sichtbarkeit bei interpoliertem Zeichnen (alte und neue Position zählen)
+try:
+    objects = make_objects(3, seed=8)
+    for obj, x in zip(objects, (300, -200, 1000)):
+        obj.x, obj.y, obj._is_static = x, 100, False
+    api._init_api(objects, cell_size=32)
+    leaving, entering, far_away = objects
+    previous_positions = api._snapshot_positions()
+    leaving.x = 400  # Großer Schritt aus dem Ausschnitt (0..320), wird aber noch dazwischen gezeichnet
+    entering.x = -10  # In den Ausschnitt hinein
+    visible = api._query_visible(0, 0, 320, 240, include_static=False)
+    assert leaving not in visible, "Objekt außerhalb ohne alte Position sichtbar"
+    visible = api._query_visible(0, 0, 320, 240, include_static=False, previous_positions=previous_positions)
+    assert visible == [leaving, entering], f"Falsche sichtbare Objekte: {[obj.id for obj in visible]}"
+    print("[OK] Sichtbarkeit prüft alte und neue Position")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+print("\n" + "=" * 60)
+print("ALLE TESTS BESTANDEN")
+print("=" * 60)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Test-Skript für spawn_object() mit Objekt-Pool"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Pfad hinzufügen
+sys.path.insert(0, str(Path(__file__).parent))
+
+from game_editor.engine import api
+from game_editor.engine.gameobject import GameObject
+from game_editor.engine.world import TransformStore
+
+print("=" * 60)
+print("TEST: spawn_object")
+print("=" * 60)
+
+BULLET = {"id": "kugel", "type": "sprite", "width": 8, "height": 8,
+          "collider": {"enabled": True}}
+
+
+def end_of_step(objects: list):
+    """Wie die Runtime am Ende eines Simulationsschritts: Zerstörte entfernen, Neue aufnehmen"""
+    destroyed = [obj for obj in objects if not obj.visible]
+    if destroyed:
+        objects[:] = [obj for obj in objects if obj.visible]
+        api._unregister_objects(destroyed)
+        api._recycle_objects(destroyed)
+    return api._flush_spawns()
+
+
+store = TransformStore()
+player = GameObject({"id": "spieler", "x": 0, "y": 0, "collider": {"enabled": True}},
+                    Path("."), sprite_size=32, store=store)
+objects = [player]
+player.set_all_objects(objects)
+api._init_api(objects, cell_size=32)
+api._set_spawn_context(Path("."), store=store)
+
+# Test 1: Gespawnte Objekte kommen erst am Ende des Schritts in Liste und Indizes
+try:
+    bullet = api.spawn_object({**BULLET, "x": 100, "y": 0})
+    assert bullet is not None and bullet.id == "kugel", "Kein Objekt erstellt"
+    assert bullet not in objects and api.get_object("kugel") is None, "Objekt zu früh aufgenommen"
+    second = api.spawn_object({**BULLET, "x": 100, "y": 0})
+    assert second.id != bullet.id, "IDs gespawnter Objekte sind nicht eindeutig"
+    end_of_step(objects)
+    assert objects[-2:] == [bullet, second], "Objekte nicht am Listenende aufgenommen"
+    assert api.get_object("kugel") is bullet, "Objekt nicht im ID-Index"
+    assert api.all_collisions(bullet) == [second], "Objekt nicht im räumlichen Gitter"
+    print("[OK] Gespawnte Objekte werden am Ende des Schritts aufgenommen")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 2: 1000 Objekte pro Sekunde - zerstörte werden wiederverwendet statt neu erstellt
+try:
+    created = {id(bullet), id(second)}
+    live = [bullet, second]
+    for step in range(600):
+        for _ in range(17):  # ~1000 pro Sekunde bei 60 Schritten
+            new = api.spawn_object({**BULLET, "x": step, "y": 50})
+            new.richtung = 1
+            created.add(id(new))
+            live.append(new)
+        # Jede Kugel lebt 30 Schritte
+        while len(live) > 17 * 30:
+            live.pop(0).destroy()
+        end_of_step(objects)
+        if step == 100:
+            slots_after_warmup = len(store)
+    assert len(store) == slots_after_warmup, "Speicher wächst trotz Pool"
+    assert len(created) <= 17 * 32, f"Zu viele Objekte erstellt: {len(created)}"
+    assert len(objects) == 1 + len(live), "Objekt-Liste stimmt nicht"
+    for obj in live[:20]:
+        assert api.get_object(obj.id) is obj, f"ID-Index stimmt nicht für {obj.id}"
+    print(f"[OK] Pool: {len(created)} Objekte für {600 * 17} Spawns, Speicher konstant")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 3: Noch vor der Aufnahme zerstörte Objekte landen direkt im Pool
+try:
+    ghost = api.spawn_object({**BULLET, "x": 0, "y": 0})
+    ghost.richtung = -1
+    ghost.destroy()
+    assert ghost not in end_of_step(objects) and ghost not in objects, "Zerstörtes Objekt aufgenommen"
+    assert api.spawn_object({**BULLET, "x": 5, "y": 5}) is ghost, "Objekt nicht wiederverwendet"
+    assert ghost.visible and ghost.x == 5, "Wiederverwendetes Objekt nicht zurückgesetzt"
+    assert not hasattr(ghost, "richtung"), "Eigene Attribute des alten Objekts übernommen"
+    print("[OK] Vor der Aufnahme zerstörte Objekte werden wiederverwendet")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+print("\n" + "=" * 60)
+print("ALLE TESTS BESTANDEN")
+print("=" * 60)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Test-Skript für die vorgerenderte statische Ebene (Zeichenreihenfolge bleibt erhalten)"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Pfad hinzufügen
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pygame
+from game_editor.engine import api
+from game_editor.engine.gameobject import GameObject
+from game_editor.engine.renderer import StaticLayerCache, get_visible_objects, draw_objects
+
+print("=" * 60)
+print("TEST: Statische Ebene")
+print("=" * 60)
+
+BACKGROUND = (0, 0, 0)
+VIEW = (0, 0, 320, 240)
+
+
+def make_object(obj_id: str, x: float, y: float, color, collider: bool) -> GameObject:
+    """Erstellt ein 32x32-Objekt mit einfarbigem Sprite"""
+    data = {"id": obj_id, "x": x, "y": y, "width": 32, "height": 32,
+            "collider": {"enabled": collider}}
+    obj = GameObject(data, Path("."), sprite_size=32)
+    obj._sprite_surface = pygame.Surface((32, 32))
+    obj._sprite_surface.fill(color)
+    return obj
+
+
+def draw_frame(layer: StaticLayerCache) -> pygame.Surface:
+    """Zeichnet wie die Runtime: statische Chunks, dann dynamische (und späte statische) Objekte"""
+    screen = pygame.Surface(VIEW[2:])
+    screen.fill(BACKGROUND)
+    layer.draw(screen, *VIEW)
+    draw_objects(screen, get_visible_objects(*VIEW, include_static=False,
+                                             static_from_order=layer.unbaked_from))
+    return screen
+
+
+# Szenen-Liste: Boden, Wolke, Berg (vor der Wolke), Spieler, Busch (Deko vor dem Spieler)
+ground = make_object("boden", 100, 132, (255, 0, 0), collider=True)
+cloud = make_object("wolke", 100, 60, (255, 255, 0), collider=False)
+hill = make_object("berg", 100, 60, (255, 0, 255), collider=False)
+player = make_object("spieler", 100, 100, (0, 0, 255), collider=True)
+bush = make_object("busch", 116, 100, (0, 255, 0), collider=False)
+objects = [ground, cloud, hill, player, bush]
+for obj in objects:
+    obj.set_all_objects(objects)
+    # Wie loader.py: Boden-Tiles und Deko ohne Kollisionsbox sind statisch
+    obj._is_static = obj is not player
+api._init_api(objects, cell_size=32)
+layer = StaticLayerCache(BACKGROUND)
+api._add_static_removal_callback(layer.invalidate)
+layer.build(api._static_objects(), player._index_order)
+
+# Test 1: Nur statische Objekte vor dem ersten dynamischen Objekt werden gebacken
+try:
+    assert len(layer) == 3, f"Falsche Anzahl gebackener Objekte: {len(layer)}"
+    assert layer.unbaked_from == player._index_order, "Späte statische Objekte nicht gemeldet"
+    screen = draw_frame(layer)
+    assert screen.get_at((104, 64))[:3] == (255, 0, 255), "Berg nicht über der Wolke"
+    assert screen.get_at((104, 104))[:3] == (0, 0, 255), "Spieler fehlt"
+    assert screen.get_at((120, 104))[:3] == (0, 255, 0), "Busch nicht über dem Spieler"
+    assert screen.get_at((104, 140))[:3] == (255, 0, 0), "Boden fehlt"
+    print("[OK] Deko nach dem Spieler wird darüber gezeichnet")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 2: Bewegter Spieler bleibt unter dem Busch
+try:
+    api.move_with_collision(player, 8, 0)
+    screen = draw_frame(layer)
+    assert screen.get_at((120, 104))[:3] == (0, 255, 0), "Busch nach Bewegung unter dem Spieler"
+    assert screen.get_at((110, 104))[:3] == (0, 0, 255), "Spieler nicht an neuer Position"
+    print("[OK] Zeichenreihenfolge bleibt bei Bewegung erhalten")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 3: Wird ein gebackenes Objekt bewegt, kommen spätere nicht mehr darunter
+try:
+    cloud.x = 104  # Wolke wird dynamisch
+    assert not cloud._is_static, "Bewegte Wolke nicht dynamisch"
+    assert len(layer) == 1 and layer.unbaked_from == cloud._index_order, "Berg noch gebacken"
+    screen = draw_frame(layer)
+    assert screen.get_at((110, 64))[:3] == (255, 0, 255), "Berg nicht mehr über der Wolke"
+    assert screen.get_at((134, 64))[:3] == (255, 255, 0), "Wolke nicht an neuer Position"
+    assert screen.get_at((104, 140))[:3] == (255, 0, 0), "Boden fehlt"
+    assert screen.get_at((120, 104))[:3] == (0, 255, 0), "Busch nicht mehr über dem Spieler"
+    print("[OK] Bewegte statische Objekte behalten die Zeichenreihenfolge")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+api._remove_static_removal_callback(layer.invalidate)
+
+print("\n" + "=" * 60)
+print("ALLE TESTS BESTANDEN")
+print("=" * 60)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Test-Skript für den Übersetzer (Deutsch → Python in einem Durchlauf)"""
+import sys
+from pathlib import Path
+
+# Pfad hinzufügen
+sys.path.insert(0, str(Path(__file__).parent))
+
+from game_editor.engine.german_code_translator import (
+    translate_code, translate_code_reverse, detect_code_language, validate_code_language,
+    find_language_violations, get_translator, GERMAN_API_TO_ENGLISH
+)
+from game_editor.engine.code_cache import ValidationCache
+from game_editor.engine.api_aliases import API_FUNCTION_ALIASES, GAMEOBJECT_METHOD_ALIASES
+from game_editor.engine import api
+from game_editor.engine.gameobject import GameObject
+
+print("=" * 60)
+print("TEST: Übersetzer")
+print("=" * 60)
+
+
+def translate(code: str) -> str:
+    return translate_code(code)[0]
+
+
+# Test 1: Schlüsselwörter und API-Namen, aber nur ganze Wörter
+try:
+    assert translate("wenn x ist nicht keine:\n    gib_zurück wahr") == \
+        "if x is not None:\n    return True", "Schlüsselwörter nicht übersetzt"
+    assert translate("spieler.zerstöre()") == "spieler.destroy()", "API-Methode nicht übersetzt"
+    assert translate("wenn_gedrückt = 1") == "wenn_gedrückt = 1", "Teilwort übersetzt"
+    assert translate("obj.wenn = 1") == "obj.wenn = 1", "Attribut wie Schlüsselwort übersetzt"
+    print("[OK] Schlüsselwörter, API-Namen und Attribute")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 2: Strings und Kommentare bleiben unverändert, in f-Strings nur die Ausdrücke
+try:
+    assert translate('text = "wenn und oder"  # wenn nicht') == \
+        'text = "wenn und oder"  # wenn nicht', "String oder Kommentar verändert"
+    assert translate("s = '''\nwenn\n'''") == "s = '''\nwenn\n'''", "Mehrzeiliger String verändert"
+    assert translate('f"wenn {a und b} {{wenn}}"') == 'f"wenn {a and b} {{wenn}}"', \
+        "f-String falsch übersetzt"
+    print("[OK] Strings, Kommentare und f-Strings")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 3: Positionen im übersetzten Code → Original (für Fehlermeldungen)
+try:
+    german = "x = 1\nwenn bär ist nicht = 2:\n    überspringen"
+    python_code, position_map, _ = translate_code(german)
+    try:
+        compile(python_code, "<string>", "exec")
+        raise AssertionError("Kein Syntaxfehler")
+    except SyntaxError as error:
+        line, column = position_map.source_position(error.lineno, error.offset - 1)
+    assert (line, column) == (2, german.split("\n")[1].index("=")), f"Falsche Position: {line}, {column}"
+    assert position_map[3] == 3 and len(position_map) == 3, "Zeilen-Mapping stimmt nicht"
+    # Position innerhalb eines ersetzten Worts -> Anfang des Worts
+    assert position_map.source_position(2, 8) == (2, 9), "Position in ersetztem Wort falsch"
+    print("[OK] Zeilen und Spalten werden zurückgerechnet")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 4: Spracherkennung und Validierung (Strings und Kommentare zählen nicht)
+try:
+    german = "# für alle\nwenn x:\n    y = 'if'\n"
+    assert detect_code_language(german) == "deutsch", "Deutsch nicht erkannt"
+    assert detect_code_language("# wenn wenn wenn\nif x and y:\n    pass") == "englisch", "Englisch nicht erkannt"
+    assert validate_code_language(german, "deutsch") == (True, "", 0), "Gültiger Code abgelehnt"
+    mixed = "wenn x:\n    y = f'{a and b}'\nif z: return"
+    violations = find_language_violations(mixed, "deutsch")
+    assert [(line, column) for line, column, _ in violations] == [(2, 14), (3, 1), (3, 7)], \
+        f"Falsche Fehlerstellen: {violations}"
+    assert "'and'" in violations[0][2], "Fehlermeldung ohne Schlüsselwort"
+    is_valid, _, error_line = validate_code_language(mixed, "deutsch")
+    assert not is_valid and error_line == 2, "Erster Fehler nicht gemeldet"
+    print("[OK] Spracherkennung und Validierung")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 5: Validierungs-Cache prüft nur geänderte Skripte neu
+try:
+    cache = ValidationCache()
+    assert cache.validate("game.py", "wenn x: y()", "deutsch") == [], "Gültiger Code abgelehnt"
+    assert cache.validate("game.py", "wenn x: y()", "deutsch") == [], "Ergebnis aus Cache falsch"
+    assert cache.stats() == {"validated": 1, "hits": 1}, f"Unverändertes Skript neu geprüft: {cache.stats()}"
+    assert cache.validate("game.py", "wenn x: y()", "englisch"), "Sprachwechsel nicht erkannt"
+    assert cache.validate("game.py", "if x: y()", "englisch") == [], "Geänderter Code nicht neu geprüft"
+    cache.validate("Objekt alt", "wenn x: y()", "deutsch")
+    cache.retain(["game.py"])
+    cache.validate("Objekt alt", "wenn x: y()", "deutsch")
+    assert cache.stats()["validated"] == 5, "Gelöschtes Skript nicht vergessen"
+    print("[OK] Validierungs-Cache")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+# Test 6: Rückübersetzung, API-Aliase und ganze Projekte auf einmal
+try:
+    # Jeder eingetragene Alias zeigt auf vorhandene Funktionen (deutsch und englisch)
+    for german_name, english_name in API_FUNCTION_ALIASES.items():
+        assert callable(getattr(api, german_name, None)), f"api.{german_name} fehlt"
+        assert callable(getattr(api, english_name, None)), f"api.{english_name} fehlt"
+    for german_name, english_name in GAMEOBJECT_METHOD_ALIASES.items():
+        assert callable(getattr(GameObject, german_name, None)), f"GameObject.{german_name} fehlt"
+        assert callable(getattr(GameObject, english_name, None)), f"GameObject.{english_name} fehlt"
+    assert GERMAN_API_TO_ENGLISH["hole_objekt"] == "get_object", "API-Alias nicht übernommen"
+    assert GERMAN_API_TO_ENGLISH["zerstöre"] == "destroy", "GameObject-Alias nicht übernommen"
+    python_code = 'if spieler.x > 0:  # if\n    spieler.destroy()\n    print(f"{a or b}", "if")'
+    german, success, _ = translate_code_reverse(python_code, "deutsch")
+    assert success and german == \
+        'wenn spieler.x > 0:  # if\n    spieler.zerstöre()\n    print(f"{a oder b}", "if")', \
+        f"Rückübersetzung falsch: {german!r}"
+    assert translate_code(german)[0] == python_code, "Hin- und Rückübersetzung nicht gleich"
+    _, success, error = translate_code_reverse("f = lambda x: x", "deutsch")
+    assert not success and "lambda" in error, "Nicht übersetzbares Schlüsselwort nicht gemeldet"
+    sources = {"game.py": "wenn x: gib_zurück wahr", "spieler": "zerstöre()"}
+    results = get_translator().translate_many(sources, "deutsch", "englisch")
+    assert results == {"game.py": ("if x: return True", True, ""), "spieler": ("destroy()", True, "")}, \
+        f"translate_many falsch: {results}"
+    print("[OK] Rückübersetzung und translate_many")
+except AssertionError as e:
+    print(f"[FEHLER] {e}")
+    sys.exit(1)
+
+print("\n" + "=" * 60)
+print("ALLE TESTS BESTANDEN")
+print("=" * 60)